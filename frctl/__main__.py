@@ -1,20 +1,37 @@
 """Main entry point for the frctl CLI."""
 import click
+import json
 import os
+import shutil
 from pathlib import Path
 
+from frctl.config import ConfigurationError, get_config
 from frctl.graph import FederatedGraph, Node, NodeType, Edge, EdgeType
 from frctl.graph.dag import generate_purl
 from frctl.planning.engine import PlanningEngine
+from frctl.planning.persistence import PlanStore
 from frctl.llm.provider import get_provider
 
 
 @click.group()
-def cli():
+@click.option(
+    "--frctl-home",
+    type=click.Path(file_okay=False, path_type=Path),
+    envvar="FRCTL_HOME",
+    default=None,
+    help="Directory holding graph and plan state (defaults to ./.frctl)",
+)
+def cli(frctl_home: Path):
     """frctl - Fractal project management tool"""
     pass
 
 
+def _frctl_home() -> Path:
+    """Resolve the .frctl state directory for the current invocation."""
+    ctx = click.get_current_context()
+    return ctx.find_root().params.get("frctl_home") or Path(".frctl")
+
+
 @cli.group()
 def graph():
     """Manage the architectural graph"""
@@ -30,8 +47,8 @@ def plan():
 @graph.command("init")
 def graph_init():
     """Initialize an empty graph"""
-    frctl_dir = Path(".frctl")
-    frctl_dir.mkdir(exist_ok=True)
+    frctl_dir = _frctl_home()
+    frctl_dir.mkdir(parents=True, exist_ok=True)
     
     graph_path = frctl_dir / "graph.json"
     
@@ -48,7 +65,7 @@ def graph_init():
 @graph.command("show")
 def graph_show():
     """Display graph structure"""
-    graph_path = Path(".frctl/graph.json")
+    graph_path = _frctl_home() / "graph.json"
     
     if not graph_path.exists():
         click.echo("No graph found. Run 'frctl graph init' first.")
@@ -79,7 +96,7 @@ def graph_show():
 @click.argument("name")
 def graph_add_node(node_type: str, name: str):
     """Add a node to the graph"""
-    graph_path = Path(".frctl/graph.json")
+    graph_path = _frctl_home() / "graph.json"
     
     if not graph_path.exists():
         click.echo("No graph found. Run 'frctl graph init' first.")
@@ -119,7 +136,7 @@ def graph_add_node(node_type: str, name: str):
 @click.option("--type", "edge_type", default="DEPENDS_ON", help="Edge type")
 def graph_add_edge(source: str, target: str, edge_type: str):
     """Add an edge between nodes"""
-    graph_path = Path(".frctl/graph.json")
+    graph_path = _frctl_home() / "graph.json"
     
     if not graph_path.exists():
         click.echo("No graph found. Run 'frctl graph init' first.")
@@ -148,7 +165,7 @@ def graph_add_edge(source: str, target: str, edge_type: str):
 @click.argument("node_id")
 def graph_remove_node(node_id: str):
     """Remove a node from the graph"""
-    graph_path = Path(".frctl/graph.json")
+    graph_path = _frctl_home() / "graph.json"
     
     if not graph_path.exists():
         click.echo("No graph found. Run 'frctl graph init' first.")
@@ -169,7 +186,7 @@ def graph_remove_node(node_id: str):
 @click.argument("target")
 def graph_remove_edge(source: str, target: str):
     """Remove an edge from the graph"""
-    graph_path = Path(".frctl/graph.json")
+    graph_path = _frctl_home() / "graph.json"
     
     if not graph_path.exists():
         click.echo("No graph found. Run 'frctl graph init' first.")
@@ -185,7 +202,7 @@ def graph_remove_edge(source: str, target: str):
 @graph.command("validate")
 def graph_validate():
     """Validate graph integrity"""
-    graph_path = Path(".frctl/graph.json")
+    graph_path = _frctl_home() / "graph.json"
     
     if not graph_path.exists():
         click.echo("No graph found. Run 'frctl graph init' first.")
@@ -207,7 +224,7 @@ def graph_validate():
 @click.argument("output", type=click.Path(), required=False)
 def graph_export(output: str):
     """Export graph as JSON"""
-    graph_path = Path(".frctl/graph.json")
+    graph_path = _frctl_home() / "graph.json"
     
     if not graph_path.exists():
         click.echo("No graph found. Run 'frctl graph init' first.")
@@ -219,14 +236,13 @@ def graph_export(output: str):
         g.save(Path(output))
         click.echo(f"✓ Exported graph to {output}")
     else:
-        import json
         click.echo(json.dumps(g.to_dict(), indent=2))
 
 
 @graph.command("stats")
 def graph_stats():
     """Show graph statistics"""
-    graph_path = Path(".frctl/graph.json")
+    graph_path = _frctl_home() / "graph.json"
     
     if not graph_path.exists():
         click.echo("No graph found. Run 'frctl graph init' first.")
@@ -267,13 +283,16 @@ def plan_init(description: str, model: str):
         llm = get_provider(model=model)
         
         # Create planning engine
-        engine = PlanningEngine(llm_provider=llm)
+        plans_dir = _frctl_home() / "plans"
+        engine = PlanningEngine(
+            llm_provider=llm,
+            plan_store=PlanStore(base_path=plans_dir),
+        )
         
         # Run planning
         plan_obj = engine.run(description)
         
         # Save plan (basic implementation)
-        plans_dir = Path(".frctl/plans")
         plans_dir.mkdir(parents=True, exist_ok=True)
         
         plan_path = plans_dir / f"{plan_obj.id}.json"
@@ -306,9 +325,7 @@ def plan_init(description: str, model: str):
 @click.option("--status", type=click.Choice(["in_progress", "complete", "failed"]), help="Filter by status")
 def plan_list(status: str):
     """List all planning sessions"""
-    from frctl.planning.persistence import PlanStore
-    
-    store = PlanStore()
+    store = PlanStore(base_path=_frctl_home() / "plans")
     plans = store.list_plans(status=status)
     
     if not plans:
@@ -341,13 +358,11 @@ def plan_list(status: str):
 @click.argument("plan_id", required=False)
 def plan_status(plan_id: str):
     """Show planning tree structure"""
-    from frctl.planning.persistence import PlanStore
-    
-    store = PlanStore()
+    store = PlanStore(base_path=_frctl_home() / "plans")
     
     # If no plan_id, try to find most recent
     if not plan_id:
-        plans = store.list_plans(status="in_progress")
+        plans = store.list_plans(status="in_progress", limit=1)
         if not plans:
             click.echo("No in-progress plans found. Use: frctl plan list")
             return
@@ -369,32 +384,35 @@ def plan_status(plan_id: str):
     click.echo()
     
     # Show tree
-    def print_goal_tree(goal, plan, indent=0):
-        """Recursively print goal tree"""
-        prefix = "  " * indent
-        
-        # Status icon
-        status_icon = {
-            "pending": "⏸️",
-            "decomposing": "🔄",
-            "atomic": "✅",
-            "complete": "✅",
-            "failed": "❌",
-        }.get(goal.status.value, "❓")
-        
-        # Print goal
-        click.echo(f"{prefix}{status_icon} {goal.id}")
-        click.echo(f"{prefix}   {goal.description[:60]}...")
-        
-        # Print digest if available
-        if goal.digest:
-            click.echo(f"{prefix}   💭 {goal.digest[:50]}...")
-        
-        # Print children
-        for child_id in goal.child_ids:
-            child = plan.get_goal(child_id)
-            if child:
-                print_goal_tree(child, plan, indent + 1)
+    def print_goal_tree(goal, plan):
+        """Print goal tree depth-first using an explicit stack"""
+        stack = [(goal, 0)]
+        while stack:
+            goal, indent = stack.pop()
+            prefix = "  " * indent
+            
+            # Status icon
+            status_icon = {
+                "pending": "⏸️",
+                "decomposing": "🔄",
+                "atomic": "✅",
+                "complete": "✅",
+                "failed": "❌",
+            }.get(goal.status.value, "❓")
+            
+            # Print goal
+            click.echo(f"{prefix}{status_icon} {goal.id}")
+            click.echo(f"{prefix}   {goal.description[:60]}...")
+            
+            # Print digest if available
+            if goal.digest:
+                click.echo(f"{prefix}   💭 {goal.digest[:50]}...")
+            
+            # Queue children, reversed so they print in order
+            for child_id in reversed(goal.child_ids):
+                child = plan.get_goal(child_id)
+                if child:
+                    stack.append((child, indent + 1))
     
     click.echo("Goal Tree:")
     print_goal_tree(root_goal, plan)
@@ -414,13 +432,11 @@ def plan_status(plan_id: str):
 @click.option("--model", default=None, help="LLM model to use")
 def plan_continue(plan_id: str, model: str):
     """Resume planning session"""
-    from frctl.planning.persistence import PlanStore
-    
-    store = PlanStore()
+    store = PlanStore(base_path=_frctl_home() / "plans")
     
     # If no plan_id, try to find most recent in-progress
     if not plan_id:
-        plans = store.list_plans(status="in_progress")
+        plans = store.list_plans(status="in_progress", limit=1)
         if not plans:
             click.echo("No in-progress plans found.")
             return
@@ -443,11 +459,10 @@ def plan_continue(plan_id: str, model: str):
     
     try:
         # Get LLM provider
-        from frctl.llm.provider import get_provider
         llm = get_provider(model=model)
         
         # Create planning engine and load existing plan
-        engine = PlanningEngine(llm_provider=llm)
+        engine = PlanningEngine(llm_provider=llm, plan_store=store)
         
         # Continue planning (this would need engine.continue_planning method)
         click.echo("⚠️  Plan continuation not yet implemented in engine")
@@ -463,13 +478,11 @@ def plan_continue(plan_id: str, model: str):
 @click.option("--plan-id", help="Plan ID (defaults to most recent)")
 def plan_review(goal_id: str, plan_id: str):
     """Review goal details"""
-    from frctl.planning.persistence import PlanStore
-    
-    store = PlanStore()
+    store = PlanStore(base_path=_frctl_home() / "plans")
     
     # Find plan
     if not plan_id:
-        plans = store.list_plans()
+        plans = store.list_plans(limit=1)
         if not plans:
             click.echo("No plans found.")
             return
@@ -531,10 +544,7 @@ def plan_review(goal_id: str, plan_id: str):
 @click.argument("output", type=click.Path(), required=False)
 def plan_export(plan_id: str, output: str):
     """Export plan as JSON"""
-    from frctl.planning.persistence import PlanStore
-    import json
-    
-    store = PlanStore()
+    store = PlanStore(base_path=_frctl_home() / "plans")
     plan = store.load(plan_id)
     
     if not plan:
@@ -556,9 +566,7 @@ def plan_export(plan_id: str, output: str):
 @click.option("--format", type=click.Choice(["ascii", "mermaid"]), default="ascii", help="Output format")
 def plan_visualize(plan_id: str, format: str):
     """Generate tree visualization"""
-    from frctl.planning.persistence import PlanStore
-    
-    store = PlanStore()
+    store = PlanStore(base_path=_frctl_home() / "plans")
     plan = store.load(plan_id)
     
     if not plan:
@@ -571,22 +579,28 @@ def plan_visualize(plan_id: str, format: str):
         click.echo("graph TD")
         
         def add_node_mermaid(goal, plan):
-            status_style = {
-                "pending": ":::pending",
-                "decomposing": ":::decomposing",
-                "atomic": ":::atomic",
-                "complete": ":::complete",
-                "failed": ":::failed",
-            }.get(goal.status.value, "")
-            
-            label = goal.description[:40].replace('"', "'")
-            click.echo(f'    {goal.id}["{label}"]{status_style}')
-            
-            for child_id in goal.child_ids:
-                child = plan.get_goal(child_id)
-                if child:
-                    click.echo(f'    {goal.id} --> {child_id}')
-                    add_node_mermaid(child, plan)
+            # (goal, parent_id) pairs; the edge is printed just before the child
+            stack = [(goal, None)]
+            while stack:
+                goal, parent_id = stack.pop()
+                if parent_id is not None:
+                    click.echo(f'    {parent_id} --> {goal.id}')
+                
+                status_style = {
+                    "pending": ":::pending",
+                    "decomposing": ":::decomposing",
+                    "atomic": ":::atomic",
+                    "complete": ":::complete",
+                    "failed": ":::failed",
+                }.get(goal.status.value, "")
+                
+                label = goal.description[:40].replace('"', "'")
+                click.echo(f'    {goal.id}["{label}"]{status_style}')
+                
+                for child_id in reversed(goal.child_ids):
+                    child = plan.get_goal(child_id)
+                    if child:
+                        stack.append((child, goal.id))
         
         root = plan.get_goal(plan.root_goal_id)
         add_node_mermaid(root, plan)
@@ -598,15 +612,18 @@ def plan_visualize(plan_id: str, format: str):
         click.echo("```")
     else:
         # ASCII tree
-        def print_ascii_tree(goal, plan, prefix="", is_last=True):
-            connector = "└── " if is_last else "├── "
-            status = goal.status.value[0].upper()
-            click.echo(f"{prefix}{connector}[{status}] {goal.description[:50]}")
-            
-            children = [plan.get_goal(cid) for cid in goal.child_ids if plan.get_goal(cid)]
-            for i, child in enumerate(children):
-                extension = "    " if is_last else "│   "
-                print_ascii_tree(child, plan, prefix + extension, i == len(children) - 1)
+        def print_ascii_tree(goal, plan):
+            stack = [(goal, "", True)]
+            while stack:
+                goal, prefix, is_last = stack.pop()
+                connector = "└── " if is_last else "├── "
+                status = goal.status.value[0].upper()
+                click.echo(f"{prefix}{connector}[{status}] {goal.description[:50]}")
+                
+                children = [c for c in map(plan.get_goal, goal.child_ids) if c]
+                extension = prefix + ("    " if is_last else "│   ")
+                for i in range(len(children) - 1, -1, -1):
+                    stack.append((children[i], extension, i == len(children) - 1))
         
         root = plan.get_goal(plan.root_goal_id)
         click.echo(f"\nPlan: {plan.id}")
@@ -619,9 +636,7 @@ def plan_visualize(plan_id: str, format: str):
 @click.option("--force", is_flag=True, help="Skip confirmation")
 def plan_delete(plan_id: str, archive: bool, force: bool):
     """Delete a plan"""
-    from frctl.planning.persistence import PlanStore
-    
-    store = PlanStore()
+    store = PlanStore(base_path=_frctl_home() / "plans")
     
     # Check if plan exists
     plan = store.load(plan_id)
@@ -672,10 +687,6 @@ def config():
 @click.option("--force", is_flag=True, help="Overwrite existing config")
 def config_init(is_global: bool, force: bool):
     """Initialize configuration file"""
-    from frctl.config import FrctlConfig
-    from pathlib import Path
-    import shutil
-    
     # Determine target path
     if is_global:
         config_path = Path.home() / ".frctl" / "config.toml"
@@ -706,10 +717,6 @@ def config_init(is_global: bool, force: bool):
 @click.option("--all", "show_all", is_flag=True, help="Show all config sources")
 def config_show(show_all: bool):
     """Display current configuration"""
-    from frctl.config import get_config
-    from pathlib import Path
-    import json
-    
     try:
         config = get_config()
         
@@ -760,8 +767,6 @@ def config_show(show_all: bool):
 @config.command("validate")
 def config_validate():
     """Validate configuration"""
-    from frctl.config import get_config, ConfigurationError
-    
     try:
         config = get_config()
         config.validate()
@@ -778,8 +783,6 @@ def config_validate():
 @click.option("--model", help="Override model for test")
 def config_test(model: str):
     """Test LLM provider configuration"""
-    from frctl.llm.provider import get_provider
-    
     try:
         click.echo("🔌 Testing LLM provider connection...\n")
         
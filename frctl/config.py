@@ -6,13 +6,92 @@ Handles loading and validating configuration from:
 3. Environment variables (highest priority)
 """
 
+import copy
+import json
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-try:
-    import tomllib  # Python 3.11+
-except ImportError:
-    import tomli as tomllib  # fallback for older Python
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Parsed TOML per path, keyed on (st_mtime_ns, st_size) to detect edits
+_TOML_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+
+def _load_toml(path: Path) -> Optional[Dict[str, Any]]:
+    """Parse a TOML file, reusing the last parse while the file is unchanged.
+    
+    Each call returns a deep copy of the cached parse, so callers (and the
+    config objects built from it) can mutate the result freely.
+    
+    Args:
+        path: TOML file to read
+        
+    Returns:
+        Parsed data, or None if the file does not exist
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    
+    key = str(path)
+    cached = _TOML_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return copy.deepcopy(cached[2])
+    
+    # Imported on first parse: most config objects never touch a file
+    try:
+        import tomllib  # Python 3.11+
+    except ImportError:
+        import tomli as tomllib  # fallback for older Python
+    
+    with open(path, "rb") as f:
+        data = tomllib.load(f)
+    _TOML_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    return copy.deepcopy(data)
+
+
+_TRUE_VALUES = frozenset(("true", "1", "yes"))
+
+
+def _to_bool(value: str) -> bool:
+    """Interpret an environment variable as a boolean flag.
+    
+    Anything other than true/1/yes (any case) is False, so an unrecognised
+    value disables the flag rather than raising.
+    """
+    return value.lower() in _TRUE_VALUES
+
+
+# Environment variable -> (config section, key, converter)
+_ENV_OVERRIDES = (
+    ("FRCTL_LLM_MODEL", "llm", "model", str),
+    ("FRCTL_LLM_TEMPERATURE", "llm", "temperature", float),
+    ("FRCTL_LLM_MAX_TOKENS", "llm", "max_tokens", int),
+    ("FRCTL_LLM_VERBOSE", "llm", "verbose", _to_bool),
+    ("FRCTL_PLANNING_MAX_DEPTH", "planning", "max_depth", int),
+    ("FRCTL_PLANNING_AUTO_DECOMPOSE", "planning", "auto_decompose", _to_bool),
+)
+
+_API_KEY_VARS = (
+    "OPENAI_API_KEY",
+    "ANTHROPIC_API_KEY",
+    "GEMINI_API_KEY",
+    "COHERE_API_KEY",
+    "TOGETHER_API_KEY",
+)
+
+
+def _toml_value(value: Any) -> str:
+    """Format a config value as a TOML literal."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, str):
+        # JSON string escapes are a subset of TOML basic-string escapes
+        return json.dumps(value)
+    if isinstance(value, list):
+        return "[" + ", ".join(_toml_value(item) for item in value) + "]"
+    return str(value)
 
 
 class ConfigurationError(Exception):
@@ -23,6 +102,8 @@ class ConfigurationError(Exception):
 class LLMConfig:
     """LLM provider configuration."""
     
+    __slots__ = ("model", "temperature", "max_tokens", "num_retries", "fallback_models", "verbose", "api_key")
+    
     def __init__(
         self,
         model: str = "gpt-4",
@@ -84,6 +165,8 @@ class LLMConfig:
 class PlanningConfig:
     """Planning engine configuration."""
     
+    __slots__ = ("max_depth", "auto_decompose", "context_window_size")
+    
     def __init__(
         self,
         max_depth: int = 10,
@@ -127,6 +210,8 @@ class PlanningConfig:
 class FrctlConfig:
     """Main frctl configuration."""
     
+    __slots__ = ("llm", "planning")
+    
     def __init__(
         self,
         llm: Optional[LLMConfig] = None,
@@ -154,20 +239,16 @@ class FrctlConfig:
         config_data: Dict[str, Any] = {"llm": {}, "planning": {}}
         
         # Load user-level config
-        user_config = Path.home() / ".frctl" / "config.toml"
-        if user_config.exists():
-            with open(user_config, "rb") as f:
-                user_data = tomllib.load(f)
-                config_data = cls._merge_config(config_data, user_data)
+        user_data = _load_toml(Path.home() / ".frctl" / "config.toml")
+        if user_data is not None:
+            config_data = cls._merge_config(config_data, user_data)
         
         # Load project-level config
         if project_dir is None:
             project_dir = Path.cwd()
-        project_config = project_dir / ".frctl" / "config.toml"
-        if project_config.exists():
-            with open(project_config, "rb") as f:
-                project_data = tomllib.load(f)
-                config_data = cls._merge_config(config_data, project_data)
+        project_data = _load_toml(project_dir / ".frctl" / "config.toml")
+        if project_data is not None:
+            config_data = cls._merge_config(config_data, project_data)
         
         # Override with environment variables
         config_data = cls._apply_env_overrides(config_data)
@@ -206,40 +287,20 @@ class FrctlConfig:
         - GEMINI_API_KEY: Google Gemini API key
         - (and all other LiteLLM-supported env vars)
         """
-        llm = config.setdefault("llm", {})
+        env = os.environ
+        config.setdefault("llm", {})
+        config.setdefault("planning", {})
         
-        # Model configuration
-        if model := os.getenv("FRCTL_LLM_MODEL"):
-            llm["model"] = model
-        
-        if temp := os.getenv("FRCTL_LLM_TEMPERATURE"):
-            llm["temperature"] = float(temp)
-        
-        if max_tokens := os.getenv("FRCTL_LLM_MAX_TOKENS"):
-            llm["max_tokens"] = int(max_tokens)
-        
-        if verbose := os.getenv("FRCTL_LLM_VERBOSE"):
-            llm["verbose"] = verbose.lower() in ("true", "1", "yes")
+        for name, section, key, convert in _ENV_OVERRIDES:
+            if value := env.get(name):
+                config[section][key] = convert(value)
         
         # API keys (LiteLLM reads these directly, but we track them)
-        # Common provider keys
-        if api_key := (
-            os.getenv("OPENAI_API_KEY") or
-            os.getenv("ANTHROPIC_API_KEY") or
-            os.getenv("GEMINI_API_KEY") or
-            os.getenv("COHERE_API_KEY") or
-            os.getenv("TOGETHER_API_KEY")
-        ):
-            llm["api_key"] = api_key
-        
-        # Planning configuration
-        planning = config.setdefault("planning", {})
-        
-        if max_depth := os.getenv("FRCTL_PLANNING_MAX_DEPTH"):
-            planning["max_depth"] = int(max_depth)
-        
-        if auto := os.getenv("FRCTL_PLANNING_AUTO_DECOMPOSE"):
-            planning["auto_decompose"] = auto.lower() in ("true", "1", "yes")
+        # First common provider key that is set wins
+        for name in _API_KEY_VARS:
+            if api_key := env.get(name):
+                config["llm"]["api_key"] = api_key
+                break
         
         return config
     
@@ -267,25 +328,15 @@ class FrctlConfig:
             "planning": self.planning.to_dict(),
         }
         
-        # Write TOML (simple approach - could use toml library for better formatting)
-        with open(path, "w") as f:
-            f.write("# Frctl Configuration\n\n")
-            
-            f.write("[llm]\n")
-            for key, value in config_dict["llm"].items():
-                if isinstance(value, str):
-                    f.write(f'{key} = "{value}"\n')
-                elif isinstance(value, list):
-                    f.write(f'{key} = {value}\n')
-                else:
-                    f.write(f'{key} = {value}\n')
-            
-            f.write("\n[planning]\n")
-            for key, value in config_dict["planning"].items():
-                if isinstance(value, str):
-                    f.write(f'{key} = "{value}"\n')
-                else:
-                    f.write(f'{key} = {value}\n')
+        # Write TOML: the layout is fixed (two flat tables of scalars and
+        # string lists), so no TOML writer library is needed
+        lines = ["# Frctl Configuration", ""]
+        for section, values in config_dict.items():
+            lines.append(f"[{section}]")
+            lines.extend(f"{key} = {_toml_value(value)}" for key, value in values.items())
+            lines.append("")
+        
+        path.write_text("\n".join(lines))
 
 
 def get_config(project_dir: Optional[Path] = None) -> FrctlConfig:
@@ -7,9 +7,10 @@ The Context Tree manages context isolation and propagation during planning:
 - Token usage is tracked per context to avoid hitting limits
 """
 
-from typing import Dict, List, Optional, Any
+import sys
+from typing import Dict, Optional, Any
 from datetime import datetime, timezone
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class ContextNode(BaseModel):
@@ -50,6 +51,14 @@ class ContextNode(BaseModel):
     # Metadata
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     
+    @field_validator('goal_id', 'parent_goal_id')
+    @classmethod
+    def intern_goal_ids(cls, v: Optional[str]) -> Optional[str]:
+        """Intern goal IDs, which repeat across nodes and dict keys."""
+        if v is None:
+            return v
+        return sys.intern(v)
+    
     def is_over_limit(self) -> bool:
         """Check if token usage exceeds limit."""
         return self.tokens_used > self.token_limit
@@ -90,6 +99,15 @@ class ContextTree:
         self.default_token_limit = default_token_limit
         self.global_context = global_context or {}
         self._nodes: Dict[str, ContextNode] = {}
+        
+        # Running token total, kept in step by update_token_usage; None
+        # (dirty) once a node has been handed out and may be written directly
+        self._total_tokens: Optional[int] = 0
+    
+    def _store_node(self, node: ContextNode) -> None:
+        """Insert or replace a node; callers hand it out, so the total is dirty."""
+        self._nodes[node.goal_id] = node
+        self._total_tokens = None
     
     def create_root_context(self, goal_id: str) -> ContextNode:
         """Create root context for the planning tree.
@@ -103,10 +121,11 @@ class ContextTree:
         node = ContextNode(
             goal_id=goal_id,
             parent_goal_id=None,
-            global_context=self.global_context.copy(),
             token_limit=self.default_token_limit,
         )
-        self._nodes[goal_id] = node
+        # Share the tree's global dict by reference (see set_global_context)
+        node.global_context = self.global_context
+        self._store_node(node)
         return node
     
     def create_child_context(
@@ -129,18 +148,16 @@ class ContextTree:
         if parent_goal_id not in self._nodes:
             raise ValueError(f"Parent context not found: {parent_goal_id}")
         
-        parent_node = self._nodes[parent_goal_id]
-        
         # Create child with hydrated context
         node = ContextNode(
             goal_id=goal_id,
             parent_goal_id=parent_goal_id,
-            global_context=parent_node.global_context.copy(),
             parent_intent=parent_intent,
             token_limit=self.default_token_limit,
         )
+        node.global_context = self.global_context
         
-        self._nodes[goal_id] = node
+        self._store_node(node)
         return node
     
     def hydrate_context(self, goal_id: str) -> Dict[str, Any]:
@@ -175,6 +192,27 @@ class ContextTree:
         
         return hydrated
     
+    def format_global_context(self, goal_id: Optional[str] = None) -> Optional[str]:
+        """Render global context as "key: value" lines for prompts.
+        
+        Args:
+            goal_id: Render this goal's global context, so the text matches
+                its hydrated "global"; the tree's own when omitted
+            
+        Returns:
+            Newline-joined global context, or None if it is empty
+        """
+        if goal_id is None:
+            global_context = self.global_context
+        elif goal_id in self._nodes:
+            global_context = self._nodes[goal_id].global_context
+        else:
+            raise ValueError(f"Context not found: {goal_id}")
+        
+        if not global_context:
+            return None
+        return "\n".join(f"{k}: {v}" for k, v in global_context.items())
+    
     def dehydrate_context(
         self,
         goal_id: str,
@@ -208,7 +246,21 @@ class ContextTree:
         Returns:
             Context node or None if not found
         """
-        return self._nodes.get(goal_id)
+        node = self._nodes.get(goal_id)
+        if node is not None:
+            # The caller may change tokens_used directly
+            self._total_tokens = None
+        return node
+    
+    def remove_context(self, goal_id: str) -> None:
+        """Remove the context node for a goal, if present.
+        
+        Args:
+            goal_id: ID of the goal
+        """
+        node = self._nodes.pop(goal_id, None)
+        if node is not None and self._total_tokens is not None:
+            self._total_tokens -= node.tokens_used
     
     def update_token_usage(self, goal_id: str, tokens: int) -> None:
         """Update token usage for a context.
@@ -221,19 +273,21 @@ class ContextTree:
             raise ValueError(f"Context not found: {goal_id}")
         
         self._nodes[goal_id].add_tokens(tokens)
+        if self._total_tokens is not None:
+            self._total_tokens += tokens
     
     def set_global_context(self, key: str, value: Any) -> None:
         """Set a global context value (propagates to all nodes).
         
+        Nodes created by the tree share its global context dict by
+        reference, so this is a single O(1) update. Writing to a node's
+        global_context is likewise a write to the whole tree.
+        
         Args:
             key: Context key
             value: Context value
         """
         self.global_context[key] = value
-        
-        # Update all existing nodes
-        for node in self._nodes.values():
-            node.global_context[key] = value
     
     def set_local_context(self, goal_id: str, key: str, value: Any) -> None:
         """Set a local context value for a specific goal.
@@ -251,10 +305,21 @@ class ContextTree:
     def get_total_tokens(self) -> int:
         """Get total tokens used across all contexts.
         
+        update_token_usage keeps a running total, so this is O(1) while
+        usage is only recorded through the tree. Handing out a node (via
+        get_context or create_*_context) marks the total dirty, since the
+        caller may then write ``tokens_used`` directly; the next call sums
+        the nodes once and resumes the running total. Direct writes through
+        a node reference kept from before that call are not seen until the
+        tree hands out a node again, so record such usage with
+        update_token_usage.
+        
         Returns:
             Total token count
         """
-        return sum(node.tokens_used for node in self._nodes.values())
+        if self._total_tokens is None:
+            self._total_tokens = sum(node.tokens_used for node in self._nodes.values())
+        return self._total_tokens
     
     def get_tree_stats(self) -> Dict[str, Any]:
         """Get statistics about the context tree.
@@ -271,14 +336,24 @@ class ContextTree:
                 "nodes_over_limit": 0,
             }
         
-        tokens = [node.tokens_used for node in self._nodes.values()]
-        over_limit = sum(1 for node in self._nodes.values() if node.is_over_limit())
+        # Single pass over the nodes for the per-node aggregates
+        total_tokens = 0
+        max_tokens = 0
+        over_limit = 0
+        for node in self._nodes.values():
+            used = node.tokens_used
+            total_tokens += used
+            if used > max_tokens:
+                max_tokens = used
+            if used > node.token_limit:
+                over_limit += 1
+        self._total_tokens = total_tokens
         
         return {
             "total_nodes": len(self._nodes),
-            "total_tokens": sum(tokens),
-            "avg_tokens_per_node": sum(tokens) / len(tokens),
-            "max_tokens": max(tokens),
+            "total_tokens": total_tokens,
+            "avg_tokens_per_node": total_tokens / len(self._nodes),
+            "max_tokens": max_tokens,
             "nodes_over_limit": over_limit,
         }
     
@@ -309,11 +384,14 @@ class ContextTree:
         """
         tree = cls(
             default_token_limit=data["default_token_limit"],
-            global_context=data["global_context"],
+            # Nodes share this dict, so don't alias the caller's data
+            global_context=dict(data["global_context"]),
         )
         
         # Reconstruct nodes
         for goal_id, node_data in data["nodes"].items():
-            tree._nodes[goal_id] = ContextNode(**node_data)
+            node = ContextNode(**node_data)
+            node.global_context = tree.global_context
+            tree._store_node(node)
         
         return tree
@@ -1,15 +1,27 @@
-"""Federated Graph implementation using NetworkX."""
+"""Federated Graph implementation with incremental topological ordering."""
 
+import copy
+import dataclasses
+import functools
 import hashlib
 import json
+import sys
+from array import array
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
-import networkx as nx
-from pydantic import BaseModel, ConfigDict, Field
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+try:
+    import orjson  # optional: faster save/load
+except ImportError:
+    orjson = None
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, computed_field, model_validator
 
-from frctl.graph.node import Node, NodeType
+from frctl.graph.node import _SLOTS, Node, NodeType
 from frctl.graph.edge import Edge, EdgeType
 
+if TYPE_CHECKING:
+    import networkx as nx
+
 
 class CycleDetectedError(Exception):
     """Raised when a cycle would be created in the DAG."""
@@ -21,31 +33,514 @@ class NodeNotFoundError(Exception):
     pass
 
 
+# add_edges inserts edge by edge when the batch is at most this fraction of
+# the node count; larger batches re-rank everything in one Kahn pass
+_INCREMENTAL_BATCH_RATIO = 16
+
+# Serialized fields, in declaration order
+_NODE_FIELDS = tuple(f.name for f in dataclasses.fields(Node))
+_EDGE_FIELDS = tuple(f.name for f in dataclasses.fields(Edge))
+
+
+class _CSRSnapshot(NamedTuple):
+    """Integer-indexed adjacency in compressed sparse row layout.
+    
+    Node ``i`` is ``ids[i]``; its successors are
+    ``succ_indices[succ_indptr[i]:succ_indptr[i + 1]]`` and likewise for
+    predecessors. Nodes are numbered in rank order, so for an acyclic
+    graph the indices are a topological order.
+    """
+    
+    ids: List[str]
+    index: Dict[str, int]
+    succ_indptr: array
+    succ_indices: array
+    pred_indptr: array
+    pred_indices: array
+
+
+def _clone(element: Any) -> Any:
+    """Copy a Node or Edge, deep-copying only its (mutable) metadata."""
+    metadata = element.metadata
+    return dataclasses.replace(element, metadata=copy.deepcopy(metadata) if metadata else {})
+
+
+def _csr(
+    ids: List[str], index: Dict[str, int], adjacency: Dict[str, Set[str]]
+) -> Tuple[array, array]:
+    """Pack an adjacency mapping into CSR ``(indptr, indices)`` arrays."""
+    indptr = array("i", [0])
+    indices = array("i")
+    for node_id in ids:
+        indices.extend(index[other] for other in adjacency[node_id])
+        indptr.append(len(indices))
+    return indptr, indices
+
+
+class _EdgeList(list):
+    """List of edges handed out by ``FederatedGraph.edges``.
+    
+    It is a snapshot of the edge store, but in-place changes are written
+    back: after every mutation the graph is re-indexed from the list, just
+    as if the list had been assigned to ``graph.edges``.
+    """
+    
+    __slots__ = ("_graph",)
+    
+    def __init__(self, graph: "FederatedGraph", edges: Iterable[Edge]):
+        super().__init__(edges)
+        self._graph = graph
+    
+    def __reduce__(self) -> Any:
+        """Pickle and copy as a plain, detached list."""
+        return (list, (list(self),))
+
+
+def _writes_back(name: str) -> Any:
+    """Wrap a mutating list method so it re-indexes the owning graph."""
+    method = getattr(list, name)
+    
+    @functools.wraps(method)
+    def wrapper(self: _EdgeList, *args: Any, **kwargs: Any) -> Any:
+        result = method(self, *args, **kwargs)
+        self._graph._store_edges(self)
+        return result
+    
+    return wrapper
+
+
+for _name in (
+    "append", "extend", "insert", "remove", "pop", "clear", "sort", "reverse",
+    "__setitem__", "__delitem__", "__iadd__", "__imul__",
+):
+    setattr(_EdgeList, _name, _writes_back(_name))
+del _name
+
+
+@dataclasses.dataclass(**_SLOTS)
+class _GraphIndex:
+    """Edge store and derived indexes behind a FederatedGraph.
+    
+    Kept as a plain slotted object rather than as separate pydantic
+    private attributes: every private attribute read on a BaseModel goes
+    through ``BaseModel.__getattr__``, which dominated graph construction.
+    Hot paths fetch the index once and use ordinary attribute access.
+    """
+    
+    # Edges keyed by (source, target); a pair may carry several edge types
+    edges: Dict[Tuple[str, str], List[Edge]] = dataclasses.field(default_factory=dict)
+    succ: Dict[str, Set[str]] = dataclasses.field(default_factory=dict)
+    pred: Dict[str, Set[str]] = dataclasses.field(default_factory=dict)
+    rank: Dict[str, int] = dataclasses.field(default_factory=dict)
+    next_rank: int = 0
+    acyclic: bool = True
+    # Union-find over weakly connected components (path splitting, union by rank)
+    uf_parent: Dict[str, str] = dataclasses.field(default_factory=dict)
+    uf_rank: Dict[str, int] = dataclasses.field(default_factory=dict)
+    # Bumped by every mutation; derived results are cached per version
+    version: int = 0
+    order: Optional[Tuple[int, List[str]]] = None
+    snapshot: Optional[Tuple[int, _CSRSnapshot]] = None
+    # Longest path (in edges) ending at each node, grown on add_edge and
+    # recomputed lazily after removals or rebuilds
+    depth_of: Dict[str, int] = dataclasses.field(default_factory=dict)
+    max_depth: int = 0
+    depth_dirty: bool = False
+    
+    def copy(self) -> "_GraphIndex":
+        """Return an independent copy of the containers."""
+        return _GraphIndex(
+            edges={pair: list(edges) for pair, edges in self.edges.items()},
+            succ={node_id: set(targets) for node_id, targets in self.succ.items()},
+            pred={node_id: set(sources) for node_id, sources in self.pred.items()},
+            rank=dict(self.rank),
+            next_rank=self.next_rank,
+            acyclic=self.acyclic,
+            uf_parent=dict(self.uf_parent),
+            uf_rank=dict(self.uf_rank),
+            # Cached results are immutable and keyed by version, so share them
+            version=self.version,
+            order=self.order,
+            snapshot=self.snapshot,
+            depth_of=dict(self.depth_of),
+            max_depth=self.max_depth,
+            depth_dirty=self.depth_dirty,
+        )
+    
+    def store_edge(self, edge: Edge) -> None:
+        """Record an edge without validation or index maintenance."""
+        self.edges.setdefault((edge.source, edge.target), []).append(edge)
+    
+    def unstore_edge(self, edge: Edge) -> None:
+        """Drop the most recently stored edge of a pair, and the adjacency
+        entry once no edge of that pair is left."""
+        source, target = edge.source, edge.target
+        pair = self.edges[(source, target)]
+        pair.pop()
+        if not pair:
+            del self.edges[(source, target)]
+            self.succ[source].discard(target)
+            self.pred[target].discard(source)
+    
+    def add_node(self, node_id: str) -> None:
+        """Register a new node as an isolated vertex ranked last."""
+        self.succ[node_id] = set()
+        self.pred[node_id] = set()
+        self.rank[node_id] = self.next_rank
+        self.next_rank += 1
+        # A removed node stays in the union-find as an interior link, so a
+        # re-added ID rejoins its old component rather than splitting it
+        if node_id not in self.uf_parent:
+            self.uf_parent[node_id] = node_id
+            self.uf_rank[node_id] = 0
+        self.depth_of[node_id] = 0
+    
+    def rebuild(self, node_ids: Iterable[str]) -> None:
+        """Rebuild adjacency and topological ranks from nodes and edges.
+        
+        Ranks and longest-path depths come from one pass of Kahn's
+        algorithm. If the stored edges contain a cycle, the leftover nodes
+        are ranked in insertion order and the graph is flagged as cyclic.
+        """
+        succ: Dict[str, Set[str]] = {node_id: set() for node_id in node_ids}
+        pred: Dict[str, Set[str]] = {node_id: set() for node_id in succ}
+        for source, target in self.edges:
+            if source in succ and target in succ:
+                succ[source].add(target)
+                pred[target].add(source)
+        
+        in_degree = {node_id: len(pred[node_id]) for node_id in succ}
+        depth_of = dict.fromkeys(succ, 0)
+        ready = [node_id for node_id, degree in in_degree.items() if degree == 0]
+        order: List[str] = []
+        while ready:
+            node_id = ready.pop()
+            order.append(node_id)
+            for target in succ[node_id]:
+                if depth_of[node_id] + 1 > depth_of[target]:
+                    depth_of[target] = depth_of[node_id] + 1
+                in_degree[target] -= 1
+                if in_degree[target] == 0:
+                    ready.append(target)
+        
+        self.acyclic = len(order) == len(succ)
+        if not self.acyclic:
+            placed = set(order)
+            order.extend(node_id for node_id in succ if node_id not in placed)
+        
+        self.succ = succ
+        self.pred = pred
+        self.version += 1
+        self.depth_of = depth_of
+        self.max_depth = max(depth_of.values(), default=0)
+        self.depth_dirty = False
+        self.rank = {node_id: i for i, node_id in enumerate(order)}
+        self.next_rank = len(order)
+        
+        self.uf_parent = {node_id: node_id for node_id in succ}
+        self.uf_rank = dict.fromkeys(succ, 0)
+        for source, targets in succ.items():
+            for target in targets:
+                self.union(source, target)
+    
+    def rank_order(self) -> List[str]:
+        """Return node IDs sorted by rank, cached per version.
+        
+        Ranks are maintained by every insertion, so for an acyclic graph
+        this is a topological order without running Kahn's algorithm or
+        building the CSR snapshot.
+        """
+        if self.order is None or self.order[0] != self.version:
+            self.order = (self.version, sorted(self.succ, key=self.rank.__getitem__))
+        return self.order[1]
+    
+    def csr_snapshot(self) -> _CSRSnapshot:
+        """Return the CSR snapshot, rebuilding it if the graph changed."""
+        if self.snapshot is None or self.snapshot[0] != self.version:
+            ids = self.rank_order()
+            index = {node_id: i for i, node_id in enumerate(ids)}
+            succ_indptr, succ_indices = _csr(ids, index, self.succ)
+            pred_indptr, pred_indices = _csr(ids, index, self.pred)
+            self.snapshot = (self.version, _CSRSnapshot(
+                ids, index, succ_indptr, succ_indices, pred_indptr, pred_indices
+            ))
+        return self.snapshot[1]
+    
+    def reachable(self, node_id: str, forward: bool) -> List[str]:
+        """Collect nodes reachable from ``node_id`` along one edge direction.
+        
+        Uses the CSR snapshot when it is current. Right after a mutation the
+        search walks the adjacency sets instead, so a single query costs
+        O(reached) rather than a full snapshot rebuild.
+        
+        Args:
+            node_id: Node to start from
+            forward: Follow successors if True, predecessors otherwise
+            
+        Returns:
+            Reached node IDs (excluding ``node_id``) in rank order
+        """
+        if self.snapshot is None or self.snapshot[0] != self.version:
+            adjacency = self.succ if forward else self.pred
+            seen = {node_id}
+            queue = deque([node_id])
+            while queue:
+                for other in adjacency[queue.popleft()]:
+                    if other not in seen:
+                        seen.add(other)
+                        queue.append(other)
+            seen.discard(node_id)
+            return sorted(seen, key=self.rank.__getitem__)
+        
+        snapshot = self.snapshot[1]
+        if forward:
+            indptr, indices = snapshot.succ_indptr, snapshot.succ_indices
+        else:
+            indptr, indices = snapshot.pred_indptr, snapshot.pred_indices
+        start = snapshot.index[node_id]
+        visited = bytearray(len(snapshot.ids))
+        visited[start] = 1
+        # The BFS queue doubles as the result list: iterating a list while
+        # appending to it visits the new items too, with no index bookkeeping
+        reached = [start]
+        append = reached.append
+        for i in reached:
+            for j in indices[indptr[i]:indptr[i + 1]]:
+                if not visited[j]:
+                    visited[j] = 1
+                    append(j)
+        
+        # Indices are rank-ordered, so sorting them yields dependency order
+        # in O(k log k) for k reached nodes rather than a scan of every node
+        ids = snapshot.ids
+        return [ids[i] for i in sorted(reached[1:])]
+    
+    def find(self, node_id: str) -> str:
+        """Return the component representative of a node."""
+        parent = self.uf_parent
+        while parent[node_id] != node_id:
+            parent[node_id] = parent[parent[node_id]]
+            node_id = parent[node_id]
+        return node_id
+    
+    def union(self, a: str, b: str) -> None:
+        """Merge the components containing two nodes."""
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return
+        uf_rank = self.uf_rank
+        if uf_rank[root_a] < uf_rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self.uf_parent[root_b] = root_a
+        if uf_rank[root_a] == uf_rank[root_b]:
+            uf_rank[root_a] += 1
+    
+    def grow_depth(self, source: str, target: str) -> None:
+        """Propagate longest-path depths after adding ``source -> target``.
+        
+        Only nodes whose depth actually increases are visited.
+        """
+        depth_of = self.depth_of
+        succ = self.succ
+        max_depth = self.max_depth
+        queue = deque([(target, depth_of[source] + 1)])
+        while queue:
+            node_id, depth = queue.popleft()
+            if depth <= depth_of[node_id]:
+                continue
+            depth_of[node_id] = depth
+            if depth > max_depth:
+                max_depth = depth
+            for succ_id in succ[node_id]:
+                queue.append((succ_id, depth + 1))
+        self.max_depth = max_depth
+    
+    def reorder_for_edge(self, source: str, target: str) -> bool:
+        """Update ranks so that source precedes target (Pearce-Kelly).
+        
+        Args:
+            source: Source node ID of the new edge
+            target: Target node ID of the new edge
+            
+        Returns:
+            False if the edge would close a cycle, True otherwise
+        """
+        rank = self.rank
+        upper = rank[source]
+        lower = rank[target]
+        if source == target:
+            return False
+        if upper < lower:
+            return True
+        
+        # No path can lead back from target to source across components
+        may_close_cycle = self.find(source) == self.find(target)
+        
+        # Forward search from target within the affected region
+        forward: List[str] = []
+        seen = {target}
+        stack = [target]
+        while stack:
+            node_id = stack.pop()
+            forward.append(node_id)
+            for succ_id in self.succ[node_id]:
+                if succ_id == source and may_close_cycle:
+                    return False
+                if succ_id not in seen and rank[succ_id] < upper:
+                    seen.add(succ_id)
+                    stack.append(succ_id)
+        
+        # Backward search from source within the affected region
+        backward: List[str] = []
+        seen = {source}
+        stack = [source]
+        while stack:
+            node_id = stack.pop()
+            backward.append(node_id)
+            for pred_id in self.pred[node_id]:
+                if pred_id not in seen and rank[pred_id] > lower:
+                    seen.add(pred_id)
+                    stack.append(pred_id)
+        
+        # Reassign the pooled ranks: everything reaching source, then
+        # everything reachable from target, each in its existing order
+        backward.sort(key=rank.__getitem__)
+        forward.sort(key=rank.__getitem__)
+        affected = backward + forward
+        for node_id, new_rank in zip(affected, sorted(rank[n] for n in affected)):
+            rank[node_id] = new_rank
+        return True
+    
+    def recompute_depth(self) -> None:
+        """Recompute longest-path depths from an acyclic snapshot."""
+        # Snapshot indices are topological, so one pass relaxes every path
+        snapshot = self.csr_snapshot()
+        indptr, indices = snapshot.pred_indptr, snapshot.pred_indices
+        longest = array("i", [0]) * len(snapshot.ids)
+        for i in range(len(snapshot.ids)):
+            for j in indices[indptr[i]:indptr[i + 1]]:
+                if longest[j] + 1 > longest[i]:
+                    longest[i] = longest[j] + 1
+        self.depth_of = dict(zip(snapshot.ids, longest))
+        self.max_depth = max(longest, default=0)
+        self.depth_dirty = False
+
+
 class FederatedGraph(BaseModel):
     """A Directed Acyclic Graph representing software architecture.
     
     The Federated Graph is the core data structure in Fractal V3,
     replacing file-centric representations with a topological model
     that enforces strict dependency management.
+    
+    Edges are stored per (source, target) pair, with successor/predecessor
+    indexes and a topological rank per node kept alongside; mutate the
+    graph through its methods so they stay in sync.
     """
     
     model_config = ConfigDict(arbitrary_types_allowed=True)
     
     nodes: Dict[str, Node] = Field(default_factory=dict, description="Nodes indexed by ID")
-    edges: List[Edge] = Field(default_factory=list, description="List of edges")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Graph-level metadata")
     
-    def _get_nx_graph(self) -> nx.DiGraph:
-        """Build NetworkX graph from current state."""
+    # Edge store and derived indexes (rebuilt from nodes/edges, maintained incrementally)
+    _index: _GraphIndex = PrivateAttr(default_factory=_GraphIndex)
+    
+    @model_validator(mode="wrap")
+    @classmethod
+    def _load_edges(cls, data: Any, handler: Any) -> "FederatedGraph":
+        """Accept ``edges`` as constructor/validation input.
+        
+        Edges live in the private index rather than in a model field, so
+        they are taken out of the input, the model is validated without
+        them, and they are then stored and indexed.
+        """
+        edges = None
+        if isinstance(data, dict) and "edges" in data:
+            data = dict(data)
+            edges = data.pop("edges")
+        graph = handler(data)
+        if edges:
+            graph._store_edges(edges)
+        return graph
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Build derived indexes for graphs constructed with data."""
+        self._index.rebuild(self.nodes)
+    
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def edges(self) -> List[Edge]:
+        """All edges, in insertion order of their (source, target) pair.
+        
+        Assigning a list, or changing the returned list in place, replaces
+        the edge store and rebuilds the indexes without cycle checks; use
+        add_edge/remove_edge for validated updates.
+        """
+        return _EdgeList(self, (edge for pair in self._index.edges.values() for edge in pair))
+    
+    @edges.setter
+    def edges(self, edges: Iterable[Any]) -> None:
+        self._store_edges(edges)
+    
+    def _store_edges(self, edges: Iterable[Any]) -> None:
+        """Replace the edge store with ``edges`` (Edge objects or dicts)
+        and rebuild the indexes, without cycle checks."""
+        index = _GraphIndex()
+        for edge in edges:
+            index.store_edge(edge if isinstance(edge, Edge) else Edge(**edge))
+        index.rebuild(self.nodes)
+        self._index = index
+    
+    def __copy__(self) -> "FederatedGraph":
+        """Shallow copy that still gets its own edge store and indexes."""
+        copied = super().__copy__()
+        copied._index = self._index.copy()
+        return copied
+    
+    def model_copy(
+        self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False
+    ) -> "FederatedGraph":
+        """Copy the graph, re-indexing if ``update`` replaces nodes or edges.
+        
+        Args:
+            update: Field values to replace in the copy; may include ``edges``
+            deep: Deep-copy nodes, metadata and edges as well
+            
+        Returns:
+            New FederatedGraph
+        """
+        update = dict(update or {})
+        edges = update.pop("edges", None)
+        copied = super().model_copy(update=update, deep=deep)
+        if edges is not None:
+            copied._store_edges(edges)
+        elif "nodes" in update:
+            copied._index.rebuild(copied.nodes)
+        return copied
+    
+    def to_networkx(self) -> "nx.DiGraph":
+        """Export the graph as a NetworkX ``DiGraph``.
+        
+        Node and edge fields become attributes, so NetworkX algorithms
+        can be run on the result without frctl reimplementing them.
+        
+        Returns:
+            A new DiGraph; later changes to either graph are not shared
+        """
+        # Imported here: networkx takes ~0.1s to import and nothing else needs it
+        import networkx as nx
+        
         G = nx.DiGraph()
         
         # Add all nodes
         for node_id, node in self.nodes.items():
-            G.add_node(node_id, **node.model_dump())
+            G.add_node(node_id, **dataclasses.asdict(node))
         
         # Add all edges
         for edge in self.edges:
-            G.add_edge(edge.source, edge.target, **edge.model_dump())
+            G.add_edge(edge.source, edge.target, **dataclasses.asdict(edge))
         
         return G
     
@@ -62,10 +557,18 @@ class FederatedGraph(BaseModel):
             raise ValueError(f"Node with ID '{node.id}' already exists")
         
         self.nodes[node.id] = node
+        index = self._index
+        index.add_node(node.id)
+        index.version += 1
     
     def add_edge(self, edge: Edge) -> None:
         """Add an edge to the graph.
         
+        Cycle detection uses Pearce-Kelly online topological ordering: an
+        edge that already agrees with the current ranks is accepted in O(1);
+        otherwise only the nodes ranked between target and source are
+        searched and re-ranked.
+        
         Args:
             edge: The edge to add
             
@@ -73,24 +576,99 @@ class FederatedGraph(BaseModel):
             NodeNotFoundError: If source or target node doesn't exist
             CycleDetectedError: If adding this edge would create a cycle
         """
-        # Validate nodes exist
-        if edge.source not in self.nodes:
-            raise NodeNotFoundError(f"Source node '{edge.source}' not found")
-        if edge.target not in self.nodes:
-            raise NodeNotFoundError(f"Target node '{edge.target}' not found")
+        source, target = edge.source, edge.target
         
-        # Check for cycles
-        temp_edges = self.edges + [edge]
-        G = nx.DiGraph()
-        for e in temp_edges:
-            G.add_edge(e.source, e.target)
+        # Validate nodes exist
+        if source not in self.nodes:
+            raise NodeNotFoundError(f"Source node '{source}' not found")
+        if target not in self.nodes:
+            raise NodeNotFoundError(f"Target node '{target}' not found")
         
-        if not nx.is_directed_acyclic_graph(G):
+        index = self._index
+        if not index.acyclic or not index.reorder_for_edge(source, target):
             raise CycleDetectedError(
-                f"Adding edge {edge.source} -> {edge.target} would create a cycle"
+                f"Adding edge {source} -> {target} would create a cycle"
             )
         
-        self.edges.append(edge)
+        index.store_edge(edge)
+        index.succ[source].add(target)
+        index.pred[target].add(source)
+        index.union(source, target)
+        index.version += 1
+        if not index.depth_dirty:
+            index.grow_depth(source, target)
+    
+    def add_nodes(self, nodes: Iterable[Node]) -> None:
+        """Add several nodes at once.
+        
+        The batch is checked for duplicate IDs up front, so either every
+        node is added or none is.
+        
+        Args:
+            nodes: The nodes to add
+            
+        Raises:
+            ValueError: If an ID already exists or repeats within the batch
+        """
+        batch = {}
+        for node in nodes:
+            if node.id in self.nodes or node.id in batch:
+                raise ValueError(f"Node with ID '{node.id}' already exists")
+            batch[node.id] = node
+        
+        self.nodes.update(batch)
+        index = self._index
+        for node_id in batch:
+            index.add_node(node_id)
+        index.version += 1
+    
+    def add_edges(self, edges: Iterable[Edge]) -> None:
+        """Add several edges at once with a single cycle check.
+        
+        A batch that is small next to the graph is inserted edge by edge,
+        since each Pearce-Kelly check only touches the affected region.
+        Otherwise all edges are inserted first and the whole graph is
+        re-ranked with one Kahn pass. Either every edge is added or none is.
+        
+        Args:
+            edges: The edges to add
+            
+        Raises:
+            NodeNotFoundError: If a source or target node doesn't exist
+            CycleDetectedError: If the batch would create a cycle
+        """
+        batch = list(edges)
+        for edge in batch:
+            if edge.source not in self.nodes:
+                raise NodeNotFoundError(f"Source node '{edge.source}' not found")
+            if edge.target not in self.nodes:
+                raise NodeNotFoundError(f"Target node '{edge.target}' not found")
+        index = self._index
+        if not index.acyclic:
+            raise CycleDetectedError("Graph contains cycles")
+        
+        if len(batch) * _INCREMENTAL_BATCH_RATIO <= len(self.nodes):
+            for count, edge in enumerate(batch):
+                try:
+                    self.add_edge(edge)
+                except CycleDetectedError:
+                    # Ranks stay a valid order when edges are taken away
+                    for added in reversed(batch[:count]):
+                        index.unstore_edge(added)
+                    index.version += 1
+                    index.depth_dirty = True
+                    raise CycleDetectedError("Adding these edges would create a cycle") from None
+            return
+        
+        for edge in batch:
+            index.store_edge(edge)
+        index.rebuild(self.nodes)
+        
+        if not index.acyclic:
+            for edge in reversed(batch):
+                index.unstore_edge(edge)
+            index.rebuild(self.nodes)
+            raise CycleDetectedError("Adding these edges would create a cycle")
     
     def remove_node(self, node_id: str) -> None:
         """Remove a node and all connected edges.
@@ -107,11 +685,25 @@ class FederatedGraph(BaseModel):
         # Remove the node
         del self.nodes[node_id]
         
-        # Remove all edges connected to this node
-        self.edges = [
-            e for e in self.edges
-            if e.source != node_id and e.target != node_id
-        ]
+        # Remove all edges connected to this node via its adjacency
+        index = self._index
+        for target in index.succ.pop(node_id):
+            index.pred[target].discard(node_id)
+            del index.edges[(node_id, target)]
+        for source in index.pred.pop(node_id):
+            if source == node_id:
+                # Self-loop, already dropped with the successors
+                continue
+            index.succ[source].discard(node_id)
+            del index.edges[(source, node_id)]
+        del index.rank[node_id]
+        
+        # Union-find components are kept merged: this only costs the
+        # cross-component shortcut in add_edge, never correctness
+        index.version += 1
+        index.depth_dirty = True
+        if not index.acyclic:
+            index.rebuild(self.nodes)
     
     def remove_edge(self, source: str, target: str) -> None:
         """Remove an edge from the graph.
@@ -120,10 +712,17 @@ class FederatedGraph(BaseModel):
             source: Source node ID
             target: Target node ID
         """
-        self.edges = [
-            e for e in self.edges
-            if not (e.source == source and e.target == target)
-        ]
+        index = self._index
+        index.edges.pop((source, target), None)
+        
+        if source in index.succ:
+            index.succ[source].discard(target)
+        if target in index.pred:
+            index.pred[target].discard(source)
+        index.version += 1
+        index.depth_dirty = True
+        if not index.acyclic:
+            index.rebuild(self.nodes)
     
     def get_node(self, node_id: str) -> Optional[Node]:
         """Get a node by ID.
@@ -146,10 +745,8 @@ class FederatedGraph(BaseModel):
         Returns:
             The edge if found, None otherwise
         """
-        for edge in self.edges:
-            if edge.source == source and edge.target == target:
-                return edge
-        return None
+        pair = self._index.edges.get((source, target))
+        return pair[0] if pair else None
     
     def topological_sort(self) -> List[str]:
         """Return nodes in topological order.
@@ -160,12 +757,11 @@ class FederatedGraph(BaseModel):
         Raises:
             CycleDetectedError: If graph contains cycles
         """
-        G = self._get_nx_graph()
-        
-        if not nx.is_directed_acyclic_graph(G):
+        index = self._index
+        if not index.acyclic:
             raise CycleDetectedError("Graph contains cycles")
         
-        return list(nx.topological_sort(G))
+        return list(index.rank_order())
     
     def get_ancestors(self, node_id: str) -> List[str]:
         """Get all ancestor nodes (transitive dependencies).
@@ -182,12 +778,7 @@ class FederatedGraph(BaseModel):
         if node_id not in self.nodes:
             raise NodeNotFoundError(f"Node '{node_id}' not found")
         
-        G = self._get_nx_graph()
-        ancestors = nx.ancestors(G, node_id)
-        
-        # Return in topological order
-        subgraph = G.subgraph(ancestors)
-        return list(nx.topological_sort(subgraph))
+        return self._index.reachable(node_id, forward=False)
     
     def get_descendants(self, node_id: str) -> List[str]:
         """Get all descendant nodes (transitive dependents).
@@ -204,8 +795,22 @@ class FederatedGraph(BaseModel):
         if node_id not in self.nodes:
             raise NodeNotFoundError(f"Node '{node_id}' not found")
         
-        G = self._get_nx_graph()
-        return list(nx.descendants(G, node_id))
+        return self._index.reachable(node_id, forward=True)
+    
+    def clone(self) -> "FederatedGraph":
+        """Return a structural copy of the graph.
+        
+        Containers and indexes are copied without re-validation or cycle
+        checks; Node and Edge objects are shared with the original. Unlike
+        BaseModel.copy()/model_copy(), no update or deep options are taken.
+        
+        Returns:
+            New FederatedGraph that can be mutated independently
+        """
+        copied = FederatedGraph(metadata=dict(self.metadata))
+        copied.nodes = dict(self.nodes)
+        copied._index = self._index.copy()
+        return copied
     
     def extract_subgraph(self, node_ids: List[str]) -> "FederatedGraph":
         """Extract a subgraph containing only specified nodes.
@@ -225,16 +830,19 @@ class FederatedGraph(BaseModel):
         
         # Create new graph
         subgraph = FederatedGraph()
+        keep = set(node_ids)
         
         # Add nodes
         for node_id in node_ids:
-            subgraph.nodes[node_id] = self.nodes[node_id].model_copy(deep=True)
+            subgraph.nodes[node_id] = _clone(self.nodes[node_id])
         
         # Add edges that connect nodes in the subgraph
-        for edge in self.edges:
-            if edge.source in node_ids and edge.target in node_ids:
-                subgraph.edges.append(edge.model_copy(deep=True))
+        for (source, target), edges in self._index.edges.items():
+            if source in keep and target in keep:
+                for edge in edges:
+                    subgraph._index.store_edge(_clone(edge))
         
+        subgraph._index.rebuild(subgraph.nodes)
         return subgraph
     
     def validate(self) -> List[str]:
@@ -246,16 +854,19 @@ class FederatedGraph(BaseModel):
         errors = []
         
         # Check for cycles
-        G = self._get_nx_graph()
-        if not nx.is_directed_acyclic_graph(G):
+        if not self._index.acyclic:
             errors.append("Graph contains cycles")
         
-        # Check that all edges reference valid nodes
-        for edge in self.edges:
-            if edge.source not in self.nodes:
-                errors.append(f"Edge references non-existent source node: {edge.source}")
-            if edge.target not in self.nodes:
-                errors.append(f"Edge references non-existent target node: {edge.target}")
+        # Check that all edges reference valid nodes, once per (source, target) pair
+        nodes = self.nodes
+        for (source, target), edges in self._index.edges.items():
+            if source in nodes and target in nodes:
+                continue
+            for _ in edges:
+                if source not in nodes:
+                    errors.append(f"Edge references non-existent source node: {source}")
+                if target not in nodes:
+                    errors.append(f"Edge references non-existent target node: {target}")
         
         return errors
     
@@ -265,14 +876,20 @@ class FederatedGraph(BaseModel):
     
     def edge_count(self) -> int:
         """Get the number of edges in the graph."""
-        return len(self.edges)
+        return sum(map(len, self._index.edges.values()))
     
     def depth(self) -> int:
-        """Get the maximum depth of the graph (longest path)."""
-        G = self._get_nx_graph()
-        if G.number_of_nodes() == 0:
-            return 0
-        return nx.dag_longest_path_length(G)
+        """Get the maximum depth of the graph (longest path).
+        
+        Raises:
+            CycleDetectedError: If graph contains cycles
+        """
+        index = self._index
+        if not index.acyclic:
+            raise CycleDetectedError("Graph contains cycles")
+        if index.depth_dirty:
+            index.recompute_depth()
+        return index.max_depth
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert graph to dictionary (DAG-JSON format).
@@ -280,19 +897,31 @@ class FederatedGraph(BaseModel):
         Returns:
             Dictionary with deterministically sorted keys
         """
-        nodes_dict = {}
-        for node_id in sorted(self.nodes.keys()):
-            node_data = self.nodes[node_id].model_dump()
-            # Convert enum to string
-            node_data['type'] = node_data['type']
-            nodes_dict[node_id] = node_data
-        
-        edges_list = []
-        for edge in sorted(self.edges, key=lambda e: (e.source, e.target)):
-            edge_data = edge.model_dump()
-            # Convert enum to string
-            edge_data['edge_type'] = edge_data['edge_type']
-            edges_list.append(edge_data)
+        return self._to_dict(copy_metadata=True)
+    
+    def _to_dict(self, copy_metadata: bool) -> Dict[str, Any]:
+        """Build the DAG-JSON dictionary.
+        
+        Args:
+            copy_metadata: Deep-copy element metadata so the result is
+                independent of the graph; read-only callers can skip it
+        """
+        def record(element: Any, fields: Tuple[str, ...]) -> Dict[str, Any]:
+            data = {name: getattr(element, name) for name in fields}
+            if copy_metadata and data["metadata"]:
+                data["metadata"] = copy.deepcopy(data["metadata"])
+            elif copy_metadata:
+                data["metadata"] = {}
+            return data
+        
+        nodes_dict = {
+            node_id: record(self.nodes[node_id], _NODE_FIELDS)
+            for node_id in sorted(self.nodes)
+        }
+        edges_list = [
+            record(edge, _EDGE_FIELDS)
+            for edge in sorted(self.edges, key=lambda e: (e.source, e.target))
+        ]
         
         return {
             "metadata": dict(sorted(self.metadata.items())),
@@ -314,13 +943,17 @@ class FederatedGraph(BaseModel):
         graph.metadata = data.get("metadata", {})
         
         # Load nodes
-        for node_id, node_data in data.get("nodes", {}).items():
-            graph.nodes[node_id] = Node(**node_data)
+        graph.nodes = {
+            node_id: Node(**node_data)
+            for node_id, node_data in data.get("nodes", {}).items()
+        }
         
         # Load edges
+        index = graph._index
         for edge_data in data.get("edges", []):
-            graph.edges.append(Edge(**edge_data))
+            index.store_edge(Edge(**edge_data))
         
+        index.rebuild(graph.nodes)
         return graph
     
     def merkle_hash(self) -> str:
@@ -329,7 +962,8 @@ class FederatedGraph(BaseModel):
         Returns:
             SHA-256 hash of the deterministic JSON representation
         """
-        json_str = json.dumps(self.to_dict(), sort_keys=True)
+        # Always stdlib json: the hash depends on its exact separators
+        json_str = json.dumps(self._to_dict(copy_metadata=False), sort_keys=True)
         return hashlib.sha256(json_str.encode()).hexdigest()
     
     def save(self, path: Path) -> None:
@@ -339,9 +973,19 @@ class FederatedGraph(BaseModel):
             path: Path to save the graph
         """
         path.parent.mkdir(parents=True, exist_ok=True)
+        data = self._to_dict(copy_metadata=False)
+        
+        # Both branches write the same bytes: UTF-8 without \u escapes,
+        # and non-string metadata keys converted to strings
+        if orjson is not None:
+            path.write_bytes(orjson.dumps(
+                data, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ))
+            return
         
-        with open(path, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2, sort_keys=True)
+        # One write of the fully encoded text: json.dump streams many small
+        # chunks through the pure-Python encoder instead of the C one
+        path.write_text(json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False), encoding="utf-8")
     
     @classmethod
     def load(cls, path: Path) -> "FederatedGraph":
@@ -353,21 +997,29 @@ class FederatedGraph(BaseModel):
         Returns:
             Loaded FederatedGraph instance
         """
-        with open(path, 'r') as f:
+        if orjson is not None:
+            return cls.from_dict(orjson.loads(path.read_bytes()))
+        
+        with open(path, 'r', encoding="utf-8") as f:
             data = json.load(f)
         
         return cls.from_dict(data)
 
 
+@functools.lru_cache(maxsize=4096)
 def generate_purl(name: str) -> str:
     """Generate a PURL (Package URL) identifier for a node.
     
+    Results are memoized, since the same names are resolved repeatedly.
+    
     Args:
         name: Node name
         
     Returns:
         PURL in format: pkg:frctl/<name>@local
     """
-    # Sanitize name for PURL
+    # Sanitize name for PURL. Chained str.replace beats a str.translate
+    # table here: translate maps per character in Python-level lookups and
+    # is several times slower on names of this length.
     safe_name = name.lower().replace(" ", "-").replace("_", "-")
-    return f"pkg:frctl/{safe_name}@local"
+    return sys.intern(f"pkg:frctl/{safe_name}@local")
@@ -1,8 +1,11 @@
 """Edge class for graph relationships."""
 
+import sys
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, Optional
-from pydantic import BaseModel, Field, field_validator
+
+from frctl.graph.node import _SLOTS, _non_empty, _validation_error
 
 
 class EdgeType(str, Enum):
@@ -14,39 +17,45 @@ class EdgeType(str, Enum):
     IMPLEMENTS = "IMPLEMENTS"
 
 
-class Edge(BaseModel):
+# Display strings by member; a dict lookup is cheaper than Enum.value
+_TYPE_DISPLAY = {edge_type: edge_type.value for edge_type in EdgeType}
+
+
+@dataclass(**_SLOTS)
+class Edge:
     """An edge representing a relationship between nodes.
     
     Edges are directed and typed, representing semantic relationships
     like dependencies, ownership, or interface implementation.
-    """
     
-    source: str = Field(..., description="Source node ID")
-    target: str = Field(..., description="Target node ID")
-    edge_type: EdgeType = Field(..., description="Type of relationship")
-    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
-    contract: Optional[str] = Field(None, description="Path to TypeSpec contract file")
+    Attributes:
+        source: Source node ID
+        target: Target node ID
+        edge_type: Type of relationship
+        metadata: Additional metadata
+        contract: Path to TypeSpec contract file
+    """
     
-    @field_validator('source', 'target')
-    @classmethod
-    def validate_node_ids(cls, v: str) -> str:
-        """Validate that node IDs are not empty."""
-        if not v or not v.strip():
-            raise ValueError("Node ID cannot be empty")
-        return v.strip()
+    source: str
+    target: str
+    edge_type: EdgeType
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    contract: Optional[str] = None
     
-    @field_validator('contract')
-    @classmethod
-    def validate_contract(cls, v: Optional[str]) -> Optional[str]:
-        """Validate contract path if provided."""
-        if v is not None:
-            v = v.strip()
-            if not v:
-                return None
-        return v
+    def __post_init__(self) -> None:
+        """Validate and normalize fields once at construction."""
+        self.source = sys.intern(_non_empty("Edge", "source", self.source, "Node ID cannot be empty"))
+        self.target = sys.intern(_non_empty("Edge", "target", self.target, "Node ID cannot be empty"))
+        if not isinstance(self.edge_type, EdgeType):
+            try:
+                self.edge_type = EdgeType(self.edge_type)
+            except ValueError as e:
+                raise _validation_error("Edge", "edge_type", self.edge_type, str(e)) from None
+        if self.contract is not None:
+            self.contract = self.contract.strip() or None
     
     def __str__(self) -> str:
-        return f"{self.source} --[{self.edge_type.value}]--> {self.target}"
+        return f"{self.source} --[{_TYPE_DISPLAY[self.edge_type]}]--> {self.target}"
     
     def __repr__(self) -> str:
-        return f"Edge(source='{self.source}', target='{self.target}', type={self.edge_type.value})"
+        return f"Edge(source='{self.source}', target='{self.target}', type={_TYPE_DISPLAY[self.edge_type]})"
@@ -1,8 +1,16 @@
 """Node class for graph representation."""
 
+import sys
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, Optional
-from pydantic import BaseModel, Field, field_validator
+from typing import Any, Dict
+
+from pydantic_core import ValidationError
+
+
+# dataclass(slots=True) needs Python 3.10; older interpreters get plain
+# dataclasses with a per-instance __dict__ but identical behaviour
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class NodeType(str, Enum):
@@ -15,36 +23,63 @@ class NodeType(str, Enum):
     COMPONENT = "Component"
 
 
-class Node(BaseModel):
+# Display strings by member; a dict lookup is cheaper than Enum.value
+_TYPE_DISPLAY = {node_type: node_type.value for node_type in NodeType}
+
+
+def _validation_error(title: str, loc: str, value: Any, message: str) -> ValidationError:
+    """Build a Pydantic ``ValidationError`` for a single invalid field.
+    
+    Graph elements are plain dataclasses but keep raising the same error
+    type as the Pydantic models used elsewhere in frctl.
+    """
+    return ValidationError.from_exception_data(title, [{
+        "type": "value_error",
+        "loc": (loc,),
+        "input": value,
+        "ctx": {"error": ValueError(message)},
+    }])
+
+
+def _non_empty(title: str, loc: str, value: Any, message: str) -> str:
+    """Return ``value`` stripped, raising if it is not a non-blank string."""
+    if not isinstance(value, str) or not value.strip():
+        raise _validation_error(title, loc, value, message)
+    return value.strip()
+
+
+@dataclass(**_SLOTS)
+class Node:
     """A node in the architectural graph.
     
     Represents a semantic component in the software architecture.
     Each node has a unique identifier, type, name, and optional metadata.
+    
+    Attributes:
+        id: Unique identifier (PURL format)
+        type: Type of the node
+        name: Human-readable name
+        metadata: Additional metadata
     """
     
-    id: str = Field(..., description="Unique identifier (PURL format)")
-    type: NodeType = Field(..., description="Type of the node")
-    name: str = Field(..., description="Human-readable name")
-    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
-    
-    @field_validator('name')
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        """Validate that name is not empty."""
-        if not v or not v.strip():
-            raise ValueError("Node name cannot be empty")
-        return v.strip()
-    
-    @field_validator('id')
-    @classmethod
-    def validate_id(cls, v: str) -> str:
-        """Validate that id is not empty."""
-        if not v or not v.strip():
-            raise ValueError("Node id cannot be empty")
-        return v.strip()
+    id: str
+    type: NodeType
+    name: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    def __post_init__(self) -> None:
+        """Validate and normalize fields once at construction."""
+        # IDs are interned: they are repeated as keys across graph indexes
+        self.id = sys.intern(_non_empty("Node", "id", self.id, "Node id cannot be empty"))
+        self.name = _non_empty("Node", "name", self.name, "Node name cannot be empty")
+        if not isinstance(self.type, NodeType):
+            try:
+                self.type = NodeType(self.type)
+            except ValueError as e:
+                raise _validation_error("Node", "type", self.type, str(e)) from None
     
     def __str__(self) -> str:
-        return f"{self.type.value}:{self.name}"
+        return f"{_TYPE_DISPLAY[self.type]}:{self.name}"
     
     def __repr__(self) -> str:
-        return f"Node(id='{self.id}', type={self.type.value}, name='{self.name}')"
+        return f"Node(id='{self.id}', type={_TYPE_DISPLAY[self.type]}, name='{self.name}')"
@@ -1,9 +1,25 @@
 """LLM provider using LiteLLM for unified interface to 100+ providers."""
 
+import hashlib
 import os
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 import litellm
-from litellm import completion, completion_cost
+from litellm import acompletion, completion, completion_cost
+
+
+# Token counts each provider remembers (least recently used are dropped)
+_TOKEN_COUNT_CACHE_SIZE = 1024
+
+
+def _count_tokens(model: str, text: str) -> int:
+    """Tokenize text for a model."""
+    try:
+        return litellm.token_counter(model=model, text=text)
+    except Exception:
+        # Fallback to rough estimate if model not supported
+        # ~4 characters per token is a common heuristic
+        return len(text) // 4
 
 
 class LLMProvider:
@@ -55,6 +71,10 @@ class LLMProvider:
         self.total_tokens = 0
         self.total_cost = 0.0
         self.call_count = 0
+        
+        # Memoized token counts keyed on (model, digest of text), so the
+        # cache does not keep whole prompts alive
+        self._token_counts: "OrderedDict[Tuple[str, bytes], int]" = OrderedDict()
     
     def generate(
         self,
@@ -73,7 +93,54 @@ class LLMProvider:
         Raises:
             Exception: If all retry attempts fail
         """
-        # Merge kwargs with defaults
+        params = self._completion_params(messages, kwargs)
+        
+        try:
+            # Call LiteLLM (handles retries, fallbacks, etc.)
+            response = completion(**params)
+            return self._record_response(response)
+            
+        except Exception as e:
+            # Log error and re-raise
+            print(f"LLM generation failed: {e}")
+            raise
+    
+    async def agenerate(
+        self,
+        messages: List[Dict[str, str]],
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Generate completion from LLM without blocking the event loop.
+        
+        Same parameters, result and errors as generate(), but awaits
+        litellm.acompletion() so several calls can be in flight at once.
+        
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            **kwargs: Additional parameters for litellm.acompletion()
+            
+        Returns:
+            Response dict with 'content', 'model', 'usage', 'cost'
+            
+        Raises:
+            Exception: If all retry attempts fail
+        """
+        params = self._completion_params(messages, kwargs)
+        
+        try:
+            response = await acompletion(**params)
+            return self._record_response(response)
+            
+        except Exception as e:
+            print(f"LLM generation failed: {e}")
+            raise
+    
+    def _completion_params(
+        self,
+        messages: List[Dict[str, str]],
+        kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Merge call kwargs with the provider defaults for LiteLLM."""
         params = {
             "model": self.model,
             "messages": messages,
@@ -86,41 +153,40 @@ class LLMProvider:
         if self.fallback_models:
             params["fallbacks"] = self.fallback_models
         
-        try:
-            # Call LiteLLM (handles retries, fallbacks, etc.)
-            response = completion(**params)
-            
-            # Extract content
-            content = response.choices[0].message.content
-            
-            # Track usage
-            usage = response.usage
-            self.total_tokens += usage.total_tokens
-            self.call_count += 1
-            
-            # Calculate cost
-            cost = completion_cost(response)
-            self.total_cost += cost
-            
-            return {
-                "content": content,
-                "model": response.model,
-                "usage": {
-                    "prompt_tokens": usage.prompt_tokens,
-                    "completion_tokens": usage.completion_tokens,
-                    "total_tokens": usage.total_tokens,
-                },
-                "cost": cost,
-            }
-            
-        except Exception as e:
-            # Log error and re-raise
-            print(f"LLM generation failed: {e}")
-            raise
+        return params
+    
+    def _record_response(self, response: Any) -> Dict[str, Any]:
+        """Track usage and cost of a LiteLLM response and unpack it."""
+        # Extract content
+        content = response.choices[0].message.content
+        
+        # Track usage
+        usage = response.usage
+        self.total_tokens += usage.total_tokens
+        self.call_count += 1
+        
+        # Calculate cost
+        cost = completion_cost(response)
+        self.total_cost += cost
+        
+        return {
+            "content": content,
+            "model": response.model,
+            "usage": {
+                "prompt_tokens": usage.prompt_tokens,
+                "completion_tokens": usage.completion_tokens,
+                "total_tokens": usage.total_tokens,
+            },
+            "cost": cost,
+        }
     
     def count_tokens(self, text: str, model: Optional[str] = None) -> int:
         """Count tokens in text for the specified model.
         
+        The last counts are memoized per provider, keyed on the model and
+        a digest of the text, so re-counting the same summary or prompt
+        skips tokenization.
+        
         Args:
             text: Text to count tokens for
             model: Model to use for counting (defaults to self.model)
@@ -128,13 +194,19 @@ class LLMProvider:
         Returns:
             Number of tokens
         """
-        model_to_use = model or self.model
-        try:
-            return litellm.token_counter(model=model_to_use, text=text)
-        except Exception:
-            # Fallback to rough estimate if model not supported
-            # ~4 characters per token is a common heuristic
-            return len(text) // 4
+        model = model or self.model
+        key = (model, hashlib.blake2b(text.encode(), digest_size=16).digest())
+        counts = self._token_counts
+        count = counts.get(key)
+        if count is not None:
+            counts.move_to_end(key)
+            return count
+        
+        count = _count_tokens(model, text)
+        counts[key] = count
+        if len(counts) > _TOKEN_COUNT_CACHE_SIZE:
+            counts.popitem(last=False)
+        return count
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get usage statistics for this provider.
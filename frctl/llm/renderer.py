@@ -1,8 +1,9 @@
 """Prompt template rendering and management for Fractal V3 planning system."""
 
+import functools
 from pathlib import Path
 from typing import Dict, Any, Optional
-from jinja2 import Environment, FileSystemLoader, Template, TemplateNotFound
+from jinja2 import BaseLoader, Environment, FileSystemLoader, Template, TemplateNotFound
 
 
 class PromptRenderer:
@@ -15,12 +16,18 @@ class PromptRenderer:
     # Template version for cache invalidation
     VERSION = "1.0.0"
     
-    def __init__(self, template_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        template_dir: Optional[Path] = None,
+        loader: Optional[BaseLoader] = None,
+    ):
         """Initialize prompt renderer.
         
         Args:
             template_dir: Directory containing .j2 template files
                          (defaults to frctl/llm/prompts/)
+            loader: Jinja2 loader to use instead of reading template_dir
+                    (e.g. a DictLoader for in-memory templates)
         """
         if template_dir is None:
             # Default to prompts directory relative to this file
@@ -30,7 +37,7 @@ class PromptRenderer:
         
         # Create Jinja2 environment with safe defaults
         self.env = Environment(
-            loader=FileSystemLoader(str(self.template_dir)),
+            loader=loader or FileSystemLoader(str(self.template_dir)),
             autoescape=False,  # We're generating prompts, not HTML
             trim_blocks=True,
             lstrip_blocks=True,
@@ -112,6 +119,27 @@ class PromptRenderer:
             global_context=global_context,
         )
     
+    def render_atomicity_check_batch(
+        self,
+        sibling_goals: list,
+        global_context: Optional[str] = None,
+    ) -> str:
+        """Render a single atomicity check prompt for several sibling goals.
+        
+        Args:
+            sibling_goals: List of goal objects with id, description and
+                optional per-goal parent_intent
+            global_context: Optional project-level context
+            
+        Returns:
+            Rendered prompt for batched atomicity assessment
+        """
+        return self.render(
+            "atomicity_check_batch",
+            sibling_goals=sibling_goals,
+            global_context=global_context,
+        )
+    
     def render_decompose_goal(
         self,
         goal_description: str,
@@ -187,16 +215,39 @@ class PromptRenderer:
             parent_intent=parent_intent,
         )
     
+    @functools.cached_property
+    def templates(self) -> tuple[str, ...]:
+        """Names of available templates, sorted (without .j2 extension).
+        
+        The template directory (or custom loader) is scanned once per renderer.
+        """
+        if not isinstance(self.env.loader, FileSystemLoader):
+            names = self.env.list_templates(extensions=["j2"])
+            return tuple(sorted(name[:-len(".j2")] for name in names))
+        return tuple(sorted(path.stem for path in self.template_dir.glob("*.j2")))
+    
     def list_templates(self) -> list[str]:
         """List all available template names.
         
         Returns:
             List of template names (without .j2 extension)
         """
-        templates = []
-        for path in self.template_dir.glob("*.j2"):
-            templates.append(path.stem)
-        return sorted(templates)
+        return list(self.templates)
+    
+    def preload(self) -> int:
+        """Load and compile every available template into the cache.
+        
+        Later renders then skip the loader's filesystem checks and the
+        Jinja2 compile step on first use.
+        
+        Returns:
+            Number of templates in the cache
+        """
+        for name in self.templates:
+            template_name = f"{name}.j2"
+            if template_name not in self._template_cache:
+                self._template_cache[template_name] = self.env.get_template(template_name)
+        return len(self._template_cache)
     
     def validate_template(self, template_name: str) -> bool:
         """Validate that a template exists and can be loaded.
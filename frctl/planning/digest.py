@@ -1,8 +1,9 @@
 """Digest Protocol for context compression in planning."""
 
-from typing import List, Dict, Optional, Any
+import sys
+from typing import Callable, ClassVar, Dict, Iterable, List, Optional
 from datetime import datetime, timezone
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class DigestMetadata(BaseModel):
@@ -12,7 +13,10 @@ class DigestMetadata(BaseModel):
     digest_tokens: int = Field(..., description="Token count after compression")
     compression_ratio: float = Field(..., description="Compression ratio (0-1)")
     fidelity_estimate: float = Field(..., description="Estimated information preservation (0-1)")
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=lambda: DigestMetadata._clock())
+    
+    # Source of created_at timestamps; tests swap it for a fixed clock.
+    _clock: ClassVar[Callable[[], datetime]] = staticmethod(lambda: datetime.now(timezone.utc))
     version: int = Field(1, description="Digest protocol version")
     
     @property
@@ -52,6 +56,18 @@ class Digest(BaseModel):
     # Metadata
     metadata: DigestMetadata = Field(..., description="Quality and compression metrics")
     
+    @field_validator('goal_id')
+    @classmethod
+    def intern_goal_id(cls, v: str) -> str:
+        """Intern the goal ID, shared with the goal and store keys."""
+        return sys.intern(v)
+    
+    @field_validator('key_artifacts', 'child_digest_ids')
+    @classmethod
+    def intern_references(cls, v: List[str]) -> List[str]:
+        """Intern artifact paths and goal IDs, which recur across digests."""
+        return [sys.intern(item) for item in v]
+    
     def to_context_string(self) -> str:
         """Convert digest to string for context injection.
         
@@ -106,14 +122,27 @@ class DigestStore(BaseModel):
         goal_id = digest.goal_id
         
         # Archive existing digest if present
-        if goal_id in self.digests:
+        previous = self.digests.get(goal_id)
+        if previous is not None:
             if goal_id not in self.archive:
                 self.archive[goal_id] = []
-            self.archive[goal_id].append(self.digests[goal_id])
+            self.archive[goal_id].append(previous)
         
         # Store new digest
         self.digests[goal_id] = digest
     
+    def bulk_load(self, digests: Iterable[Digest]) -> None:
+        """Store many digests at once without archiving.
+        
+        Intended for seeding a store with digests for fresh goals; an
+        existing digest for the same goal is replaced, not archived. Use
+        add() when version history matters.
+        
+        Args:
+            digests: Digests to store
+        """
+        self.digests.update((d.goal_id, d) for d in digests)
+    
     def get(self, goal_id: str) -> Optional[Digest]:
         """Retrieve current digest for a goal.
         
@@ -149,11 +178,8 @@ class DigestStore(BaseModel):
         Returns:
             List of digests (skips missing ones)
         """
-        return [
-            self.digests[gid]
-            for gid in goal_ids
-            if gid in self.digests
-        ]
+        digests = self.digests
+        return [d for d in map(digests.get, goal_ids) if d is not None]
     
     def aggregate_tokens(self, goal_ids: List[str]) -> int:
         """Calculate total tokens for multiple digests.
@@ -165,30 +191,38 @@ class DigestStore(BaseModel):
             Sum of digest tokens
         """
         return sum(
-            self.digests[gid].metadata.digest_tokens
-            for gid in goal_ids
-            if gid in self.digests
+            d.metadata.digest_tokens
+            for d in map(self.digests.get, goal_ids)
+            if d is not None
         )
     
     def get_quality_stats(self) -> Dict[str, float]:
         """Calculate quality statistics across all digests.
         
+        Computed from ``digests`` and ``archive`` on each call, in one pass
+        over the current digests, so direct edits to either are reflected.
+        
         Returns:
             Dictionary with avg compression, avg fidelity, etc.
         """
-        if not self.digests:
+        count = len(self.digests)
+        if not count:
             return {
                 "avg_compression": 0.0,
                 "avg_fidelity": 0.0,
                 "total_digests": 0,
             }
         
-        compressions = [d.metadata.compression_ratio for d in self.digests.values()]
-        fidelities = [d.metadata.fidelity_estimate for d in self.digests.values()]
+        compression_sum = 0.0
+        fidelity_sum = 0.0
+        for digest in self.digests.values():
+            metadata = digest.metadata
+            compression_sum += metadata.compression_ratio
+            fidelity_sum += metadata.fidelity_estimate
         
         return {
-            "avg_compression": sum(compressions) / len(compressions),
-            "avg_fidelity": sum(fidelities) / len(fidelities),
-            "total_digests": len(self.digests),
+            "avg_compression": compression_sum / count,
+            "avg_fidelity": fidelity_sum / count,
+            "total_digests": count,
             "total_archived": sum(len(v) for v in self.archive.values()),
         }
@@ -1,5 +1,8 @@
 """Recursive Context-Aware Planning (ReCAP) engine."""
 
+import asyncio
+import json
+import re
 import uuid
 from typing import Dict, List, Optional, Any
 from pathlib import Path
@@ -12,6 +15,34 @@ from frctl.planning.persistence import PlanStore
 from frctl.planning.digest import Digest, DigestMetadata, DigestStore
 
 
+# JSON object inside a markdown code block, compiled once at import
+_JSON_BLOCK_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+
+
+def _extract_json(content: str) -> str:
+    """Pull the JSON object out of an LLM response.
+    
+    Prefers a fenced ```json block; otherwise takes the span from the first
+    "{" to the last "}", located with str.find/rfind so malformed replies
+    cannot trigger regex backtracking. Falls back to the whole content.
+    
+    Args:
+        content: Raw LLM response text
+        
+    Returns:
+        Text to hand to json.loads
+    """
+    if "```" in content:
+        block = _JSON_BLOCK_RE.search(content)
+        if block:
+            return block.group(1)
+    start = content.find("{")
+    end = content.rfind("}")
+    if start != -1 and end > start:
+        return content[start:end + 1]
+    return content
+
+
 class PlanningEngine:
     """ReCAP planning engine for hierarchical goal decomposition.
     
@@ -56,6 +87,26 @@ class PlanningEngine:
         self.auto_save = auto_save
         self.renderer = prompt_renderer or PromptRenderer()
         self.digest_store = DigestStore()
+        self._system_prompt: Optional[str] = None
+    
+    def _build_messages(self, user_prompt: str) -> List[Dict[str, str]]:
+        """Build chat messages for an LLM call.
+        
+        The system prompt is rendered once per engine, so every call sends
+        a byte-identical prefix that providers with prompt caching can reuse.
+        
+        Args:
+            user_prompt: Rendered goal-specific prompt
+            
+        Returns:
+            System and user messages
+        """
+        if self._system_prompt is None:
+            self._system_prompt = self.renderer.render_system_prompt()
+        return [
+            {"role": "system", "content": self._system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
     
     def create_plan(self, description: str) -> Plan:
         """Create a new planning session.
@@ -104,74 +155,147 @@ class PlanningEngine:
         if goal.depth >= self.max_depth:
             return True
         
+        messages = self._atomicity_messages(goal)
+        
+        try:
+            response = self.llm.generate(messages, temperature=0.3)
+            return self._apply_atomicity(goal, response)
+        except Exception as e:
+            print(f"Atomicity check failed: {e}")
+            # Default to atomic on failure
+            return True
+    
+    def _atomicity_context(self, goal: Goal) -> Dict[str, Optional[str]]:
+        """Collect the prompt context for a goal's atomicity check.
+        
+        Both the single and the batched check describe a goal from this,
+        so a goal is judged on the same context either way.
+        """
         # Get hydrated context for this goal
         context = self.context_tree.hydrate_context(goal.id)
         
-        # Extract context components
-        parent_intent = context.get("parent_intent")
-        global_ctx = context.get("global")
-        global_context_str = None
-        if global_ctx:
-            # Convert dict to readable string
-            global_context_str = "\n".join(f"{k}: {v}" for k, v in global_ctx.items())
-        
+        return {
+            "goal_description": goal.description,
+            "parent_intent": context.get("parent_intent"),
+            "global_context": self.context_tree.format_global_context(goal.id),
+        }
+    
+    def _atomicity_messages(self, goal: Goal) -> List[Dict[str, str]]:
+        """Build the atomicity check messages for a goal."""
         # Render prompt using template
-        system_prompt = self.renderer.render_system_prompt()
         user_prompt = self.renderer.render_atomicity_check(
-            goal_description=goal.description,
-            parent_intent=parent_intent,
-            global_context=global_context_str,
+            **self._atomicity_context(goal)
         )
         
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt}
-        ]
+        return self._build_messages(user_prompt)
+    
+    def _apply_atomicity(self, goal: Goal, response: Dict[str, Any]) -> bool:
+        """Parse an atomicity response and record it on the goal."""
+        content = response["content"].strip()
+        
+        # Extract JSON from response (handle markdown code blocks)
+        json_str = _extract_json(content)
         
+        # Parse JSON
         try:
-            response = self.llm.generate(messages, temperature=0.3)
-            content = response["content"].strip()
+            parsed = json.loads(json_str)
+            is_atomic = parsed.get("is_atomic", False)
+            reasoning = parsed.get("reasoning", "No reasoning provided")
+        except json.JSONDecodeError as je:
+            print(f"JSON parsing failed: {je}")
+            print(f"Content: {content}")
+            # Fallback to keyword detection
+            is_atomic = "true" in content.lower() and "is_atomic" in content.lower()
+            reasoning = content
+        
+        # Store reasoning and update token usage
+        goal.reasoning = reasoning
+        tokens = response["usage"]["total_tokens"]
+        goal.tokens_used += tokens
+        self.context_tree.update_token_usage(goal.id, tokens)
+        
+        return is_atomic
+    
+    def assess_atomicity_batch(self, goals: List[Goal]) -> List[bool]:
+        """Assess atomicity of sibling goals with a single LLM call.
+        
+        Goals at max depth are forced atomic without asking the LLM. A lone
+        remaining goal, or any goal the batched response leaves out, is
+        assessed individually with assess_atomicity(). Each goal is listed
+        with the same context the single-goal prompt would give it.
+        
+        Args:
+            goals: Sibling goals to assess
             
-            # Extract JSON from response (handle markdown code blocks)
-            import json
-            import re
+        Returns:
+            Atomicity result for each goal, in the same order
+        """
+        results: Dict[str, bool] = {
+            goal.id: True for goal in goals if goal.depth >= self.max_depth
+        }
+        pending = [goal for goal in goals if goal.id not in results]
+        
+        if len(pending) == 1:
+            results[pending[0].id] = self.assess_atomicity(pending[0])
+        elif pending:
+            contexts = [self._atomicity_context(goal) for goal in pending]
+            sibling_goals = [
+                {
+                    "id": goal.id,
+                    "description": context["goal_description"],
+                    "parent_intent": context["parent_intent"],
+                }
+                for goal, context in zip(pending, contexts)
+            ]
+            # Global context is tree-wide, so every goal's copy is the same
+            user_prompt = self.renderer.render_atomicity_check_batch(
+                sibling_goals=sibling_goals,
+                global_context=contexts[0]["global_context"],
+            )
             
-            # Try to extract JSON from markdown code blocks
-            json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', content, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-            else:
-                # Try to find JSON object directly
-                json_match = re.search(r'(\{.*\})', content, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(1)
-                else:
-                    json_str = content
+            messages = self._build_messages(user_prompt)
             
-            # Parse JSON
             try:
-                parsed = json.loads(json_str)
-                is_atomic = parsed.get("is_atomic", False)
-                reasoning = parsed.get("reasoning", "No reasoning provided")
-            except json.JSONDecodeError as je:
-                print(f"JSON parsing failed: {je}")
-                print(f"Content: {content}")
-                # Fallback to keyword detection
-                is_atomic = "true" in content.lower() and "is_atomic" in content.lower()
-                reasoning = content
-            
-            # Store reasoning and update token usage
-            goal.reasoning = reasoning
-            tokens = response["usage"]["total_tokens"]
-            goal.tokens_used += tokens
-            self.context_tree.update_token_usage(goal.id, tokens)
-            
-            return is_atomic
+                response = self.llm.generate(messages, temperature=0.3)
+                content = response["content"].strip()
+                
+                # Extract JSON
+                json_str = _extract_json(content)
+                
+                try:
+                    assessments = json.loads(json_str).get("assessments", [])
+                except json.JSONDecodeError as je:
+                    print(f"JSON parsing failed: {je}")
+                    assessments = []
+                
+                # Apply each assessment to its goal
+                by_id = {goal.id: goal for goal in pending}
+                for assessment in assessments:
+                    goal = by_id.get(assessment.get("goal_id"))
+                    if goal is None or goal.id in results:
+                        continue
+                    goal.reasoning = assessment.get("reasoning", "No reasoning provided")
+                    results[goal.id] = bool(assessment.get("is_atomic", False))
+                
+                # Split the call's token usage across the goals it covered
+                covered = [goal for goal in pending if goal.id in results]
+                if covered:
+                    total = response["usage"]["total_tokens"]
+                    share, extra = divmod(total, len(covered))
+                    for i, goal in enumerate(covered):
+                        tokens = share + (1 if i < extra else 0)
+                        goal.tokens_used += tokens
+                        self.context_tree.update_token_usage(goal.id, tokens)
+                
+            except Exception as e:
+                print(f"Batched atomicity check failed: {e}")
             
-        except Exception as e:
-            print(f"Atomicity check failed: {e}")
-            # Default to atomic on failure
-            return True
+            # Anything the batch didn't settle is assessed on its own
+            for goal in pending:
+                if goal.id not in results:
+                    results[goal.id] = self.assess_atomicity(goal)
+        
+        return [results[goal.id] for goal in goals]
     
     def decompose_goal(self, goal: Goal, plan: Optional[Plan] = None) -> List[Goal]:
         """Decompose a composite goal into children with isolated contexts.
@@ -185,67 +309,89 @@ class PlanningEngine:
         """
         goal.status = GoalStatus.DECOMPOSING
         
+        messages = self._decomposition_messages(goal)
+        
+        try:
+            response = self.llm.generate(messages, temperature=0.5)
+            children = self._apply_decomposition(goal, response)
+            
+            # Infer dependencies between children (task 6.5)
+            if plan and len(children) > 1:
+                self._infer_dependencies(children, goal, plan)
+            
+            return children
+            
+        except Exception as e:
+            print(f"Decomposition failed: {e}")
+            goal.status = GoalStatus.FAILED
+            return []
+    
+    def _decomposition_messages(self, goal: Goal) -> List[Dict[str, str]]:
+        """Build the decomposition messages for a goal."""
         # Get hydrated context for this goal
         context = self.context_tree.hydrate_context(goal.id)
         
         # Extract context components
         parent_intent = context.get("parent_intent")
-        global_ctx = context.get("global")
-        global_context_str = None
-        if global_ctx:
-            # Convert dict to readable string
-            global_context_str = "\n".join(f"{k}: {v}" for k, v in global_ctx.items())
+        global_context_str = self.context_tree.format_global_context(goal.id)
         
         # Render prompt using template
-        system_prompt = self.renderer.render_system_prompt()
         user_prompt = self.renderer.render_decompose_goal(
             goal_description=goal.description,
             parent_intent=parent_intent,
             global_context=global_context_str,
         )
         
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt}
-        ]
+        return self._build_messages(user_prompt)
+    
+    def _apply_decomposition(self, goal: Goal, response: Dict[str, Any]) -> List[Goal]:
+        """Parse a decomposition response into child goals with contexts."""
+        content = response["content"].strip()
+        
+        # Extract JSON from response (handle markdown code blocks)
+        json_str = _extract_json(content)
         
+        # Parse JSON
         try:
-            response = self.llm.generate(messages, temperature=0.5)
-            content = response["content"].strip()
-            
-            # Extract JSON from response (handle markdown code blocks)
-            import json
-            import re
-            
-            # Try to extract JSON from markdown code blocks
-            json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', content, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-            else:
-                # Try to find JSON object directly
-                json_match = re.search(r'(\{.*\})', content, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(1)
-                else:
-                    json_str = content
-            
-            # Parse JSON
-            try:
-                parsed = json.loads(json_str)
-                sub_goals_data = parsed.get("sub_goals", [])
-                reasoning = parsed.get("reasoning", "No reasoning provided")
-            except json.JSONDecodeError as je:
-                print(f"JSON parsing failed: {je}")
-                print(f"Content: {content}")
-                # Fallback to simple parsing
-                sub_goals_data = []
-                reasoning = content
-            
-            # Create child goals from parsed data with isolated contexts
-            children = []
-            for i, sub_goal_data in enumerate(sub_goals_data[:self.max_children]):
+            parsed = json.loads(json_str)
+            sub_goals_data = parsed.get("sub_goals", [])
+            reasoning = parsed.get("reasoning", "No reasoning provided")
+        except json.JSONDecodeError as je:
+            print(f"JSON parsing failed: {je}")
+            print(f"Content: {content}")
+            # Fallback to simple parsing
+            sub_goals_data = []
+            reasoning = content
+        
+        # Create child goals from parsed data with isolated contexts
+        children = []
+        for i, sub_goal_data in enumerate(sub_goals_data[:self.max_children]):
+            child_id = f"{goal.id}-{i+1}"
+            child_desc = sub_goal_data.get("description", f"Sub-goal {i+1}")
+            
+            child = Goal(
+                id=child_id,
+                description=child_desc,
+                parent_id=goal.id,
+                depth=goal.depth + 1,
+                status=GoalStatus.PENDING,
+            )
+            children.append(child)
+            goal.add_child(child_id)
+            
+            # Create isolated context for child with parent intent
+            self.context_tree.create_child_context(
+                goal_id=child_id,
+                parent_goal_id=goal.id,
+                parent_intent=child_desc,
+            )
+        
+        # If parsing failed or no sub-goals, create default fallback
+        if not children:
+            print(f"Warning: No sub-goals parsed, creating fallback decomposition")
+            for i in range(min(3, self.max_children)):
                 child_id = f"{goal.id}-{i+1}"
-                child_desc = sub_goal_data.get("description", f"Sub-goal {i+1}")
+                child_desc = f"Sub-task {i+1}: {goal.description[:40]}..."
                 
                 child = Goal(
                     id=child_id,
@@ -257,54 +403,21 @@ class PlanningEngine:
                 children.append(child)
                 goal.add_child(child_id)
                 
-                # Create isolated context for child with parent intent
+                # Create context for fallback child
                 self.context_tree.create_child_context(
                     goal_id=child_id,
                     parent_goal_id=goal.id,
                     parent_intent=child_desc,
                 )
-            
-            # If parsing failed or no sub-goals, create default fallback
-            if not children:
-                print(f"Warning: No sub-goals parsed, creating fallback decomposition")
-                for i in range(min(3, self.max_children)):
-                    child_id = f"{goal.id}-{i+1}"
-                    child_desc = f"Sub-task {i+1}: {goal.description[:40]}..."
-                    
-                    child = Goal(
-                        id=child_id,
-                        description=child_desc,
-                        parent_id=goal.id,
-                        depth=goal.depth + 1,
-                        status=GoalStatus.PENDING,
-                    )
-                    children.append(child)
-                    goal.add_child(child_id)
-                    
-                    # Create context for fallback child
-                    self.context_tree.create_child_context(
-                        goal_id=child_id,
-                        parent_goal_id=goal.id,
-                        parent_intent=child_desc,
-                    )
-            
-            # Update parent goal with reasoning and token usage
-            goal.reasoning = reasoning
-            tokens = response["usage"]["total_tokens"]
-            goal.tokens_used += tokens
-            self.context_tree.update_token_usage(goal.id, tokens)
-            goal.mark_complete()
-            
-            # Infer dependencies between children (task 6.5)
-            if plan and len(children) > 1:
-                self._infer_dependencies(children, goal, plan)
-            
-            return children
-            
-        except Exception as e:
-            print(f"Decomposition failed: {e}")
-            goal.status = GoalStatus.FAILED
-            return []
+        
+        # Update parent goal with reasoning and token usage
+        goal.reasoning = reasoning
+        tokens = response["usage"]["total_tokens"]
+        goal.tokens_used += tokens
+        self.context_tree.update_token_usage(goal.id, tokens)
+        goal.mark_complete()
+        
+        return children
     
     def plan_goal(self, plan: Plan, goal_id: str) -> None:
         """Recursively plan a goal and its children.
@@ -439,6 +552,21 @@ class PlanningEngine:
         if len(children) < 2:
             return  # No dependencies needed for single child
         
+        messages = self._dependency_messages(children, parent)
+        
+        try:
+            response = self.llm.generate(messages, temperature=0.3)
+            self._apply_dependencies(children, response)
+        except Exception as e:
+            print(f"Dependency inference failed: {e}")
+            # Continue without dependencies
+    
+    def _dependency_messages(
+        self,
+        children: List[Goal],
+        parent: Optional[Goal],
+    ) -> List[Dict[str, str]]:
+        """Build the dependency inference messages for sibling goals."""
         # Prepare sibling goal data
         sibling_goals = [
             {"id": child.id, "description": child.description}
@@ -447,64 +575,38 @@ class PlanningEngine:
         
         # Get context
         parent_intent = parent.description if parent else None
-        global_ctx = self.context_tree.global_context
-        global_context_str = None
-        if global_ctx:
-            global_context_str = "\n".join(f"{k}: {v}" for k, v in global_ctx.items())
+        global_context_str = self.context_tree.format_global_context()
         
         # Render prompt
-        system_prompt = self.renderer.render_system_prompt()
         user_prompt = self.renderer.render_infer_dependencies(
             sibling_goals=sibling_goals,
             parent_intent=parent_intent,
             global_context=global_context_str,
         )
         
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt}
-        ]
+        return self._build_messages(user_prompt)
+    
+    def _apply_dependencies(self, children: List[Goal], response: Dict[str, Any]) -> None:
+        """Parse a dependency response and set dependencies on the children."""
+        content = response["content"].strip()
         
-        try:
-            response = self.llm.generate(messages, temperature=0.3)
-            content = response["content"].strip()
-            
-            # Extract JSON
-            import json
-            import re
-            
-            json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', content, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-            else:
-                json_match = re.search(r'(\{.*\})', content, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(1)
-                else:
-                    json_str = content
-            
-            # Parse dependencies
-            try:
-                parsed = json.loads(json_str)
-                dependencies = parsed.get("dependencies", [])
-                
-                # Apply dependencies to goals
-                for dep in dependencies:
-                    goal_id = dep.get("goal_id")
-                    depends_on = dep.get("depends_on", [])
-                    
-                    # Find goal and update
-                    for child in children:
-                        if child.id == goal_id:
-                            child.dependencies = depends_on
-                            break
-                
-            except json.JSONDecodeError:
-                print(f"Dependency inference failed: could not parse JSON")
+        # Extract JSON
+        json_str = _extract_json(content)
         
-        except Exception as e:
-            print(f"Dependency inference failed: {e}")
-            # Continue without dependencies
+        # Parse dependencies
+        try:
+            parsed = json.loads(json_str)
+            dependencies = parsed.get("dependencies", [])
+            
+            # Apply dependencies to goals
+            by_id = {child.id: child for child in children}
+            for dep in dependencies:
+                child = by_id.get(dep.get("goal_id"))
+                if child is not None:
+                    child.dependencies = dep.get("depends_on", [])
+            
+        except json.JSONDecodeError:
+            print(f"Dependency inference failed: could not parse JSON")
     
     def plan_depth_first(
         self,
@@ -525,6 +627,8 @@ class PlanningEngine:
         iterations = 0
         stack = [goal_id]
         visited = set()
+        # Atomicity of children, assessed in one batch per decomposition
+        assessed: Dict[str, bool] = {}
         
         while stack and iterations < max_iterations:
             iterations += 1
@@ -540,8 +644,10 @@ class PlanningEngine:
             
             # Process goal based on status
             if goal.status == GoalStatus.PENDING:
-                # Assess atomicity
-                is_atomic = self.assess_atomicity(goal)
+                # Assess atomicity (children were assessed with their siblings)
+                is_atomic = assessed.pop(current_id, None)
+                if is_atomic is None:
+                    is_atomic = self.assess_atomicity(goal)
                 
                 if is_atomic:
                     goal.status = GoalStatus.ATOMIC
@@ -551,6 +657,9 @@ class PlanningEngine:
                     for child in children:
                         plan.add_goal(child)
                         stack.append(child.id)  # Add to stack for DFS
+                    if children:
+                        batch = self.assess_atomicity_batch(children)
+                        assessed.update(zip((child.id for child in children), batch))
                 
                 # Auto-save after each goal
                 if self.auto_save:
@@ -563,6 +672,78 @@ class PlanningEngine:
         if iterations >= max_iterations:
             print(f"Warning: Max iterations ({max_iterations}) reached")
     
+    async def aplan_depth_first(
+        self,
+        plan: Plan,
+        goal_id: Optional[str] = None,
+        max_concurrency: int = 4,
+    ) -> None:
+        """Plan goals depth-first, expanding sibling branches concurrently.
+        
+        Sibling goals are planned independently of each other (their
+        dependencies only order execution), so the children of every
+        decomposition are expanded together with asyncio.gather, alongside
+        their dependency inference. Wall time for k independent branches
+        approaches the slowest branch instead of their sum.
+        
+        Args:
+            plan: Plan to work on
+            goal_id: Starting goal ID (defaults to root)
+            max_concurrency: Maximum number of LLM calls in flight at once
+        """
+        limit = asyncio.Semaphore(max_concurrency)
+        
+        async def call(messages: List[Dict[str, str]], temperature: float) -> Dict[str, Any]:
+            async with limit:
+                return await self.llm.agenerate(messages, temperature=temperature)
+        
+        async def infer(children: List[Goal], parent: Goal) -> None:
+            try:
+                response = await call(self._dependency_messages(children, parent), 0.3)
+                self._apply_dependencies(children, response)
+            except Exception as e:
+                print(f"Dependency inference failed: {e}")
+        
+        async def expand(current_id: str) -> None:
+            goal = plan.get_goal(current_id)
+            if not goal or goal.status != GoalStatus.PENDING:
+                return
+            
+            # Assess atomicity (forced atomic at max depth or on failure)
+            is_atomic = True
+            if goal.depth < self.max_depth:
+                try:
+                    response = await call(self._atomicity_messages(goal), 0.3)
+                    is_atomic = self._apply_atomicity(goal, response)
+                except Exception as e:
+                    print(f"Atomicity check failed: {e}")
+            
+            if is_atomic:
+                goal.status = GoalStatus.ATOMIC
+                return
+            
+            goal.status = GoalStatus.DECOMPOSING
+            try:
+                response = await call(self._decomposition_messages(goal), 0.5)
+                children = self._apply_decomposition(goal, response)
+            except Exception as e:
+                print(f"Decomposition failed: {e}")
+                goal.status = GoalStatus.FAILED
+                return
+            
+            for child in children:
+                plan.add_goal(child)
+            
+            if self.auto_save:
+                self.plan_store.save(plan)
+            
+            branches = [expand(child.id) for child in children]
+            if len(children) > 1:
+                branches.append(infer(children, goal))
+            await asyncio.gather(*branches)
+        
+        await expand(goal_id or plan.root_goal_id)
+    
     def pause_planning(self, plan: Plan) -> Path:
         """Pause planning and save current state.
         
@@ -633,8 +814,7 @@ class PlanningEngine:
                 del plan.goals[child_id]
             
             # Remove from context tree
-            if child_id in self.context_tree._nodes:
-                del self.context_tree._nodes[child_id]
+            self.context_tree.remove_context(child_id)
         
         # Reset goal
         goal.child_ids = []
@@ -658,7 +838,6 @@ class PlanningEngine:
         """
         stats = plan.get_statistics()
         pending = plan.get_pending_goals()
-        atomic = plan.get_atomic_goals()
         
         return {
             **stats,
@@ -706,7 +885,6 @@ class PlanningEngine:
             goal_results += f"\nReasoning: {goal.reasoning}"
         
         # Render digest generation prompt
-        system_prompt = self.renderer.render_system_prompt()
         user_prompt = self.renderer.render_generate_digest(
             goal_description=goal.description,
             goal_status=goal.status.value,
@@ -715,10 +893,7 @@ class PlanningEngine:
             parent_intent=parent_intent,
         )
         
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt}
-        ]
+        messages = self._build_messages(user_prompt)
         
         # Count original tokens (goal + children)
         original_tokens = goal.tokens_used
@@ -730,18 +905,7 @@ class PlanningEngine:
             content = response["content"].strip()
             
             # Extract JSON from response
-            import json
-            import re
-            
-            json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', content, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-            else:
-                json_match = re.search(r'(\{.*\})', content, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(1)
-                else:
-                    json_str = content
+            json_str = _extract_json(content)
             
             # Parse digest data
             try:
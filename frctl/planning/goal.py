@@ -1,9 +1,10 @@
 """Goal data model for hierarchical planning."""
 
+import sys
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from datetime import datetime, timezone
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class GoalStatus(str, Enum):
@@ -45,6 +46,20 @@ class Goal(BaseModel):
     dependencies: List[str] = Field(default_factory=list, description="IDs of goals this depends on")
     graph_node_id: Optional[str] = Field(None, description="Associated node in FederatedGraph")
     
+    @field_validator('id', 'parent_id', 'graph_node_id')
+    @classmethod
+    def intern_id(cls, v: Optional[str]) -> Optional[str]:
+        """Intern goal and graph node IDs, which repeat as dict keys and in lists."""
+        if v is None:
+            return v
+        return sys.intern(v)
+    
+    @field_validator('child_ids', 'dependencies')
+    @classmethod
+    def intern_id_list(cls, v: List[str]) -> List[str]:
+        """Intern referenced goal IDs so they share storage with the goals."""
+        return [sys.intern(goal_id) for goal_id in v]
+    
     def is_atomic(self) -> bool:
         """Check if this goal is atomic (no children)."""
         return self.status == GoalStatus.ATOMIC or (
@@ -68,13 +83,13 @@ class Goal(BaseModel):
     def add_child(self, child_id: str) -> None:
         """Add a child goal."""
         if child_id not in self.child_ids:
-            self.child_ids.append(child_id)
+            self.child_ids.append(sys.intern(child_id))
             self.updated_at = datetime.now(timezone.utc)
     
     def add_dependency(self, goal_id: str) -> None:
         """Add a dependency on another goal."""
         if goal_id not in self.dependencies:
-            self.dependencies.append(goal_id)
+            self.dependencies.append(sys.intern(goal_id))
             self.updated_at = datetime.now(timezone.utc)
     
     def __str__(self) -> str:
@@ -114,6 +129,15 @@ class Plan(BaseModel):
             self.max_depth = goal.depth
         self.total_tokens += goal.tokens_used
     
+    def add_goals(self, goals: Iterable[Goal]) -> None:
+        """Add several goals to the plan, touching updated_at once."""
+        for goal in goals:
+            self.goals[goal.id] = goal
+            if goal.depth > self.max_depth:
+                self.max_depth = goal.depth
+            self.total_tokens += goal.tokens_used
+        self.updated_at = datetime.now(timezone.utc)
+    
     def get_goal(self, goal_id: str) -> Optional[Goal]:
         """Get a goal by ID."""
         return self.goals.get(goal_id)
@@ -127,7 +151,8 @@ class Plan(BaseModel):
         goal = self.goals.get(goal_id)
         if not goal:
             return []
-        return [self.goals[child_id] for child_id in goal.child_ids if child_id in self.goals]
+        children = map(self.goals.get, goal.child_ids)
+        return [child for child in children if child is not None]
     
     def get_atomic_goals(self) -> List[Goal]:
         """Get all atomic goals in the plan."""
@@ -151,14 +176,21 @@ class Plan(BaseModel):
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get plan statistics."""
-        atomic_count = len(self.get_atomic_goals())
-        total_goals = len(self.goals)
+        # One pass for both the atomic count and is_complete(); depth and
+        # tokens are already running totals on the plan
+        atomic_count = 0
+        open_count = 0
+        for goal in self.goals.values():
+            if goal.is_atomic():
+                atomic_count += 1
+            elif goal.status in (GoalStatus.PENDING, GoalStatus.DECOMPOSING):
+                open_count += 1
         
         return {
-            "total_goals": total_goals,
+            "total_goals": len(self.goals),
             "atomic_goals": atomic_count,
             "max_depth": self.max_depth,
             "total_tokens": self.total_tokens,
             "status": self.status,
-            "is_complete": self.is_complete(),
+            "is_complete": open_count == 0,
         }
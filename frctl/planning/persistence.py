@@ -1,14 +1,48 @@
 """Plan persistence for saving/loading plans to/from disk."""
 
+import heapq
 import json
+import os
 import shutil
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from datetime import datetime
+try:
+    import orjson  # optional: faster save/load
+except ImportError:
+    orjson = None
 
 from frctl.planning.goal import Plan
 
 
+def _write_json(path: Path, data) -> None:
+    """Write data as indented JSON, via orjson when it is installed.
+    
+    The encoded document goes out in one write to a temporary file that
+    then replaces ``path``, so readers never see a half-written file.
+    """
+    if orjson is not None:
+        encoded = orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2)
+    else:
+        encoded = json.dumps(data, indent=2, default=str).encode()
+    
+    # Append rather than swap the suffix: plan.json and plan.md must not
+    # share plan.tmp
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_bytes(encoded)
+    os.replace(tmp_path, path)
+
+
+def _read_json(path: Path):
+    """Read a JSON file, via orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
 class PlanStore:
     """Manages plan persistence to .frctl/plans/ directory.
     
@@ -23,16 +57,24 @@ class PlanStore:
         """Initialize plan store.
         
         Args:
-            base_path: Base directory for plans (defaults to .frctl/plans in cwd)
+            base_path: Base directory for plans (defaults to $FRCTL_HOME/plans,
+                       or .frctl/plans in cwd)
         """
         if base_path is None:
-            base_path = Path.cwd() / ".frctl" / "plans"
+            frctl_home = os.environ.get("FRCTL_HOME")
+            if frctl_home:
+                base_path = Path(frctl_home) / "plans"
+            else:
+                base_path = Path.cwd() / ".frctl" / "plans"
         
         self.base_path = Path(base_path)
         self.plans_dir = self.base_path
         self.archive_dir = self.base_path / "archive"
         self.index_file = self.base_path / "index.json"
         
+        # In-memory index held while inside batch(); None otherwise
+        self._batch_index: Optional[Dict] = None
+        
         # Create directories if they don't exist
         self.plans_dir.mkdir(parents=True, exist_ok=True)
         self.archive_dir.mkdir(parents=True, exist_ok=True)
@@ -41,6 +83,28 @@ class PlanStore:
         if not self.index_file.exists():
             self._save_index({})
     
+    @contextmanager
+    def batch(self) -> Iterator["PlanStore"]:
+        """Defer index writes until the end of a group of operations.
+        
+        Inside the block, save() and delete() update an in-memory copy of
+        the index, which is written once on exit. Plan files themselves are
+        still written immediately. Nested batches flush at the outermost exit.
+        
+        Yields:
+            This store
+        """
+        if self._batch_index is not None:
+            yield self
+            return
+        
+        self._batch_index = self._load_index()
+        try:
+            yield self
+        finally:
+            index, self._batch_index = self._batch_index, None
+            self._save_index(index)
+    
     def save(self, plan: Plan, create_backup: bool = True) -> Path:
         """Save a plan to disk.
         
@@ -53,17 +117,15 @@ class PlanStore:
         """
         plan_path = self.plans_dir / f"{plan.id}.json"
         
-        # Create backup if plan already exists
-        if create_backup and plan_path.exists():
+        # Create backup if plan already exists (_backup_plan checks)
+        if create_backup:
             self._backup_plan(plan.id)
         
         # Update metadata
         plan.updated_at = datetime.now(datetime.now().astimezone().tzinfo or None)
         
         # Save plan as JSON
-        plan_data = plan.model_dump(mode='json')
-        with open(plan_path, 'w') as f:
-            json.dump(plan_data, f, indent=2, default=str)
+        _write_json(plan_path, plan.model_dump(mode='json'))
         
         # Update index
         self._update_index(plan)
@@ -84,30 +146,29 @@ class PlanStore:
         if not plan_path.exists():
             return None
         
-        with open(plan_path, 'r') as f:
-            plan_data = json.load(f)
-        
-        return Plan.model_validate(plan_data)
+        return Plan.model_validate(_read_json(plan_path))
     
-    def list_plans(self, status: Optional[str] = None) -> List[Dict]:
+    def list_plans(self, status: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
         """List all plans with metadata.
         
         Args:
             status: Filter by status (in_progress, complete, failed)
+            limit: Return only the most recently updated plans
             
         Returns:
-            List of plan metadata dicts
+            List of plan metadata dicts, most recently updated first
         """
         index = self._load_index()
-        plans = list(index.values())
+        plans = index.values()
         
         if status:
-            plans = [p for p in plans if p.get('status') == status]
+            plans = (p for p in plans if p.get('status') == status)
         
-        # Sort by updated_at descending
-        plans.sort(key=lambda p: p.get('updated_at', ''), reverse=True)
+        if limit is not None:
+            # Partial selection instead of sorting the whole index
+            return heapq.nlargest(limit, plans, key=lambda p: p.get('updated_at', ''))
         
-        return plans
+        return sorted(plans, key=lambda p: p.get('updated_at', ''), reverse=True)
     
     def exists(self, plan_id: str) -> bool:
         """Check if a plan exists.
@@ -130,16 +191,16 @@ class PlanStore:
         Returns:
             True if deleted successfully
         """
-        plan_path = self.plans_dir / f"{plan_id}.json"
-        
-        if not plan_path.exists():
-            return False
-        
-        # Archive if requested
+        # Archive if requested; either call reports a missing plan itself,
+        # so there is no separate exists() check
         if archive:
-            self.archive(plan_id)
+            if self.archive(plan_id) is None:
+                return False
         else:
-            plan_path.unlink()
+            try:
+                (self.plans_dir / f"{plan_id}.json").unlink()
+            except FileNotFoundError:
+                return False
         
         # Remove from index
         index = self._load_index()
@@ -160,15 +221,16 @@ class PlanStore:
         """
         plan_path = self.plans_dir / f"{plan_id}.json"
         
-        if not plan_path.exists():
-            return None
-        
         # Create archive filename with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         archive_path = self.archive_dir / f"{plan_id}_{timestamp}.json"
         
-        # Move to archive
-        shutil.move(str(plan_path), str(archive_path))
+        # Move to archive: a single rename, since archive_dir is inside
+        # base_path; a missing plan surfaces as FileNotFoundError
+        try:
+            os.replace(plan_path, archive_path)
+        except FileNotFoundError:
+            return None
         
         return archive_path
     
@@ -191,9 +253,7 @@ class PlanStore:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         if format == "json":
-            plan_data = plan.model_dump(mode='json')
-            with open(output_path, 'w') as f:
-                json.dump(plan_data, f, indent=2, default=str)
+            _write_json(output_path, plan.model_dump(mode='json'))
             return True
         
         return False
@@ -209,15 +269,23 @@ class PlanStore:
         """
         plan_path = self.plans_dir / f"{plan_id}.json"
         
-        if not plan_path.exists():
-            return None
-        
         # Create backup filename with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = self.plans_dir / f".{plan_id}.backup_{timestamp}.json"
         
-        # Copy to backup
-        shutil.copy2(str(plan_path), str(backup_path))
+        # Hard-link instead of copying: saves swap a new file into place
+        # with os.replace, so the old inode is never written to again
+        try:
+            os.link(plan_path, backup_path)
+        except FileNotFoundError:
+            return None
+        except FileExistsError:
+            # A backup from the same second; keep the newest, as a copy would
+            backup_path.unlink()
+            os.link(plan_path, backup_path)
+        except OSError:
+            # Filesystem without hard links
+            shutil.copy2(str(plan_path), str(backup_path))
         
         return backup_path
     
@@ -253,11 +321,13 @@ class PlanStore:
         Returns:
             Index dictionary mapping plan_id -> metadata
         """
+        if self._batch_index is not None:
+            return self._batch_index
+        
         if not self.index_file.exists():
             return {}
         
-        with open(self.index_file, 'r') as f:
-            return json.load(f)
+        return _read_json(self.index_file)
     
     def _save_index(self, index: Dict) -> None:
         """Save the plan index.
@@ -265,5 +335,8 @@ class PlanStore:
         Args:
             index: Index dictionary to save
         """
-        with open(self.index_file, 'w') as f:
-            json.dump(index, f, indent=2, default=str)
+        if self._batch_index is not None:
+            self._batch_index = index
+            return
+        
+        _write_json(self.index_file, index)
@@ -3,7 +3,11 @@
 import pytest
 from click.testing import CliRunner
 from pathlib import Path
-import json
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 from frctl.__main__ import cli
 from frctl.planning import Plan, Goal, GoalStatus
@@ -16,6 +20,17 @@ def runner():
     return CliRunner()
 
 
+def invoke(runner, args):
+    """Invoke the CLI without Click's exception wrapping or standalone exit handling."""
+    return runner.invoke(
+        cli,
+        args,
+        catch_exceptions=False,
+        standalone_mode=False,
+        color=False,
+    )
+
+
 @pytest.fixture
 def temp_frctl_dir(tmp_path):
     """Create temporary .frctl directory."""
@@ -25,12 +40,23 @@ def temp_frctl_dir(tmp_path):
     return frctl_dir
 
 
-@pytest.fixture
-def sample_plan(temp_frctl_dir):
-    """Create a sample plan for testing."""
-    store = PlanStore(base_path=temp_frctl_dir / "plans")
-    
-    # Create a simple plan
+@pytest.fixture(scope="module")
+def shared_frctl_dir(tmp_path_factory):
+    """Create a .frctl directory shared by the tests in this module."""
+    frctl_dir = tmp_path_factory.mktemp("cli") / ".frctl"
+    (frctl_dir / "plans").mkdir(parents=True)
+    return frctl_dir
+
+
+@pytest.fixture(scope="module")
+def store(shared_frctl_dir):
+    """Create a single plan store shared by the tests in this module."""
+    return PlanStore(base_path=shared_frctl_dir / "plans")
+
+
+@pytest.fixture(scope="session")
+def _plan_template():
+    """Build the sample plan once; tests get a deep copy."""
     plan = Plan(id="test-plan", root_goal_id="test-root")
     root = Goal(
         id="test-root",
@@ -38,28 +64,33 @@ def sample_plan(temp_frctl_dir):
         status=GoalStatus.COMPLETE,
         depth=0,
     )
-    child1 = Goal(
-        id="test-child-1",
-        description="Child goal 1",
+    base_child = Goal(
+        id="test-child",
+        description="Child goal",
         status=GoalStatus.ATOMIC,
         depth=1,
         parent_id="test-root",
     )
-    child2 = Goal(
-        id="test-child-2",
-        description="Child goal 2",
-        status=GoalStatus.ATOMIC,
-        depth=1,
-        parent_id="test-root",
+    child1 = base_child.model_copy(
+        update={"id": "test-child-1", "description": "Child goal 1"}, deep=True
+    )
+    child2 = base_child.model_copy(
+        update={"id": "test-child-2", "description": "Child goal 2"}, deep=True
     )
     
     root.child_ids = ["test-child-1", "test-child-2"]
     
-    plan.add_goal(root)
-    plan.add_goal(child1)
-    plan.add_goal(child2)
+    plan.add_goals([root, child1, child2])
     plan.mark_complete()
     
+    return plan
+
+
+@pytest.fixture
+def sample_plan(store, _plan_template):
+    """Create a sample plan for testing."""
+    plan = _plan_template.model_copy(deep=True)
+    
     store.save(plan)
     return plan, store
 
@@ -67,21 +98,17 @@ def sample_plan(temp_frctl_dir):
 class TestPlanList:
     """Tests for 'frctl plan list' command."""
     
-    def test_list_no_plans(self, runner, tmp_path, monkeypatch):
+    def test_list_no_plans(self, runner, temp_frctl_dir):
         """Test listing when no plans exist."""
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / ".frctl" / "plans").mkdir(parents=True)
-        
-        result = runner.invoke(cli, ["plan", "list"])
+        result = invoke(runner, ["--frctl-home", str(temp_frctl_dir), "plan", "list"])
         assert result.exit_code == 0
         assert "No plans found" in result.output
     
-    def test_list_with_plans(self, runner, tmp_path, monkeypatch, sample_plan):
+    def test_list_with_plans(self, runner, shared_frctl_dir, sample_plan):
         """Test listing plans."""
         plan, store = sample_plan
-        monkeypatch.chdir(tmp_path)
         
-        result = runner.invoke(cli, ["plan", "list"])
+        result = invoke(runner, ["--frctl-home", str(shared_frctl_dir), "plan", "list"])
         assert result.exit_code == 0
         assert "test-plan" in result.output
         assert "Test goal" in result.output
@@ -90,24 +117,22 @@ class TestPlanList:
 class TestPlanStatus:
     """Tests for 'frctl plan status' command."""
     
-    def test_status_with_plan_id(self, runner, tmp_path, monkeypatch, sample_plan):
+    def test_status_with_plan_id(self, runner, shared_frctl_dir, sample_plan):
         """Test viewing plan status."""
         plan, store = sample_plan
-        monkeypatch.chdir(tmp_path)
         
-        result = runner.invoke(cli, ["plan", "status", "test-plan"])
+        result = invoke(runner, ["--frctl-home", str(shared_frctl_dir), "plan", "status", "test-plan"])
         assert result.exit_code == 0
         assert "test-plan" in result.output
         assert "Test goal" in result.output
         assert "Statistics" in result.output
         assert "Total goals: 3" in result.output
     
-    def test_status_shows_goal_tree(self, runner, tmp_path, monkeypatch, sample_plan):
+    def test_status_shows_goal_tree(self, runner, shared_frctl_dir, sample_plan):
         """Test that status shows the goal tree."""
         plan, store = sample_plan
-        monkeypatch.chdir(tmp_path)
         
-        result = runner.invoke(cli, ["plan", "status", "test-plan"])
+        result = invoke(runner, ["--frctl-home", str(shared_frctl_dir), "plan", "status", "test-plan"])
         assert result.exit_code == 0
         assert "Goal Tree:" in result.output
         assert "test-root" in result.output
@@ -116,12 +141,11 @@ class TestPlanStatus:
 class TestPlanReview:
     """Tests for 'frctl plan review' command."""
     
-    def test_review_goal(self, runner, tmp_path, monkeypatch, sample_plan):
+    def test_review_goal(self, runner, shared_frctl_dir, sample_plan):
         """Test reviewing a specific goal."""
         plan, store = sample_plan
-        monkeypatch.chdir(tmp_path)
         
-        result = runner.invoke(cli, ["plan", "review", "test-root", "--plan-id", "test-plan"])
+        result = invoke(runner, ["--frctl-home", str(shared_frctl_dir), "plan", "review", "test-root", "--plan-id", "test-plan"])
         assert result.exit_code == 0
         assert "test-root" in result.output
         assert "Test goal" in result.output
@@ -130,39 +154,35 @@ class TestPlanReview:
 class TestPlanExport:
     """Tests for 'frctl plan export' command."""
     
-    def test_export_to_stdout(self, runner, tmp_path, monkeypatch, sample_plan):
+    def test_export_to_stdout(self, runner, shared_frctl_dir, sample_plan):
         """Test exporting plan to stdout."""
         plan, store = sample_plan
-        monkeypatch.chdir(tmp_path)
         
-        result = runner.invoke(cli, ["plan", "export", "test-plan"])
+        result = invoke(runner, ["--frctl-home", str(shared_frctl_dir), "plan", "export", "test-plan"])
         assert result.exit_code == 0
         
-        # Parse JSON output
-        plan_data = json.loads(result.output)
-        assert plan_data["id"] == "test-plan"
-        assert "test-root" in plan_data["goals"]
+        exported = json_loads(result.output)
+        assert exported["id"] == "test-plan"
+        assert "test-root" in exported["goals"]
 
 
 class TestPlanVisualize:
     """Tests for 'frctl plan visualize' command."""
     
-    def test_visualize_ascii(self, runner, tmp_path, monkeypatch, sample_plan):
+    def test_visualize_ascii(self, runner, shared_frctl_dir, sample_plan):
         """Test ASCII visualization."""
         plan, store = sample_plan
-        monkeypatch.chdir(tmp_path)
         
-        result = runner.invoke(cli, ["plan", "visualize", "test-plan", "--format", "ascii"])
+        result = invoke(runner, ["--frctl-home", str(shared_frctl_dir), "plan", "visualize", "test-plan", "--format", "ascii"])
         assert result.exit_code == 0
         assert "test-plan" in result.output
         assert "Test goal" in result.output
     
-    def test_visualize_mermaid(self, runner, tmp_path, monkeypatch, sample_plan):
+    def test_visualize_mermaid(self, runner, shared_frctl_dir, sample_plan):
         """Test Mermaid visualization."""
         plan, store = sample_plan
-        monkeypatch.chdir(tmp_path)
         
-        result = runner.invoke(cli, ["plan", "visualize", "test-plan", "--format", "mermaid"])
+        result = invoke(runner, ["--frctl-home", str(shared_frctl_dir), "plan", "visualize", "test-plan", "--format", "mermaid"])
         assert result.exit_code == 0
         assert "```mermaid" in result.output
         assert "graph TD" in result.output
@@ -172,12 +192,11 @@ class TestPlanVisualize:
 class TestPlanDelete:
     """Tests for 'frctl plan delete' command."""
     
-    def test_delete_with_force(self, runner, tmp_path, monkeypatch, sample_plan):
+    def test_delete_with_force(self, runner, shared_frctl_dir, sample_plan):
         """Test deleting plan with force flag."""
         plan, store = sample_plan
-        monkeypatch.chdir(tmp_path)
         
-        result = runner.invoke(cli, ["plan", "delete", "test-plan", "--force"])
+        result = invoke(runner, ["--frctl-home", str(shared_frctl_dir), "plan", "delete", "test-plan", "--force"])
         assert result.exit_code == 0
         assert "deleted" in result.output
         
@@ -0,0 +1,16 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_frctl_home(tmp_path, monkeypatch):
+    """Point FRCTL_HOME at a per-test directory.
+    
+    Components that fall back to the default plan store write under this
+    directory instead of the shared working directory, which keeps tests
+    independent when run in parallel with pytest-xdist.
+    """
+    frctl_home = tmp_path / ".frctl"
+    monkeypatch.setenv("FRCTL_HOME", str(frctl_home))
+    return frctl_home
@@ -0,0 +1,61 @@
+"""Performance regression benchmarks for the context tree."""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from frctl.context import ContextTree
+
+
+@pytest.fixture
+def deep_tree():
+    """Create a 5-level context hierarchy."""
+    tree = ContextTree(global_context={"project": "frctl"})
+    tree.create_root_context("root")
+    parent = "root"
+    for level in range(1, 5):
+        goal_id = f"l{level}"
+        tree.create_child_context(goal_id, parent, f"Level {level}")
+        parent = goal_id
+    return tree
+
+
+@pytest.fixture
+def wide_tree():
+    """Create a tree with 1000 children under one root."""
+    tree = ContextTree(default_token_limit=1000, global_context={"project": "frctl"})
+    tree.create_root_context("root")
+    for i in range(1000):
+        goal_id = f"child-{i}"
+        tree.create_child_context(goal_id, "root", f"Task {i}")
+        tree.update_token_usage(goal_id, i * 2)
+    return tree
+
+
+@pytest.mark.slow
+class TestContextTreeBenchmarks:
+    """Benchmarks guarding hydrate, stats and serialization hot paths."""
+    
+    def test_deep_hierarchy_hydrate(self, benchmark, deep_tree):
+        """Benchmark repeated hydration of the deepest node."""
+        hydrated = benchmark.pedantic(
+            deep_tree.hydrate_context, args=("l4",), rounds=100, warmup_rounds=10
+        )
+        
+        assert hydrated["parent_intent"] == "Level 4"
+    
+    def test_get_tree_stats(self, benchmark, wide_tree):
+        """Benchmark stats over a wide tree."""
+        stats = benchmark.pedantic(wide_tree.get_tree_stats, rounds=100, warmup_rounds=10)
+        
+        assert stats["total_nodes"] == 1001
+        assert stats["nodes_over_limit"] == 499
+    
+    def test_serialize_deserialize(self, benchmark, wide_tree):
+        """Benchmark a full serialize/deserialize round trip."""
+        def roundtrip():
+            return ContextTree.deserialize(wide_tree.serialize())
+        
+        restored = benchmark.pedantic(roundtrip, rounds=10, warmup_rounds=1)
+        
+        assert restored.get_total_tokens() == wide_tree.get_total_tokens()
@@ -1,9 +1,29 @@
 """Tests for Context Tree."""
 
+import copy
+import json
+import pickle
+
 import pytest
 from frctl.context import ContextTree, ContextNode
 
 
+@pytest.fixture(scope="module")
+def _tree_template():
+    """Build a root with two children once per module."""
+    tree = ContextTree(default_token_limit=1000, global_context={"project": "frctl"})
+    tree.create_root_context("root")
+    tree.create_child_context("child1", "root", "Task A")
+    tree.create_child_context("child2", "root", "Task B")
+    return tree
+
+
+@pytest.fixture
+def tree(_tree_template):
+    """Provide a private copy of the template tree."""
+    return copy.deepcopy(_tree_template)
+
+
 class TestContextNode:
     """Test ContextNode class."""
     
@@ -25,17 +45,13 @@ class TestContextNode:
         """Test token usage tracking."""
         node = ContextNode(goal_id="test", token_limit=1000)
         
-        assert node.remaining_tokens() == 1000
-        assert not node.is_over_limit()
+        assert (node.remaining_tokens(), node.is_over_limit()) == (1000, False)
         
         node.add_tokens(300)
-        assert node.tokens_used == 300
-        assert node.remaining_tokens() == 700
+        assert (node.tokens_used, node.remaining_tokens(), node.is_over_limit()) == (300, 700, False)
         
         node.add_tokens(800)
-        assert node.tokens_used == 1100
-        assert node.is_over_limit()
-        assert node.remaining_tokens() == 0
+        assert (node.tokens_used, node.remaining_tokens(), node.is_over_limit()) == (1100, 0, True)
     
     def test_context_content(self):
         """Test context content storage."""
@@ -46,9 +62,11 @@ class TestContextNode:
             local_context={"task": "implement", "priority": "high"},
         )
         
-        assert node.global_context["project"] == "frctl"
-        assert node.parent_intent == "Build a feature"
-        assert node.local_context["task"] == "implement"
+        assert (
+            node.global_context["project"],
+            node.parent_intent,
+            node.local_context["task"],
+        ) == ("frctl", "Build a feature", "implement")
 
 
 class TestContextTree:
@@ -71,10 +89,12 @@ class TestContextTree:
         
         root = tree.create_root_context("root-goal")
         
-        assert root.goal_id == "root-goal"
-        assert root.parent_goal_id is None
-        assert root.global_context["project"] == "frctl"
-        assert root.tokens_used == 0
+        assert (
+            root.goal_id,
+            root.parent_goal_id,
+            root.global_context,
+            root.tokens_used,
+        ) == ("root-goal", None, {"project": "frctl"}, 0)
         
         # Verify it's stored in the tree
         assert tree.get_context("root-goal") == root
@@ -126,10 +146,28 @@ class TestContextTree:
         # Hydrate child context
         hydrated = tree.hydrate_context("child")
         
-        assert hydrated["global"]["project"] == "frctl"
-        assert hydrated["global"]["version"] == "0.1"
-        assert hydrated["parent_intent"] == "Implement feature"
-        assert hydrated["local"]["task"] == "coding"
+        assert hydrated == {
+            "global": {"project": "frctl", "version": "0.1"},
+            "local": {"task": "coding"},
+            "parent_intent": "Implement feature",
+        }
+    
+    def test_hydrate_context_reflects_direct_writes(self):
+        """Test hydration picks up writes made directly on the node."""
+        tree = ContextTree(global_context={"project": "frctl"})
+        tree.create_root_context("root")
+        node = tree.create_child_context("child", "root", "Implement feature")
+        tree.hydrate_context("child")
+        
+        node.parent_intent = "Refactor feature"
+        node.local_context = {"task": "coding"}
+        tree.set_global_context("version", "0.2")
+        
+        assert tree.hydrate_context("child") == {
+            "global": {"project": "frctl", "version": "0.2"},
+            "local": {"task": "coding"},
+            "parent_intent": "Refactor feature",
+        }
     
     def test_hydrate_root_context(self):
         """Test hydrating root context (no parent intent)."""
@@ -140,9 +178,10 @@ class TestContextTree:
         
         hydrated = tree.hydrate_context("root")
         
-        assert hydrated["global"]["project"] == "frctl"
-        assert hydrated["local"]["stage"] == "initial"
-        assert "parent_intent" not in hydrated
+        assert hydrated == {
+            "global": {"project": "frctl"},
+            "local": {"stage": "initial"},
+        }
     
     def test_dehydrate_context(self):
         """Test context dehydration with digest."""
@@ -183,6 +222,61 @@ class TestContextTree:
         assert tree.get_context("root").global_context["constraint"] == "use Python 3.11+"
         assert tree.get_context("child").global_context["constraint"] == "use Python 3.11+"
     
+    def test_set_global_context_after_deserialize(self):
+        """Test that restored trees still propagate global context."""
+        tree = ContextTree(global_context={"project": "frctl"})
+        tree.create_root_context("root")
+        tree.create_child_context("child", "root")
+        
+        restored = ContextTree.deserialize(tree.serialize())
+        restored.set_global_context("constraint", "no network")
+        
+        assert restored.get_context("child").global_context["constraint"] == "no network"
+    
+    def test_per_node_global_context_edit_is_shared(self):
+        """Test that a node's global context is the tree's one shared dict."""
+        tree = ContextTree(global_context={"project": "frctl"})
+        tree.create_root_context("root")
+        tree.create_child_context("child1", "root")
+        tree.create_child_context("child2", "root")
+        
+        tree.get_context("child1").global_context["constraint"] = "no network"
+        
+        expected = {"project": "frctl", "constraint": "no network"}
+        assert tree.global_context == expected
+        assert tree.get_context("child2").global_context == expected
+        assert json.loads(json.dumps(tree.hydrate_context("child2")))["global"] == expected
+        
+        restored = ContextTree.deserialize(tree.serialize())
+        restored.get_context("child1").global_context["project"] = "frctl2"
+        assert restored.get_context("child2").global_context["project"] == "frctl2"
+        assert tree.global_context["project"] == "frctl"
+    
+    def test_format_global_context(self):
+        """Test the rendered global context tracks every write."""
+        tree = ContextTree()
+        assert tree.format_global_context() is None
+        
+        tree.set_global_context("project", "frctl")
+        assert tree.format_global_context() == "project: frctl"
+        
+        tree.global_context["lang"] = "python"
+        assert tree.format_global_context() == "project: frctl\nlang: python"
+    
+    def test_format_global_context_for_goal(self):
+        """Test that a goal's rendered global context matches its hydrated one."""
+        tree = ContextTree(global_context={"project": "frctl"})
+        tree.create_root_context("root")
+        node = tree.create_child_context("child", "root")
+        node.global_context = {"project": "frctl", "scope": "child only"}
+        
+        assert tree.format_global_context("child") == "\n".join(
+            f"{k}: {v}" for k, v in tree.hydrate_context("child")["global"].items()
+        )
+        assert tree.format_global_context("root") == "project: frctl"
+        with pytest.raises(ValueError):
+            tree.format_global_context("missing")
+    
     def test_set_local_context(self):
         """Test setting local context."""
         tree = ContextTree()
@@ -196,34 +290,55 @@ class TestContextTree:
         assert tree.get_context("root").local_context["key"] == "value1"
         assert tree.get_context("child").local_context["key"] == "value2"
     
-    def test_get_total_tokens(self):
+    def test_get_total_tokens(self, tree):
         """Test calculating total tokens across tree."""
-        tree = ContextTree()
-        
-        root = tree.create_root_context("root")
-        child1 = tree.create_child_context("child1", "root")
-        child2 = tree.create_child_context("child2", "root")
-        
         tree.update_token_usage("root", 100)
         tree.update_token_usage("child1", 200)
         tree.update_token_usage("child2", 300)
         
         assert tree.get_total_tokens() == 600
     
-    def test_get_tree_stats(self):
-        """Test getting tree statistics."""
-        tree = ContextTree(default_token_limit=1000)
+    def test_total_tokens_after_remove_context(self):
+        """Test that removing a context drops its tokens from the total."""
+        tree = ContextTree()
+        tree.create_root_context("root")
+        tree.create_child_context("child", "root")
         
+        tree.update_token_usage("root", 100)
+        tree.update_token_usage("child", 250)
+        tree.remove_context("child")
+        
+        assert tree.get_context("child") is None
+        assert tree.get_total_tokens() == 100
+    
+    def test_total_tokens_tracks_direct_writes(self, tree):
+        """Test that direct tokens_used writes are picked up by the total."""
+        tree.get_context("root").tokens_used = 400
+        tree.get_context("child1").add_tokens(100)
+        assert tree.get_total_tokens() == 500
+        assert tree.get_tree_stats()["total_tokens"] == 500
+        
+        # Detached nodes no longer count towards the tree
+        child = tree.get_context("child2")
+        tree.remove_context("child2")
+        child.tokens_used = 999
+        assert tree.get_total_tokens() == 500
+    
+    def test_stored_node_is_picklable(self, tree):
+        """Test that nodes held by a tree still pickle."""
+        tree.update_token_usage("root", 250)
+        node = pickle.loads(pickle.dumps(tree.get_context("root")))
+        
+        assert (node.goal_id, node.tokens_used) == ("root", 250)
+    
+    def test_get_tree_stats(self, tree):
+        """Test getting tree statistics."""
         # Empty tree
-        stats = tree.get_tree_stats()
+        stats = ContextTree(default_token_limit=1000).get_tree_stats()
         assert stats["total_nodes"] == 0
         assert stats["total_tokens"] == 0
         
         # Tree with nodes
-        root = tree.create_root_context("root")
-        child1 = tree.create_child_context("child1", "root")
-        child2 = tree.create_child_context("child2", "root")
-        
         tree.update_token_usage("root", 500)
         tree.update_token_usage("child1", 800)
         tree.update_token_usage("child2", 1200)  # Over limit
@@ -235,14 +350,8 @@ class TestContextTree:
         assert stats["max_tokens"] == 1200
         assert stats["nodes_over_limit"] == 1
     
-    def test_context_isolation(self):
+    def test_context_isolation(self, tree):
         """Test that sibling contexts are isolated."""
-        tree = ContextTree(global_context={"project": "frctl"})
-        
-        root = tree.create_root_context("root")
-        child1 = tree.create_child_context("child1", "root", "Task A")
-        child2 = tree.create_child_context("child2", "root", "Task B")
-        
         # Set different local contexts
         tree.set_local_context("child1", "approach", "method1")
         tree.set_local_context("child2", "approach", "method2")
@@ -279,28 +388,24 @@ class TestContextTree:
         # Serialize
         data = tree.serialize()
         
-        # Deserialize
+        # Deserialize and compare the round trip in one pass
         restored = ContextTree.deserialize(data)
-        
-        # Verify structure
-        assert restored.default_token_limit == 4096
-        assert restored.global_context["project"] == "frctl"
+        assert restored.serialize() == data
         assert restored.get_total_tokens() == 800
         
-        # Verify root
-        root_node = restored.get_context("root")
-        assert root_node.goal_id == "root"
-        assert root_node.tokens_used == 500
-        assert root_node.local_context["stage"] == "planning"
-        
-        # Verify child
-        child_node = restored.get_context("child")
-        assert child_node.goal_id == "child"
-        assert child_node.parent_goal_id == "root"
-        assert child_node.parent_intent == "Build feature"
-        assert child_node.tokens_used == 300
-        assert child_node.digest == "Completed task"
-        assert child_node.digest_tokens == 10
+        # Spot-check the serialized content itself
+        assert data["default_token_limit"] == 4096
+        assert data["global_context"] == {"project": "frctl", "version": "0.1"}
+        root_node = data["nodes"]["root"]
+        assert (root_node["tokens_used"], root_node["local_context"]) == (500, {"stage": "planning"})
+        child_node = data["nodes"]["child"]
+        assert (
+            child_node["parent_goal_id"],
+            child_node["parent_intent"],
+            child_node["tokens_used"],
+            child_node["digest"],
+            child_node["digest_tokens"],
+        ) == ("root", "Build feature", 300, "Completed task", 10)
     
     def test_deep_hierarchy(self):
         """Test deep context hierarchy."""
@@ -314,11 +419,11 @@ class TestContextTree:
         level4 = tree.create_child_context("l4", "l3", "Level 4")
         
         # Each level should have parent intent
-        assert tree.get_context("l1").parent_intent == "Level 1"
-        assert tree.get_context("l2").parent_intent == "Level 2"
-        assert tree.get_context("l3").parent_intent == "Level 3"
-        assert tree.get_context("l4").parent_intent == "Level 4"
+        expected = {"l1": "Level 1", "l2": "Level 2", "l3": "Level 3", "l4": "Level 4"}
+        assert {k: tree.get_context(k).parent_intent for k in expected} == expected
         
         # All should inherit global context
-        for node_id in ["root", "l1", "l2", "l3", "l4"]:
-            assert tree.get_context(node_id).global_context["project"] == "frctl"
+        assert {
+            node_id: tree.get_context(node_id).global_context["project"]
+            for node_id in ["root", "l1", "l2", "l3", "l4"]
+        } == {"root": "frctl", "l1": "frctl", "l2": "frctl", "l3": "frctl", "l4": "frctl"}
@@ -0,0 +1,40 @@
+"""Shared graph fixtures."""
+
+import pytest
+
+from frctl.graph import FederatedGraph, Node, NodeType, Edge, EdgeType
+
+
+def _build(names, pairs):
+    """Build a graph of service nodes connected by DEPENDS_ON edges."""
+    g = FederatedGraph()
+    g.add_nodes(Node(id=f"pkg:frctl/{n}@local", type=NodeType.SERVICE, name=n) for n in names)
+    g.add_edges(
+        Edge(source=f"pkg:frctl/{s}@local", target=f"pkg:frctl/{t}@local", edge_type=EdgeType.DEPENDS_ON)
+        for s, t in pairs
+    )
+    return g
+
+
+@pytest.fixture(scope="module")
+def _linear_template():
+    """A -> B -> C, built once per module."""
+    return _build("abc", [("a", "b"), ("b", "c")])
+
+
+@pytest.fixture(scope="module")
+def _diamond_template():
+    """A -> B -> D, A -> C -> D, built once per module."""
+    return _build("abcd", [("a", "b"), ("a", "c"), ("b", "d"), ("c", "d")])
+
+
+@pytest.fixture
+def linear_graph(_linear_template):
+    """A fresh copy of the linear A -> B -> C graph."""
+    return _linear_template.clone()
+
+
+@pytest.fixture
+def diamond_graph(_diamond_template):
+    """A fresh copy of the A/B/C/D diamond graph."""
+    return _diamond_template.clone()
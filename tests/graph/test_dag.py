@@ -2,6 +2,7 @@
 
 import pytest
 import json
+import networkx as nx
 import tempfile
 from pathlib import Path
 
@@ -58,6 +59,25 @@ class TestGraphBasics:
         assert g.node_count() == 0
         assert g.get_node("pkg:frctl/test@local") is None
     
+    def test_remove_node_with_self_loop(self):
+        """Test removing a node loaded with an edge to itself."""
+        g = FederatedGraph.from_dict({
+            "nodes": {
+                "pkg:frctl/a@local": {"id": "pkg:frctl/a@local", "type": "Service", "name": "a"},
+                "pkg:frctl/b@local": {"id": "pkg:frctl/b@local", "type": "Service", "name": "b"},
+            },
+            "edges": [
+                {"source": "pkg:frctl/a@local", "target": "pkg:frctl/a@local", "edge_type": "DEPENDS_ON"},
+                {"source": "pkg:frctl/b@local", "target": "pkg:frctl/a@local", "edge_type": "DEPENDS_ON"},
+            ],
+        })
+        
+        g.remove_node("pkg:frctl/a@local")
+        
+        assert g.node_count() == 1
+        assert g.edge_count() == 0
+        assert g.topological_sort() == ["pkg:frctl/b@local"]
+    
     def test_remove_nonexistent_node(self):
         """Test removing a node that doesn't exist."""
         g = FederatedGraph()
@@ -65,6 +85,67 @@ class TestGraphBasics:
         with pytest.raises(NodeNotFoundError):
             g.remove_node("pkg:frctl/nonexistent@local")
 
+    
+    def test_construct_with_edges(self):
+        """Test that edges passed to the constructor are stored and indexed."""
+        a = Node(id="pkg:frctl/a@local", type=NodeType.SERVICE, name="a")
+        b = Node(id="pkg:frctl/b@local", type=NodeType.SERVICE, name="b")
+        edge = Edge(source=a.id, target=b.id, edge_type=EdgeType.DEPENDS_ON)
+        
+        g = FederatedGraph(nodes={a.id: a, b.id: b}, edges=[edge])
+        
+        assert g.edges == [edge]
+        assert g.topological_sort() == [a.id, b.id]
+    
+    def test_model_dump_roundtrip(self, diamond_graph):
+        """Test that model_dump includes edges and model_validate restores them."""
+        data = diamond_graph.model_dump()
+        restored = FederatedGraph.model_validate(data)
+        
+        assert len(data["edges"]) == 4
+        assert restored.to_dict() == diamond_graph.to_dict()
+        assert restored.get_descendants("pkg:frctl/a@local") == diamond_graph.get_descendants("pkg:frctl/a@local")
+    
+    @pytest.mark.parametrize("deep", [False, True])
+    def test_model_copy_has_own_index(self, diamond_graph, deep):
+        """Test that removing an edge from a model_copy leaves the original intact."""
+        copied = diamond_graph.model_copy(deep=deep)
+        copied.remove_edge("pkg:frctl/a@local", "pkg:frctl/b@local")
+        
+        assert diamond_graph.edge_count() == 4
+        assert copied.edge_count() == 3
+    
+    def test_model_copy_update_edges(self, diamond_graph):
+        """Test that model_copy(update={"edges": ...}) re-indexes the copy."""
+        copied = diamond_graph.model_copy(update={"edges": []})
+        
+        assert copied.edge_count() == 0
+        assert copied.get_descendants("pkg:frctl/a@local") == []
+        assert diamond_graph.edge_count() == 4
+    
+    def test_edges_append_reindexes(self, diamond_graph):
+        """Test that appending to graph.edges stores and indexes the edge."""
+        edge = Edge(source="pkg:frctl/d@local", target="pkg:frctl/a@local", edge_type=EdgeType.DEPENDS_ON)
+        diamond_graph.edges.append(edge)
+        
+        assert diamond_graph.edge_count() == 5
+        assert diamond_graph.edges[-1] == edge
+        assert diamond_graph.get_descendants("pkg:frctl/d@local") == ["pkg:frctl/a@local", "pkg:frctl/b@local", "pkg:frctl/c@local"]
+        assert diamond_graph.validate() == ["Graph contains cycles"]
+    
+    def test_edges_assignment_reindexes(self, diamond_graph):
+        """Test that assigning graph.edges replaces the edge store."""
+        diamond_graph.edges = [
+            {"source": "pkg:frctl/a@local", "target": "pkg:frctl/d@local", "edge_type": "DEPENDS_ON"},
+        ]
+        
+        assert diamond_graph.edge_count() == 1
+        assert diamond_graph.get_descendants("pkg:frctl/a@local") == ["pkg:frctl/d@local"]
+        assert diamond_graph.get_ancestors("pkg:frctl/b@local") == []
+        
+        diamond_graph.edges = []
+        assert diamond_graph.to_dict()["edges"] == []
+
 
 class TestGraphEdges:
     """Test graph edge operations."""
@@ -157,6 +238,105 @@ class TestGraphEdges:
         
         assert g.node_count() == 2
         assert g.edge_count() == 0
+    
+    def test_add_nodes_and_edges_in_bulk(self):
+        """Test bulk insertion of a diamond graph."""
+        g = FederatedGraph()
+        g.add_nodes(Node(id=f"pkg:frctl/{n}@local", type=NodeType.SERVICE, name=n) for n in "dcba")
+        g.add_edges(
+            Edge(source=f"pkg:frctl/{s}@local", target=f"pkg:frctl/{t}@local", edge_type=EdgeType.DEPENDS_ON)
+            for s, t in [("a", "b"), ("a", "c"), ("b", "d"), ("c", "d")]
+        )
+        
+        order = g.topological_sort()
+        
+        assert (g.node_count(), g.edge_count(), g.depth()) == (4, 4, 2)
+        assert order[0] == "pkg:frctl/a@local" and order[-1] == "pkg:frctl/d@local"
+    
+    def test_add_nodes_rejects_duplicates_atomically(self):
+        """Test that a batch with a repeated ID adds nothing."""
+        g = FederatedGraph()
+        
+        with pytest.raises(ValueError, match="already exists"):
+            g.add_nodes([
+                Node(id="pkg:frctl/a@local", type=NodeType.SERVICE, name="a"),
+                Node(id="pkg:frctl/a@local", type=NodeType.SERVICE, name="a"),
+            ])
+        
+        assert g.node_count() == 0
+    
+    def test_add_edges_rolls_back_on_cycle(self):
+        """Test that a batch closing a cycle leaves the graph unchanged."""
+        g = FederatedGraph()
+        g.add_nodes(Node(id=f"pkg:frctl/{n}@local", type=NodeType.SERVICE, name=n) for n in "abc")
+        g.add_edge(Edge(source="pkg:frctl/a@local", target="pkg:frctl/b@local", edge_type=EdgeType.DEPENDS_ON))
+        
+        with pytest.raises(CycleDetectedError):
+            g.add_edges([
+                Edge(source="pkg:frctl/b@local", target="pkg:frctl/c@local", edge_type=EdgeType.DEPENDS_ON),
+                Edge(source="pkg:frctl/c@local", target="pkg:frctl/a@local", edge_type=EdgeType.DEPENDS_ON),
+            ])
+        
+        assert g.edge_count() == 1
+        assert g.get_descendants("pkg:frctl/a@local") == ["pkg:frctl/b@local"]
+    
+    def test_small_batch_on_large_graph_rolls_back(self):
+        """Test that an edge-by-edge batch undoes only its own edges."""
+        g = FederatedGraph()
+        ids = [f"pkg:frctl/n{i}@local" for i in range(64)]
+        g.add_nodes(Node(id=node_id, type=NodeType.SERVICE, name=node_id) for node_id in ids)
+        g.add_edge(Edge(source=ids[0], target=ids[1], edge_type=EdgeType.DEPENDS_ON))
+        
+        with pytest.raises(CycleDetectedError):
+            g.add_edges([
+                Edge(source=ids[0], target=ids[1], edge_type=EdgeType.CONSUMES),
+                Edge(source=ids[2], target=ids[0], edge_type=EdgeType.DEPENDS_ON),
+                Edge(source=ids[1], target=ids[2], edge_type=EdgeType.DEPENDS_ON),
+            ])
+        
+        assert [e.edge_type for e in g.edges] == [EdgeType.DEPENDS_ON]
+        assert g.get_ancestors(ids[0]) == []
+        assert g.depth() == 1
+        
+        g.add_edges([
+            Edge(source=ids[3], target=ids[2], edge_type=EdgeType.DEPENDS_ON),
+            Edge(source=ids[2], target=ids[0], edge_type=EdgeType.DEPENDS_ON),
+        ])
+        
+        assert g.get_ancestors(ids[1]) == [ids[3], ids[2], ids[0]]
+        assert g.depth() == 3
+    
+    def test_remove_node_then_readd(self):
+        """Test that a removed and re-added node is tracked correctly."""
+        g = FederatedGraph()
+        for name in ["a", "b", "c"]:
+            g.add_node(Node(id=f"pkg:frctl/{name}@local", type=NodeType.SERVICE, name=name))
+        g.add_edge(Edge(source="pkg:frctl/a@local", target="pkg:frctl/b@local", edge_type=EdgeType.DEPENDS_ON))
+        g.add_edge(Edge(source="pkg:frctl/b@local", target="pkg:frctl/c@local", edge_type=EdgeType.DEPENDS_ON))
+        
+        g.remove_node("pkg:frctl/b@local")
+        g.add_node(Node(id="pkg:frctl/b@local", type=NodeType.SERVICE, name="b"))
+        g.add_edge(Edge(source="pkg:frctl/c@local", target="pkg:frctl/b@local", edge_type=EdgeType.DEPENDS_ON))
+        g.add_edge(Edge(source="pkg:frctl/b@local", target="pkg:frctl/a@local", edge_type=EdgeType.DEPENDS_ON))
+        
+        assert g.topological_sort() == [f"pkg:frctl/{n}@local" for n in ["c", "b", "a"]]
+        with pytest.raises(CycleDetectedError):
+            g.add_edge(Edge(source="pkg:frctl/a@local", target="pkg:frctl/c@local", edge_type=EdgeType.DEPENDS_ON))
+    
+    def test_multiple_edge_types_between_pair(self):
+        """Test that one node pair can carry several relationship types."""
+        g = FederatedGraph()
+        for name in ["a", "b"]:
+            g.add_node(Node(id=f"pkg:frctl/{name}@local", type=NodeType.SERVICE, name=name))
+        g.add_edge(Edge(source="pkg:frctl/a@local", target="pkg:frctl/b@local", edge_type=EdgeType.DEPENDS_ON))
+        g.add_edge(Edge(source="pkg:frctl/a@local", target="pkg:frctl/b@local", edge_type=EdgeType.CONSUMES))
+        
+        assert [e.edge_type for e in g.edges] == [EdgeType.DEPENDS_ON, EdgeType.CONSUMES]
+        assert g.get_edge("pkg:frctl/a@local", "pkg:frctl/b@local").edge_type == EdgeType.DEPENDS_ON
+        
+        g.remove_edge("pkg:frctl/a@local", "pkg:frctl/b@local")
+        
+        assert g.edge_count() == 0
 
 
 class TestCycleDetection:
@@ -218,6 +398,73 @@ class TestCycleDetection:
         
         # Should succeed - no cycle
         assert g.edge_count() == 4
+    
+    def test_detect_cycle_after_reordering(self):
+        """Test cycle detection when edges are added against insertion order."""
+        g = FederatedGraph()
+        for name in ["a", "b", "c"]:
+            g.add_node(Node(id=f"pkg:frctl/{name}@local", type=NodeType.SERVICE, name=name))
+        
+        # C -> B -> A, each edge contradicting insertion order
+        g.add_edge(Edge(source="pkg:frctl/c@local", target="pkg:frctl/b@local", edge_type=EdgeType.DEPENDS_ON))
+        g.add_edge(Edge(source="pkg:frctl/b@local", target="pkg:frctl/a@local", edge_type=EdgeType.DEPENDS_ON))
+        
+        assert g.topological_sort() == ["pkg:frctl/c@local", "pkg:frctl/b@local", "pkg:frctl/a@local"]
+        with pytest.raises(CycleDetectedError, match="would create a cycle"):
+            g.add_edge(Edge(source="pkg:frctl/a@local", target="pkg:frctl/c@local", edge_type=EdgeType.DEPENDS_ON))
+        
+        # The rejected edge leaves the graph untouched
+        assert g.edge_count() == 2
+    
+    def test_connect_components_against_order(self):
+        """Test joining two independent chains with an edge against rank order."""
+        g = FederatedGraph()
+        for name in ["a", "b", "c", "d"]:
+            g.add_node(Node(id=f"pkg:frctl/{name}@local", type=NodeType.SERVICE, name=name))
+        
+        # Two components: A -> B and C -> D, then D -> A joins them
+        g.add_edge(Edge(source="pkg:frctl/a@local", target="pkg:frctl/b@local", edge_type=EdgeType.DEPENDS_ON))
+        g.add_edge(Edge(source="pkg:frctl/c@local", target="pkg:frctl/d@local", edge_type=EdgeType.DEPENDS_ON))
+        g.add_edge(Edge(source="pkg:frctl/d@local", target="pkg:frctl/a@local", edge_type=EdgeType.DEPENDS_ON))
+        
+        assert g.topological_sort() == [f"pkg:frctl/{n}@local" for n in ["c", "d", "a", "b"]]
+        with pytest.raises(CycleDetectedError):
+            g.add_edge(Edge(source="pkg:frctl/b@local", target="pkg:frctl/c@local", edge_type=EdgeType.DEPENDS_ON))
+        
+        # Removing the bridge splits the components again
+        g.remove_node("pkg:frctl/d@local")
+        g.add_edge(Edge(source="pkg:frctl/b@local", target="pkg:frctl/c@local", edge_type=EdgeType.DEPENDS_ON))
+        assert g.topological_sort() == [f"pkg:frctl/{n}@local" for n in ["a", "b", "c"]]
+    
+    def test_self_loop_rejected(self):
+        """Test that an edge from a node to itself is a cycle."""
+        g = FederatedGraph()
+        g.add_node(Node(id="pkg:frctl/a@local", type=NodeType.SERVICE, name="a"))
+        
+        with pytest.raises(CycleDetectedError):
+            g.add_edge(Edge(source="pkg:frctl/a@local", target="pkg:frctl/a@local", edge_type=EdgeType.DEPENDS_ON))
+    
+    def test_cycle_loaded_from_dict(self):
+        """Test that a cyclic graph loaded from data is reported."""
+        data = {
+            "nodes": {
+                "pkg:frctl/a@local": {"id": "pkg:frctl/a@local", "type": "Service", "name": "a"},
+                "pkg:frctl/b@local": {"id": "pkg:frctl/b@local", "type": "Service", "name": "b"},
+            },
+            "edges": [
+                {"source": "pkg:frctl/a@local", "target": "pkg:frctl/b@local", "edge_type": "DEPENDS_ON"},
+                {"source": "pkg:frctl/b@local", "target": "pkg:frctl/a@local", "edge_type": "DEPENDS_ON"},
+            ],
+        }
+        g = FederatedGraph.from_dict(data)
+        
+        assert "Graph contains cycles" in g.validate()
+        with pytest.raises(CycleDetectedError):
+            g.topological_sort()
+        
+        # Breaking the cycle restores a valid ordering
+        g.remove_edge("pkg:frctl/b@local", "pkg:frctl/a@local")
+        assert g.topological_sort() == ["pkg:frctl/a@local", "pkg:frctl/b@local"]
 
 
 class TestTopologicalSort:
@@ -244,19 +491,9 @@ class TestTopologicalSort:
         assert sorted_nodes.index("pkg:frctl/a@local") < sorted_nodes.index("pkg:frctl/b@local")
         assert sorted_nodes.index("pkg:frctl/b@local") < sorted_nodes.index("pkg:frctl/c@local")
     
-    def test_topological_sort_diamond(self):
+    def test_topological_sort_diamond(self, diamond_graph):
         """Test topological sort on a diamond graph."""
-        g = FederatedGraph()
-        for name in ["a", "b", "c", "d"]:
-            g.add_node(Node(id=f"pkg:frctl/{name}@local", type=NodeType.SERVICE, name=name))
-        
-        # Diamond: A -> B -> D, A -> C -> D
-        g.add_edge(Edge(source="pkg:frctl/a@local", target="pkg:frctl/b@local", edge_type=EdgeType.DEPENDS_ON))
-        g.add_edge(Edge(source="pkg:frctl/a@local", target="pkg:frctl/c@local", edge_type=EdgeType.DEPENDS_ON))
-        g.add_edge(Edge(source="pkg:frctl/b@local", target="pkg:frctl/d@local", edge_type=EdgeType.DEPENDS_ON))
-        g.add_edge(Edge(source="pkg:frctl/c@local", target="pkg:frctl/d@local", edge_type=EdgeType.DEPENDS_ON))
-        
-        sorted_nodes = g.topological_sort()
+        sorted_nodes = diamond_graph.topological_sort()
         
         # A before B and C, B and C before D
         a_idx = sorted_nodes.index("pkg:frctl/a@local")
@@ -269,6 +506,21 @@ class TestTopologicalSort:
         assert b_idx < d_idx
         assert c_idx < d_idx
     
+    def test_topological_sort_cached_per_version(self):
+        """Test that cached orders are fresh copies and refresh on mutation."""
+        g = FederatedGraph()
+        for name in ["a", "b"]:
+            g.add_node(Node(id=f"pkg:frctl/{name}@local", type=NodeType.SERVICE, name=name))
+        
+        first = g.topological_sort()
+        first.clear()
+        
+        assert g.topological_sort() == ["pkg:frctl/a@local", "pkg:frctl/b@local"]
+        
+        g.add_edge(Edge(source="pkg:frctl/b@local", target="pkg:frctl/a@local", edge_type=EdgeType.DEPENDS_ON))
+        
+        assert (g.topological_sort(), g.depth()) == (["pkg:frctl/b@local", "pkg:frctl/a@local"], 1)
+    
     def test_topological_sort_empty_graph(self):
         """Test topological sort on an empty graph."""
         g = FederatedGraph()
@@ -281,15 +533,9 @@ class TestTopologicalSort:
 class TestGraphTraversal:
     """Test graph traversal operations."""
     
-    def test_get_ancestors(self):
+    def test_get_ancestors(self, linear_graph):
         """Test getting ancestor nodes."""
-        g = FederatedGraph()
-        for name in ["a", "b", "c"]:
-            g.add_node(Node(id=f"pkg:frctl/{name}@local", type=NodeType.SERVICE, name=name))
-        
-        # A -> B -> C
-        g.add_edge(Edge(source="pkg:frctl/a@local", target="pkg:frctl/b@local", edge_type=EdgeType.DEPENDS_ON))
-        g.add_edge(Edge(source="pkg:frctl/b@local", target="pkg:frctl/c@local", edge_type=EdgeType.DEPENDS_ON))
+        g = linear_graph
         
         ancestors = g.get_ancestors("pkg:frctl/c@local")
         
@@ -297,19 +543,44 @@ class TestGraphTraversal:
         # Should be in dependency order: A before B
         assert ancestors.index("pkg:frctl/a@local") < ancestors.index("pkg:frctl/b@local")
     
-    def test_get_descendants(self):
+    def test_get_descendants(self, linear_graph):
         """Test getting descendant nodes."""
+        g = linear_graph
+        
+        descendants = g.get_descendants("pkg:frctl/a@local")
+        
+        assert set(descendants) == {"pkg:frctl/b@local", "pkg:frctl/c@local"}
+    
+    def test_traversals_follow_mutations(self):
+        """Test that ancestors, descendants and depth reflect later edits."""
         g = FederatedGraph()
         for name in ["a", "b", "c"]:
             g.add_node(Node(id=f"pkg:frctl/{name}@local", type=NodeType.SERVICE, name=name))
-        
-        # A -> B -> C
-        g.add_edge(Edge(source="pkg:frctl/a@local", target="pkg:frctl/b@local", edge_type=EdgeType.DEPENDS_ON))
         g.add_edge(Edge(source="pkg:frctl/b@local", target="pkg:frctl/c@local", edge_type=EdgeType.DEPENDS_ON))
         
-        descendants = g.get_descendants("pkg:frctl/a@local")
+        assert (g.get_ancestors("pkg:frctl/c@local"), g.depth()) == (["pkg:frctl/b@local"], 1)
         
-        assert set(descendants) == {"pkg:frctl/b@local", "pkg:frctl/c@local"}
+        g.add_edge(Edge(source="pkg:frctl/c@local", target="pkg:frctl/a@local", edge_type=EdgeType.DEPENDS_ON))
+        
+        assert g.get_ancestors("pkg:frctl/a@local") == ["pkg:frctl/b@local", "pkg:frctl/c@local"]
+        assert g.get_descendants("pkg:frctl/b@local") == ["pkg:frctl/c@local", "pkg:frctl/a@local"]
+        assert g.depth() == 2
+        
+        g.remove_edge("pkg:frctl/b@local", "pkg:frctl/c@local")
+        
+        assert (g.get_descendants("pkg:frctl/b@local"), g.depth()) == ([], 1)
+    
+    def test_ancestor_order_independent_of_snapshot(self, diamond_graph):
+        """Test that queries agree before and after the CSR snapshot is built."""
+        g = diamond_graph
+        g.add_node(Node(id="pkg:frctl/e@local", type=NodeType.SERVICE, name="e"))
+        
+        before = (g.get_ancestors("pkg:frctl/d@local"), g.get_descendants("pkg:frctl/a@local"))
+        order = g.topological_sort()
+        after = (g.get_ancestors("pkg:frctl/d@local"), g.get_descendants("pkg:frctl/a@local"))
+        
+        assert before == after
+        assert before[0] == [n for n in order if n not in ("pkg:frctl/d@local", "pkg:frctl/e@local")]
     
     def test_get_ancestors_nonexistent_node(self):
         """Test getting ancestors of a nonexistent node."""
@@ -344,6 +615,27 @@ class TestGraphTraversal:
         assert subgraph.get_node("pkg:frctl/c@local") is not None
         assert subgraph.get_edge("pkg:frctl/b@local", "pkg:frctl/c@local") is not None
     
+    def test_clone_is_independent(self, diamond_graph):
+        """Test that mutating a clone leaves the original untouched."""
+        clone = diamond_graph.clone()
+        clone.remove_node("pkg:frctl/d@local")
+        clone.add_edge(Edge(source="pkg:frctl/c@local", target="pkg:frctl/b@local", edge_type=EdgeType.DEPENDS_ON))
+        
+        assert (diamond_graph.node_count(), diamond_graph.edge_count()) == (4, 4)
+        assert diamond_graph.get_descendants("pkg:frctl/c@local") == ["pkg:frctl/d@local"]
+        assert clone.get_descendants("pkg:frctl/c@local") == ["pkg:frctl/b@local"]
+        assert clone.to_dict()["nodes"] == {
+            k: v for k, v in diamond_graph.to_dict()["nodes"].items() if k != "pkg:frctl/d@local"
+        }
+    
+    def test_to_networkx(self, diamond_graph):
+        """Test exporting to NetworkX for its algorithms."""
+        G = diamond_graph.to_networkx()
+        
+        assert (G.number_of_nodes(), G.number_of_edges()) == (4, 4)
+        assert G.nodes["pkg:frctl/a@local"]["name"] == "a"
+        assert nx.ancestors(G, "pkg:frctl/d@local") == set(diamond_graph.get_ancestors("pkg:frctl/d@local"))
+    
     def test_extract_subgraph_nonexistent_node(self):
         """Test extracting subgraph with nonexistent node."""
         g = FederatedGraph()
@@ -376,6 +668,27 @@ class TestGraphValidation:
         errors = g.validate()
         
         assert errors == []
+    
+    def test_validate_reports_dangling_edges(self):
+        """Test that each edge to a missing node is reported."""
+        g = FederatedGraph.from_dict({
+            "nodes": {
+                "pkg:frctl/a@local": {"id": "pkg:frctl/a@local", "type": "Service", "name": "a"},
+            },
+            "edges": [
+                {"source": "pkg:frctl/a@local", "target": "pkg:frctl/x@local", "edge_type": "DEPENDS_ON"},
+                {"source": "pkg:frctl/a@local", "target": "pkg:frctl/x@local", "edge_type": "CONSUMES"},
+                {"source": "pkg:frctl/y@local", "target": "pkg:frctl/a@local", "edge_type": "DEPENDS_ON"},
+            ],
+        })
+        
+        errors = g.validate()
+        
+        assert errors == [
+            "Edge references non-existent target node: pkg:frctl/x@local",
+            "Edge references non-existent target node: pkg:frctl/x@local",
+            "Edge references non-existent source node: pkg:frctl/y@local",
+        ]
 
 
 class TestGraphStatistics:
@@ -407,16 +720,24 @@ class TestGraphStatistics:
         g.add_edge(Edge(source="pkg:frctl/a@local", target="pkg:frctl/b@local", edge_type=EdgeType.DEPENDS_ON))
         assert g.edge_count() == 1
     
-    def test_depth_linear_graph(self):
+    def test_depth_linear_graph(self, linear_graph):
         """Test depth calculation on a linear graph."""
-        g = FederatedGraph()
-        for name in ["a", "b", "c"]:
-            g.add_node(Node(id=f"pkg:frctl/{name}@local", type=NodeType.SERVICE, name=name))
-        
         # A -> B -> C (depth 2)
-        g.add_edge(Edge(source="pkg:frctl/a@local", target="pkg:frctl/b@local", edge_type=EdgeType.DEPENDS_ON))
-        g.add_edge(Edge(source="pkg:frctl/b@local", target="pkg:frctl/c@local", edge_type=EdgeType.DEPENDS_ON))
+        assert linear_graph.depth() == 2
+    
+    def test_depth_tracks_edits(self, linear_graph):
+        """Test that depth grows with new edges and shrinks after removals."""
+        g = linear_graph
+        g.add_node(Node(id="pkg:frctl/z@local", type=NodeType.SERVICE, name="z"))
+        
+        # Z -> A lengthens the whole chain
+        g.add_edge(Edge(source="pkg:frctl/z@local", target="pkg:frctl/a@local", edge_type=EdgeType.DEPENDS_ON))
+        assert g.depth() == 3
         
+        g.remove_node("pkg:frctl/b@local")
+        assert g.depth() == 1
+        
+        g.add_edge(Edge(source="pkg:frctl/a@local", target="pkg:frctl/c@local", edge_type=EdgeType.DEPENDS_ON))
         assert g.depth() == 2
     
     def test_depth_empty_graph(self):
@@ -1,5 +1,7 @@
 """Unit tests for Node class."""
 
+import sys
+
 import pytest
 from pydantic import ValidationError
 
@@ -80,6 +82,13 @@ class TestNodeValidation:
         )
         
         assert node.id == "pkg:frctl/test@local"
+    
+    def test_id_is_interned(self):
+        """Test that equal IDs built at runtime share one string object."""
+        suffix = "test@local"
+        node = Node(id="  pkg:frctl/" + suffix, type=NodeType.SERVICE, name="test")
+        
+        assert node.id is sys.intern("pkg:frctl/test@local")
 
 
 class TestNodeTypes:
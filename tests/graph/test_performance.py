@@ -1,179 +1,174 @@
 """Performance tests for large graphs."""
 
+import importlib.util
+
 import pytest
-import time
 
 from frctl.graph import FederatedGraph, Node, NodeType, Edge, EdgeType
 
+# Only the tests that take the benchmark fixture need pytest-benchmark
+requires_benchmark = pytest.mark.skipif(
+    importlib.util.find_spec("pytest_benchmark") is None,
+    reason="pytest-benchmark is not installed",
+)
+
+
+def _node_ids(count):
+    """Build the node IDs once so test loops don't re-format them."""
+    return [f"pkg:frctl/node-{i}@local" for i in range(count)]
+
+
+def _add_nodes(g, ids):
+    """Add one SERVICE node per ID."""
+    for i, node_id in enumerate(ids):
+        g.add_node(Node(
+            id=node_id,
+            type=NodeType.SERVICE,
+            name=f"node-{i}"
+        ))
+
+
+def _chain_graph(ids, edge_count=None):
+    """Create a graph linking ids[0] -> ids[1] -> ... for edge_count edges."""
+    g = FederatedGraph()
+    _add_nodes(g, ids)
+    if edge_count is None:
+        edge_count = len(ids) - 1
+    for i in range(edge_count):
+        g.add_edge(Edge(
+            source=ids[i],
+            target=ids[i + 1],
+            edge_type=EdgeType.DEPENDS_ON
+        ))
+    return g
+
+
+def _assert_median_under(benchmark, limit):
+    """Check a time budget (seconds) against the median benchmark round."""
+    # stats is None when benchmarks run with --benchmark-disable
+    if benchmark.stats is not None:
+        median = benchmark.stats.stats.median
+        assert median < limit, f"Median round took {median:.2f}s (should be < {limit}s)"
+
 
 @pytest.mark.slow
+@requires_benchmark
 class TestPerformance:
     """Test performance with large graphs."""
     
-    def test_1000_node_graph_creation(self):
+    def test_1000_node_graph_creation(self, benchmark):
         """Test creating a graph with 1000 nodes."""
-        g = FederatedGraph()
+        ids = _node_ids(1000)
         
-        start = time.time()
-        
-        # Add 1000 nodes
-        for i in range(1000):
-            g.add_node(Node(
-                id=f"pkg:frctl/node-{i}@local",
-                type=NodeType.SERVICE,
-                name=f"node-{i}"
-            ))
+        def create():
+            g = FederatedGraph()
+            _add_nodes(g, ids)
+            return g
         
-        elapsed = time.time() - start
+        g = benchmark.pedantic(create, rounds=10, warmup_rounds=1)
         
         assert g.node_count() == 1000
-        assert elapsed < 1.0, f"Creating 1000 nodes took {elapsed:.2f}s (should be < 1s)"
+        _assert_median_under(benchmark, 1.0)
     
-    def test_1000_node_linear_graph_operations(self):
+    def test_1000_node_linear_graph_operations(self, benchmark):
         """Test operations on a 1000-node linear graph."""
-        g = FederatedGraph()
-        
-        # Create linear graph: 0 -> 1 -> 2 -> ... -> 999
-        for i in range(1000):
-            g.add_node(Node(
-                id=f"pkg:frctl/node-{i}@local",
-                type=NodeType.SERVICE,
-                name=f"node-{i}"
-            ))
+        ids = _node_ids(1000)
         
-        for i in range(999):
-            g.add_edge(Edge(
-                source=f"pkg:frctl/node-{i}@local",
-                target=f"pkg:frctl/node-{i+1}@local",
-                edge_type=EdgeType.DEPENDS_ON
-            ))
-        
-        # Test topological sort performance
-        start = time.time()
-        sorted_nodes = g.topological_sort()
-        topo_time = time.time() - start
+        # Create linear graph 0 -> 1 -> ... -> 999, then sort and validate it
+        def operations():
+            g = _chain_graph(ids)
+            return g.topological_sort(), g.validate()
         
-        assert len(sorted_nodes) == 1000
-        assert topo_time < 1.0, f"Topological sort took {topo_time:.2f}s (should be < 1s)"
-        
-        # Test cycle detection performance (should be fast since graph is valid)
-        start = time.time()
-        errors = g.validate()
-        validate_time = time.time() - start
+        sorted_nodes, errors = benchmark.pedantic(operations, rounds=10, warmup_rounds=1)
         
+        assert sorted_nodes == ids
         assert errors == []
-        assert validate_time < 1.0, f"Validation took {validate_time:.2f}s (should be < 1s)"
+        _assert_median_under(benchmark, 1.0)
+    
+    def test_1000_node_linear_graph_bulk_build(self, benchmark):
+        """Test building the 1000-node linear graph with the batch API."""
+        ids = _node_ids(1000)
+        
+        def build():
+            g = FederatedGraph()
+            g.add_nodes(
+                Node(id=node_id, type=NodeType.SERVICE, name=f"node-{i}")
+                for i, node_id in enumerate(ids)
+            )
+            g.add_edges(
+                Edge(source=ids[i], target=ids[i + 1], edge_type=EdgeType.DEPENDS_ON)
+                for i in range(999)
+            )
+            return g
+        
+        g = benchmark.pedantic(build, rounds=10, warmup_rounds=1)
+        
+        assert g.topological_sort() == ids
+        assert g.depth() == 999
+        _assert_median_under(benchmark, 1.0)
     
-    def test_serialization_performance(self):
+    def test_serialization_performance(self, benchmark):
         """Test serialization performance on a large graph."""
+        ids = _node_ids(1000)
         g = FederatedGraph()
-        
-        # Create a graph with 1000 nodes and ~2000 edges (2 per node on average)
-        for i in range(1000):
-            g.add_node(Node(
-                id=f"pkg:frctl/node-{i}@local",
-                type=NodeType.SERVICE,
-                name=f"node-{i}"
-            ))
+        _add_nodes(g, ids)
         
         # Create edges in a tree-like structure
         for i in range(1, 1000):
             parent = (i - 1) // 2
             g.add_edge(Edge(
-                source=f"pkg:frctl/node-{parent}@local",
-                target=f"pkg:frctl/node-{i}@local",
+                source=ids[parent],
+                target=ids[i],
                 edge_type=EdgeType.DEPENDS_ON
             ))
         
-        # Test serialization
-        start = time.time()
-        data = g.to_dict()
-        serialize_time = time.time() - start
-        
-        assert serialize_time < 2.0, f"Serialization took {serialize_time:.2f}s (should be < 2s)"
+        def roundtrip():
+            return FederatedGraph.from_dict(g.to_dict())
         
-        # Test deserialization
-        start = time.time()
-        g2 = FederatedGraph.from_dict(data)
-        deserialize_time = time.time() - start
+        g2 = benchmark.pedantic(roundtrip, rounds=10, warmup_rounds=1)
         
-        assert deserialize_time < 2.0, f"Deserialization took {deserialize_time:.2f}s (should be < 2s)"
         assert g2.node_count() == 1000
+        assert g2.edge_count() == 999
+        _assert_median_under(benchmark, 2.0)
     
-    def test_merkle_hash_performance(self):
+    def test_merkle_hash_performance(self, benchmark):
         """Test Merkle hash performance on a large graph."""
         g = FederatedGraph()
+        _add_nodes(g, _node_ids(1000))
         
-        for i in range(1000):
-            g.add_node(Node(
-                id=f"pkg:frctl/node-{i}@local",
-                type=NodeType.SERVICE,
-                name=f"node-{i}"
-            ))
-        
-        start = time.time()
-        hash1 = g.merkle_hash()
-        hash_time = time.time() - start
+        hash1 = benchmark.pedantic(g.merkle_hash, rounds=10, warmup_rounds=1)
         
         assert len(hash1) == 64
-        assert hash_time < 2.0, f"Merkle hash took {hash_time:.2f}s (should be < 2s)"
+        _assert_median_under(benchmark, 2.0)
     
-    def test_ancestor_query_performance(self):
+    def test_ancestor_query_performance(self, benchmark):
         """Test ancestor query performance on a deep graph."""
-        g = FederatedGraph()
-        
         # Create a linear graph of depth 100
-        for i in range(100):
-            g.add_node(Node(
-                id=f"pkg:frctl/node-{i}@local",
-                type=NodeType.SERVICE,
-                name=f"node-{i}"
-            ))
-        
-        for i in range(99):
-            g.add_edge(Edge(
-                source=f"pkg:frctl/node-{i}@local",
-                target=f"pkg:frctl/node-{i+1}@local",
-                edge_type=EdgeType.DEPENDS_ON
-            ))
+        ids = _node_ids(100)
+        g = _chain_graph(ids)
         
         # Query ancestors of the last node
-        start = time.time()
-        ancestors = g.get_ancestors("pkg:frctl/node-99@local")
-        query_time = time.time() - start
+        ancestors = benchmark.pedantic(
+            g.get_ancestors, args=(ids[-1],), rounds=100, warmup_rounds=10
+        )
         
-        assert len(ancestors) == 99
-        assert query_time < 0.5, f"Ancestor query took {query_time:.2f}s (should be < 0.5s)"
+        assert ancestors == ids[:-1]
+        _assert_median_under(benchmark, 0.5)
     
-    def test_subgraph_extraction_performance(self):
+    def test_subgraph_extraction_performance(self, benchmark):
         """Test subgraph extraction performance."""
-        g = FederatedGraph()
-        
-        # Create a graph with 1000 nodes
-        for i in range(1000):
-            g.add_node(Node(
-                id=f"pkg:frctl/node-{i}@local",
-                type=NodeType.SERVICE,
-                name=f"node-{i}"
-            ))
-        
-        # Add some edges
-        for i in range(100):
-            g.add_edge(Edge(
-                source=f"pkg:frctl/node-{i}@local",
-                target=f"pkg:frctl/node-{i+1}@local",
-                edge_type=EdgeType.DEPENDS_ON
-            ))
+        # Create a graph with 1000 nodes and some edges
+        ids = _node_ids(1000)
+        g = _chain_graph(ids, edge_count=100)
         
         # Extract subgraph with 100 nodes
-        node_ids = [f"pkg:frctl/node-{i}@local" for i in range(100)]
-        
-        start = time.time()
-        subgraph = g.extract_subgraph(node_ids)
-        extract_time = time.time() - start
+        subgraph = benchmark.pedantic(
+            g.extract_subgraph, args=(ids[:100],), rounds=10, warmup_rounds=1
+        )
         
         assert subgraph.node_count() == 100
-        assert extract_time < 0.5, f"Subgraph extraction took {extract_time:.2f}s (should be < 0.5s)"
+        assert subgraph.edge_count() == 99
+        _assert_median_under(benchmark, 0.5)
 
 
 @pytest.mark.slow
@@ -187,9 +182,10 @@ class TestMemoryEfficiency:
         g = FederatedGraph()
         
         # Add 1000 nodes
-        for i in range(1000):
+        ids = _node_ids(1000)
+        for i, node_id in enumerate(ids):
             g.add_node(Node(
-                id=f"pkg:frctl/node-{i}@local",
+                id=node_id,
                 type=NodeType.SERVICE,
                 name=f"node-{i}",
                 metadata={"index": i, "description": f"Node {i}"}
@@ -288,6 +288,44 @@ class TestFilePersistence:
             assert g2.to_dict() == g1.to_dict()
             assert g2.merkle_hash() == g1.merkle_hash()
     
+    @pytest.mark.parametrize("backend", ["stdlib", "orjson"])
+    def test_roundtrip_each_json_backend(self, monkeypatch, backend, tmp_path):
+        """Test save/load through both the orjson and the stdlib branch."""
+        if backend == "orjson":
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr("frctl.graph.dag.orjson", None)
+        g1 = FederatedGraph()
+        g1.add_node(Node(
+            id="pkg:frctl/a@local",
+            type=NodeType.SERVICE,
+            name="a",
+            metadata={"owner": "équipe", "ports": {8080: "http", 8443: "https"}},
+        ))
+        
+        path = tmp_path / "graph.json"
+        g1.save(path)
+        g2 = FederatedGraph.load(path)
+        
+        assert g2.get_node("pkg:frctl/a@local").metadata == {
+            "owner": "équipe", "ports": {"8080": "http", "8443": "https"}
+        }
+    
+    def test_json_backends_write_same_bytes(self, monkeypatch, tmp_path):
+        """Test that the file format does not depend on orjson being installed."""
+        pytest.importorskip("orjson")
+        g = FederatedGraph()
+        g.metadata["title"] = "Größe ✓"
+        g.add_node(Node(id="pkg:frctl/a@local", type=NodeType.SERVICE, name="a", metadata={1: [1.5, None]}))
+        g.add_node(Node(id="pkg:frctl/b@local", type=NodeType.LIBRARY, name="b"))
+        g.add_edge(Edge(source="pkg:frctl/a@local", target="pkg:frctl/b@local", edge_type=EdgeType.DEPENDS_ON))
+        
+        g.save(tmp_path / "orjson.json")
+        monkeypatch.setattr("frctl.graph.dag.orjson", None)
+        g.save(tmp_path / "stdlib.json")
+        
+        assert (tmp_path / "orjson.json").read_bytes() == (tmp_path / "stdlib.json").read_bytes()
+    
     def test_json_keys_sorted(self):
         """Test that saved JSON has alphabetically sorted keys."""
         g = FederatedGraph()
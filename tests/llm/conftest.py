@@ -0,0 +1,31 @@
+"""Shared fixtures for LLM tests."""
+
+from pathlib import Path
+
+import pytest
+
+from frctl.llm.renderer import PromptRenderer
+
+PROMPTS_DIR = Path(__file__).parents[2] / "frctl" / "llm" / "prompts"
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize ``template_name`` with every bundled template.
+    
+    Templates are discovered from the prompts directory at collection time,
+    so no renderer is built and each template gets its own test ID.
+    """
+    if "template_name" in metafunc.fixturenames:
+        names = sorted(path.stem for path in PROMPTS_DIR.glob("*.j2"))
+        metafunc.parametrize("template_name", names)
+
+
+@pytest.fixture(scope="session")
+def renderer():
+    """One renderer over the bundled prompts, shared by the whole session.
+    
+    Templates are compiled up front so individual tests only hit the cache.
+    """
+    renderer = PromptRenderer()
+    renderer.preload()
+    return renderer
@@ -1,6 +1,8 @@
 """Mock LLM provider for deterministic testing."""
 
 import pytest
+from collections import deque
+
 from frctl.llm.provider import LLMProvider
 
 
@@ -11,18 +13,20 @@ class MockLLMProvider(LLMProvider):
     API calls. It can be configured to return specific responses in sequence.
     """
     
-    def __init__(self, responses=None):
+    def __init__(self, responses=None, history_limit=1024):
         """Initialize mock provider.
         
         Args:
             responses: List of response strings to return in sequence.
                       If None, returns default empty response.
+            history_limit: Number of recent calls kept in all_messages;
+                      older ones are dropped so long loops don't pile up.
         """
         super().__init__(model="mock")
         self.responses = responses or []
         self.call_count = 0
         self.last_messages = None
-        self.all_messages = []
+        self.all_messages = deque(maxlen=history_limit)
         
     def generate(self, messages, **kwargs):
         """Generate a mock response.
@@ -45,9 +49,9 @@ class MockLLMProvider(LLMProvider):
             
         self.call_count += 1
         
-        # Count tokens (simple approximation)
-        prompt_text = " ".join(msg.get("content", "") for msg in messages)
-        prompt_tokens = len(prompt_text.split())
+        # Count tokens (simple approximation); summing per message gives the
+        # same word count as splitting the joined prompt, without building it
+        prompt_tokens = sum(len(msg.get("content", "").split()) for msg in messages)
         completion_tokens = len(content.split())
         
         # Return in same format as real LLMProvider
@@ -73,11 +77,18 @@ class MockLLMProvider(LLMProvider):
         """
         return len(text.split())
     
-    def reset(self):
-        """Reset the mock provider state."""
+    def reset(self, responses=None):
+        """Reset the mock provider state.
+        
+        Args:
+            responses: Optional new response sequence; the current one is
+                      kept (and replayed from the start) if None.
+        """
+        if responses is not None:
+            self.responses = list(responses)
         self.call_count = 0
         self.last_messages = None
-        self.all_messages = []
+        self.all_messages.clear()
 
 
 class TestMockProvider:
@@ -169,6 +180,28 @@ class TestMockProvider:
         assert provider.last_messages is None
         assert len(provider.all_messages) == 0
     
+    def test_reset_with_new_responses(self):
+        """Test that reset can swap in a new response sequence."""
+        provider = MockLLMProvider(responses=['{"old": 1}'])
+        provider.generate([{"role": "user", "content": "test"}])
+        
+        provider.reset(responses=['{"new": 1}'])
+        result = provider.generate([{"role": "user", "content": "test"}])
+        
+        assert result["content"] == '{"new": 1}'
+        assert provider.call_count == 1
+    
+    def test_history_is_bounded(self):
+        """Test that only the most recent calls are kept."""
+        provider = MockLLMProvider(history_limit=2)
+        
+        for i in range(5):
+            provider.generate([{"role": "user", "content": f"prompt {i}"}])
+        
+        assert provider.call_count == 5
+        assert [m[0]["content"] for m in provider.all_messages] == ["prompt 3", "prompt 4"]
+        assert provider.last_messages is provider.all_messages[-1]
+    
     def test_usage_stats(self):
         """Test that usage stats are included."""
         provider = MockLLMProvider(responses=['{"test": "response"}'])
@@ -0,0 +1,58 @@
+"""Tests for the LiteLLM-backed provider."""
+
+import litellm
+
+from frctl.llm import provider as provider_module
+from frctl.llm.provider import LLMProvider
+
+
+class TestCountTokens:
+    """Tests for LLMProvider.count_tokens."""
+    
+    def test_counts_are_memoized(self, monkeypatch):
+        """Test that repeated counts for the same text tokenize only once."""
+        calls = []
+        
+        def fake_counter(model, text):
+            calls.append((model, text))
+            return 7
+        
+        monkeypatch.setattr(litellm, "token_counter", fake_counter)
+        provider = LLMProvider(model="gpt-4", verbose=False)
+        
+        assert provider.count_tokens("same text") == 7
+        assert provider.count_tokens("same text") == 7
+        assert provider.count_tokens("same text", model="gpt-3.5-turbo") == 7
+        
+        assert calls == [("gpt-4", "same text"), ("gpt-3.5-turbo", "same text")]
+    
+    def test_fallback_estimate(self, monkeypatch):
+        """Test the character-based estimate when tokenization fails."""
+        def failing_counter(model, text):
+            raise ValueError("unsupported model")
+        
+        monkeypatch.setattr(litellm, "token_counter", failing_counter)
+        provider = LLMProvider(model="unknown/model", verbose=False)
+        
+        assert provider.count_tokens("x" * 40) == 10
+    
+    def test_cache_is_bounded_per_provider(self, monkeypatch):
+        """Test that each provider keeps a small LRU of counts, not the texts."""
+        calls = []
+        
+        def fake_counter(model, text):
+            calls.append(text)
+            return len(text)
+        
+        monkeypatch.setattr(litellm, "token_counter", fake_counter)
+        monkeypatch.setattr(provider_module, "_TOKEN_COUNT_CACHE_SIZE", 2)
+        provider = LLMProvider(model="gpt-4", verbose=False)
+        
+        for text in ["a", "bb", "a", "ccc", "bb"]:
+            provider.count_tokens(text)
+        LLMProvider(model="gpt-4", verbose=False).count_tokens("a")
+        
+        # "bb" was least recently used when "ccc" arrived, so it is re-counted
+        assert calls == ["a", "bb", "ccc", "bb", "a"]
+        assert len(provider._token_counts) == 2
+        assert all(isinstance(digest, bytes) for _, digest in provider._token_counts)
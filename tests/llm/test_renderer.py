@@ -2,33 +2,54 @@
 
 import pytest
 from pathlib import Path
+from jinja2 import DictLoader
 from frctl.llm.renderer import PromptRenderer, get_renderer
 
 
+def _render_minimal(renderer, template_name):
+    """Render a template with just its required context."""
+    if template_name == "atomicity_check":
+        return renderer.render_atomicity_check(goal_description="test")
+    if template_name == "atomicity_check_batch":
+        return renderer.render_atomicity_check_batch(sibling_goals=[])
+    if template_name == "decompose_goal":
+        return renderer.render_decompose_goal(goal_description="test")
+    if template_name == "infer_dependencies":
+        return renderer.render_infer_dependencies(sibling_goals=[])
+    if template_name == "generate_digest":
+        return renderer.render_generate_digest(goal_description="test", goal_status="COMPLETE")
+    if template_name == "system_base":
+        return renderer.render_system_prompt()
+    return renderer.render(template_name)
+
+
 class TestPromptRenderer:
     """Test suite for PromptRenderer."""
     
-    def test_renderer_initialization(self):
+    def test_renderer_initialization(self, renderer):
         """Test renderer initializes with default template directory."""
-        renderer = PromptRenderer()
         assert renderer.template_dir.exists()
         assert renderer.template_dir.name == "prompts"
     
-    def test_custom_template_directory(self, tmp_path):
-        """Test renderer can use custom template directory."""
-        custom_dir = tmp_path / "custom_templates"
-        custom_dir.mkdir()
+    def test_custom_loader(self):
+        """Test renderer can load templates from a custom Jinja2 loader."""
+        renderer = PromptRenderer(loader=DictLoader({"test.j2": "Hello {{ name }}!"}))
         
-        # Create a test template
-        (custom_dir / "test.j2").write_text("Hello {{ name }}!")
+        assert renderer.render("test", name="World") == "Hello World!"
+        assert renderer.list_templates() == ["test"]
+    
+    def test_preload_fills_cache(self, tmp_path):
+        """Test that preload compiles every template before first render."""
+        (tmp_path / "a.j2").write_text("A {{ x }}")
+        (tmp_path / "b.j2").write_text("B")
+        renderer = PromptRenderer(template_dir=tmp_path)
         
-        renderer = PromptRenderer(template_dir=custom_dir)
-        result = renderer.render("test", name="World")
-        assert result == "Hello World!"
+        assert renderer.preload() == 2
+        assert set(renderer._template_cache) == {"a.j2", "b.j2"}
+        assert renderer.render("a", x=1) == "A 1"
     
-    def test_list_templates(self):
+    def test_list_templates(self, renderer):
         """Test listing available templates."""
-        renderer = PromptRenderer()
         templates = renderer.list_templates()
         
         assert isinstance(templates, list)
@@ -38,18 +59,28 @@ class TestPromptRenderer:
         assert "infer_dependencies" in templates
         assert "generate_digest" in templates
     
-    def test_render_system_prompt(self):
+    def test_list_templates_scans_once(self, tmp_path):
+        """Test that the template listing is cached per renderer."""
+        (tmp_path / "a.j2").write_text("A")
+        renderer = PromptRenderer(template_dir=tmp_path)
+        
+        templates = renderer.list_templates()
+        templates.append("mutated")
+        (tmp_path / "b.j2").write_text("B")
+        
+        assert renderer.list_templates() == ["a"]
+        assert PromptRenderer(template_dir=tmp_path).list_templates() == ["a", "b"]
+    
+    def test_render_system_prompt(self, renderer):
         """Test rendering system prompt."""
-        renderer = PromptRenderer()
         prompt = renderer.render_system_prompt()
         
         assert "Fractal V3" in prompt
         assert "Recursive Decomposition" in prompt
         assert "Context Awareness" in prompt
     
-    def test_render_atomicity_check_minimal(self):
+    def test_render_atomicity_check_minimal(self, renderer):
         """Test rendering atomicity check with minimal context."""
-        renderer = PromptRenderer()
         prompt = renderer.render_atomicity_check(
             goal_description="Add user authentication"
         )
@@ -59,9 +90,8 @@ class TestPromptRenderer:
         assert "composite" in prompt.lower()
         assert "JSON" in prompt
     
-    def test_render_atomicity_check_with_context(self):
+    def test_render_atomicity_check_with_context(self, renderer):
         """Test rendering atomicity check with full context."""
-        renderer = PromptRenderer()
         prompt = renderer.render_atomicity_check(
             goal_description="Add user authentication",
             parent_intent="Build user management system",
@@ -73,9 +103,8 @@ class TestPromptRenderer:
         assert "SaaS platform" in prompt
         assert "Python/FastAPI" in prompt
     
-    def test_render_decompose_goal_minimal(self):
+    def test_render_decompose_goal_minimal(self, renderer):
         """Test rendering decompose goal with minimal context."""
-        renderer = PromptRenderer()
         prompt = renderer.render_decompose_goal(
             goal_description="Build payment processing"
         )
@@ -85,9 +114,8 @@ class TestPromptRenderer:
         assert "2-7" in prompt
         assert "JSON" in prompt
     
-    def test_render_decompose_goal_with_context(self):
+    def test_render_decompose_goal_with_context(self, renderer):
         """Test rendering decompose goal with full context."""
-        renderer = PromptRenderer()
         prompt = renderer.render_decompose_goal(
             goal_description="Build payment processing",
             parent_intent="Create e-commerce platform",
@@ -99,10 +127,8 @@ class TestPromptRenderer:
         assert "Budget: $50k" in prompt
         assert "Timeline: Q1 2024" in prompt
     
-    def test_render_infer_dependencies(self):
+    def test_render_infer_dependencies(self, renderer):
         """Test rendering dependency inference prompt."""
-        renderer = PromptRenderer()
-        
         sibling_goals = [
             {"id": "g1", "description": "Create database schema"},
             {"id": "g2", "description": "Implement API endpoints"},
@@ -123,9 +149,8 @@ class TestPromptRenderer:
         assert "Build user management" in prompt
         assert "dependencies" in prompt.lower()
     
-    def test_render_generate_digest_minimal(self):
+    def test_render_generate_digest_minimal(self, renderer):
         """Test rendering digest generation with minimal info."""
-        renderer = PromptRenderer()
         prompt = renderer.render_generate_digest(
             goal_description="Implement JWT authentication",
             goal_status="COMPLETE"
@@ -136,9 +161,8 @@ class TestPromptRenderer:
         assert "digest" in prompt.lower()
         assert "JSON" in prompt
     
-    def test_render_generate_digest_with_results(self):
+    def test_render_generate_digest_with_results(self, renderer):
         """Test rendering digest generation with full info."""
-        renderer = PromptRenderer()
         prompt = renderer.render_generate_digest(
             goal_description="Implement JWT authentication",
             goal_status="COMPLETE",
@@ -157,10 +181,8 @@ class TestPromptRenderer:
         assert "Token validation" in prompt
         assert "Build secure user authentication" in prompt
     
-    def test_template_caching(self):
+    def test_template_caching(self, renderer):
         """Test that templates are cached after first load."""
-        renderer = PromptRenderer()
-        
         # First render
         prompt1 = renderer.render_system_prompt()
         cache_size_1 = len(renderer._template_cache)
@@ -173,22 +195,18 @@ class TestPromptRenderer:
         assert cache_size_1 == cache_size_2
         assert "system_base.j2" in renderer._template_cache
     
-    def test_template_not_found(self):
+    def test_template_not_found(self, renderer):
         """Test error handling for missing templates."""
-        renderer = PromptRenderer()
-        
         with pytest.raises(Exception):  # TemplateNotFound
             renderer.render("nonexistent_template")
     
-    def test_validate_template_exists(self):
+    def test_validate_template_exists(self, renderer):
         """Test validating existing template."""
-        renderer = PromptRenderer()
         assert renderer.validate_template("system_base") is True
         assert renderer.validate_template("atomicity_check") is True
     
-    def test_validate_template_not_exists(self):
+    def test_validate_template_not_exists(self, renderer):
         """Test validating nonexistent template."""
-        renderer = PromptRenderer()
         assert renderer.validate_template("nonexistent") is False
     
     def test_get_renderer_singleton(self):
@@ -198,19 +216,15 @@ class TestPromptRenderer:
         
         assert renderer1 is renderer2
     
-    def test_render_with_extension(self):
+    def test_render_with_extension(self, renderer):
         """Test that render works with .j2 extension."""
-        renderer = PromptRenderer()
-        
         prompt1 = renderer.render("system_base")
         prompt2 = renderer.render("system_base.j2")
         
         assert prompt1 == prompt2
     
-    def test_jinja2_whitespace_handling(self):
+    def test_jinja2_whitespace_handling(self, renderer):
         """Test that Jinja2 whitespace control works correctly."""
-        renderer = PromptRenderer()
-        
         # Render with optional sections
         prompt = renderer.render_atomicity_check(
             goal_description="Test goal"
@@ -219,30 +233,6 @@ class TestPromptRenderer:
         # Should not have extra blank lines from missing optional sections
         assert "\n\n\n" not in prompt
     
-    def test_all_templates_renderable(self):
-        """Test that all templates can be rendered without errors."""
-        renderer = PromptRenderer()
-        templates = renderer.list_templates()
-        
-        errors = []
-        for template_name in templates:
-            try:
-                # Try rendering with minimal required context
-                if template_name == "atomicity_check":
-                    renderer.render_atomicity_check(goal_description="test")
-                elif template_name == "decompose_goal":
-                    renderer.render_decompose_goal(goal_description="test")
-                elif template_name == "infer_dependencies":
-                    renderer.render_infer_dependencies(sibling_goals=[])
-                elif template_name == "generate_digest":
-                    renderer.render_generate_digest(
-                        goal_description="test", goal_status="COMPLETE"
-                    )
-                elif template_name == "system_base":
-                    renderer.render_system_prompt()
-                else:
-                    renderer.render(template_name)
-            except Exception as e:
-                errors.append(f"{template_name}: {e}")
-        
-        assert not errors, f"Templates failed to render: {errors}"
+    def test_template_renderable(self, renderer, template_name):
+        """Test that each template renders with minimal context."""
+        _render_minimal(renderer, template_name)
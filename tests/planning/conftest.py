@@ -0,0 +1,35 @@
+"""Shared fixtures for planning tests."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from frctl.planning.digest import Digest, DigestMetadata
+
+FROZEN_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def _frozen_digest_clock(monkeypatch):
+    """Give every digest the same created_at so results are deterministic."""
+    monkeypatch.setattr(DigestMetadata, "_clock", staticmethod(lambda: FROZEN_NOW))
+
+
+@pytest.fixture(scope="module")
+def default_metadata():
+    """Typical digest metadata; digests only read it, so one is shared."""
+    return DigestMetadata(
+        original_tokens=500,
+        digest_tokens=100,
+        compression_ratio=0.2,
+        fidelity_estimate=0.95,
+    )
+
+
+@pytest.fixture
+def make_digest(default_metadata):
+    """Factory for digests that use the default metadata unless given one."""
+    def _make(goal_id, summary, **kwargs):
+        kwargs.setdefault("metadata", default_metadata)
+        return Digest(goal_id=goal_id, summary=summary, **kwargs)
+    return _make
@@ -1,22 +1,61 @@
 """Unit tests for atomicity detection."""
 
+import itertools
+
 import pytest
 from frctl.planning.goal import Goal, Plan
 from frctl.planning.engine import PlanningEngine
+from frctl.planning.persistence import PlanStore
 from tests.llm.test_mock_provider import MockLLMProvider
 
 
+LONG_DESCRIPTION = "Do something " * 1000
+UNICODE_GOAL = "创建测试 🎯"
+
+
+@pytest.fixture(scope="class")
+def provider():
+    """One mock provider per test class; tests reset it with their responses."""
+    return MockLLMProvider()
+
+
+@pytest.fixture(scope="class")
+def engine(provider, tmp_path_factory):
+    """Planning engine shared by a test class, kept out of the working tree."""
+    store = PlanStore(base_path=tmp_path_factory.mktemp("plans"))
+    return PlanningEngine(llm_provider=provider, plan_store=store, auto_save=False)
+
+
+@pytest.fixture
+def make_goal(engine):
+    """Factory for bare root goals that skips building a Plan.
+    
+    Only the root context is registered, which is all assess_atomicity needs.
+    """
+    ids = itertools.count()
+    
+    def _make(description):
+        goal = Goal(id=f"goal-{next(ids)}", description=description)
+        engine.context_tree.create_root_context(goal.id)
+        return goal
+    return _make
+
+
+def _messages_contain(provider, needle):
+    """Check whether any message of the last call contains ``needle``."""
+    return any(needle in msg.get("content", "") for msg in provider.last_messages)
+
+
 class TestAtomicityDetection:
     """Tests for LLM-based atomicity detection."""
     
-    def test_detect_atomic_goal(self):
+    def test_detect_atomic_goal(self, engine, provider):
         """Test detecting an atomic goal."""
         # Mock LLM says it's atomic
-        provider = MockLLMProvider(responses=[
+        provider.reset(responses=[
             '{"is_atomic": true, "reasoning": "This is a simple, single-step task"}'
         ])
         
-        engine = PlanningEngine(llm_provider=provider)
         plan = engine.create_plan("Write a unit test")
         goal = plan.get_goal(plan.root_goal_id)
         
@@ -26,38 +65,32 @@ class TestAtomicityDetection:
         assert is_atomic is True
         assert provider.call_count == 1
         # Check that goal description is in one of the messages
-        messages_text = str(provider.last_messages)
-        assert "Write a unit test" in messages_text
+        assert _messages_contain(provider, "Write a unit test")
     
-    def test_detect_composite_goal(self):
+    def test_detect_composite_goal(self, engine, provider, make_goal):
         """Test detecting a composite goal that needs decomposition."""
         # Mock LLM says it's not atomic
-        provider = MockLLMProvider(responses=[
+        provider.reset(responses=[
             '{"is_atomic": false, "reasoning": "This requires multiple steps: design, implement, test"}'
         ])
         
-        engine = PlanningEngine(llm_provider=provider)
-        plan = engine.create_plan("Build a web application")
-        goal = plan.get_goal(plan.root_goal_id)
+        goal = make_goal("Build a web application")
         
         # Assess atomicity
         is_atomic = engine.assess_atomicity(goal)
         
         assert is_atomic is False
         assert provider.call_count == 1
-        messages_text = str(provider.last_messages)
-        assert "Build a web application" in messages_text
+        assert _messages_contain(provider, "Build a web application")
     
-    def test_atomicity_updates_goal_status(self):
+    def test_atomicity_updates_goal_status(self, engine, provider, make_goal):
         """Test that atomicity detection returns correct result."""
         # Atomic goal
-        provider = MockLLMProvider(responses=[
+        provider.reset(responses=[
             '{"is_atomic": true, "reasoning": "Simple task"}'
         ])
         
-        engine = PlanningEngine(llm_provider=provider)
-        plan = engine.create_plan("Run tests")
-        goal = plan.get_goal(plan.root_goal_id)
+        goal = make_goal("Run tests")
         
         # Assess atomicity
         is_atomic = engine.assess_atomicity(goal)
@@ -68,15 +101,13 @@ class TestAtomicityDetection:
         assert hasattr(goal, 'reasoning')
         assert "Simple task" in goal.reasoning
     
-    def test_atomicity_tracks_tokens(self):
+    def test_atomicity_tracks_tokens(self, engine, provider, make_goal):
         """Test that atomicity detection tracks token usage."""
-        provider = MockLLMProvider(responses=[
+        provider.reset(responses=[
             '{"is_atomic": true, "reasoning": "Simple task"}'
         ])
         
-        engine = PlanningEngine(llm_provider=provider)
-        plan = engine.create_plan("Write documentation")
-        goal = plan.get_goal(plan.root_goal_id)
+        goal = make_goal("Write documentation")
         
         # Initially no tokens used
         assert goal.tokens_used == 0
@@ -90,17 +121,13 @@ class TestAtomicityDetection:
 class TestAtomicityEdgeCases:
     """Edge case tests for atomicity detection."""
     
-    def test_very_long_goal_description(self):
+    def test_very_long_goal_description(self, engine, provider, make_goal):
         """Test atomicity with very long description."""
-        long_description = "Do something " * 1000
-        
-        provider = MockLLMProvider(responses=[
+        provider.reset(responses=[
             '{"is_atomic": false, "reasoning": "Complex task"}'
         ])
         
-        engine = PlanningEngine(llm_provider=provider)
-        plan = engine.create_plan(long_description)
-        goal = plan.get_goal(plan.root_goal_id)
+        goal = make_goal(LONG_DESCRIPTION)
         
         # Should handle long descriptions
         is_atomic = engine.assess_atomicity(goal)
@@ -109,18 +136,15 @@ class TestAtomicityEdgeCases:
         # Prompt should include description (truncated if needed)
         assert provider.call_count == 1
     
-    def test_atomicity_unicode_description(self):
+    def test_atomicity_unicode_description(self, engine, provider, make_goal):
         """Test atomicity with unicode characters."""
-        provider = MockLLMProvider(responses=[
+        provider.reset(responses=[
             '{"is_atomic": true, "reasoning": "Simple task"}'
         ])
         
-        engine = PlanningEngine(llm_provider=provider)
-        plan = engine.create_plan("创建测试 🎯")
-        goal = plan.get_goal(plan.root_goal_id)
+        goal = make_goal(UNICODE_GOAL)
         
         # Should handle unicode
         is_atomic = engine.assess_atomicity(goal)
         assert isinstance(is_atomic, bool)
-        messages_text = str(provider.last_messages)
-        assert "创建测试" in messages_text or "🎯" in messages_text
+        assert _messages_contain(provider, "创建测试") or _messages_contain(provider, "🎯")
@@ -29,6 +29,20 @@ class TestDigestMetadata:
         assert metadata.version == 1
         assert isinstance(metadata.created_at, datetime)
     
+    def test_created_at_uses_clock(self, monkeypatch):
+        """Test that created_at comes from the class-level clock."""
+        stamp = datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc)
+        monkeypatch.setattr(DigestMetadata, "_clock", staticmethod(lambda: stamp))
+        
+        metadata = DigestMetadata(
+            original_tokens=1000,
+            digest_tokens=150,
+            compression_ratio=0.15,
+            fidelity_estimate=0.95,
+        )
+        
+        assert metadata.created_at == stamp
+    
     def test_compression_percentage(self):
         """Test compression percentage calculation."""
         metadata = DigestMetadata(
@@ -44,21 +58,13 @@ class TestDigestMetadata:
 class TestDigest:
     """Tests for Digest class."""
     
-    def test_create_digest(self):
+    def test_create_digest(self, make_digest):
         """Test creating a basic digest."""
-        metadata = DigestMetadata(
-            original_tokens=500,
-            digest_tokens=100,
-            compression_ratio=0.2,
-            fidelity_estimate=0.95,
-        )
-        
-        digest = Digest(
-            goal_id="test-goal-1",
-            summary="Implemented authentication with JWT tokens.",
+        digest = make_digest(
+            "test-goal-1",
+            "Implemented authentication with JWT tokens.",
             key_artifacts=["frctl/auth/jwt.py", "tests/auth/test_jwt.py"],
             decisions=["Used PyJWT library", "7-day token expiry"],
-            metadata=metadata,
         )
         
         assert digest.goal_id == "test-goal-1"
@@ -86,22 +92,14 @@ class TestDigest:
         assert len(digest.child_digest_ids) == 3
         assert "child-1" in digest.child_digest_ids
     
-    def test_to_context_string(self):
+    def test_to_context_string(self, make_digest):
         """Test converting digest to context string."""
-        metadata = DigestMetadata(
-            original_tokens=500,
-            digest_tokens=100,
-            compression_ratio=0.2,
-            fidelity_estimate=0.95,
-        )
-        
-        digest = Digest(
-            goal_id="test-goal",
-            summary="Implemented user authentication.",
+        digest = make_digest(
+            "test-goal",
+            "Implemented user authentication.",
             key_artifacts=["auth.py"],
             decisions=["JWT tokens"],
             constraints=["Must use HTTPS"],
-            metadata=metadata,
         )
         
         context_str = digest.to_context_string()
@@ -175,24 +173,11 @@ class TestDigestStore:
         assert len(store.digests) == 0
         assert len(store.archive) == 0
     
-    def test_add_digest(self):
+    def test_add_digest(self, make_digest):
         """Test adding digest to store."""
         store = DigestStore()
         
-        metadata = DigestMetadata(
-            original_tokens=500,
-            digest_tokens=100,
-            compression_ratio=0.2,
-            fidelity_estimate=0.95,
-        )
-        
-        digest = Digest(
-            goal_id="goal-1",
-            summary="First digest.",
-            metadata=metadata,
-        )
-        
-        store.add(digest)
+        store.add(make_digest("goal-1", "First digest."))
         
         assert len(store.digests) == 1
         assert "goal-1" in store.digests
@@ -237,29 +222,29 @@ class TestDigestStore:
         assert len(store.archive["goal-1"]) == 1
         assert store.archive["goal-1"][0].summary == "First version."
     
-    def test_get_digest(self):
-        """Test retrieving digest from store."""
+    def test_bulk_load_skips_archival(self, make_digest):
+        """Test that bulk_load stores digests without archiving."""
         store = DigestStore()
         
-        metadata = DigestMetadata(
-            original_tokens=500,
-            digest_tokens=100,
-            compression_ratio=0.2,
-            fidelity_estimate=0.95,
-        )
-        digest = Digest(goal_id="goal-1", summary="Test.", metadata=metadata)
-        store.add(digest)
+        store.bulk_load([make_digest("goal-1", "Old."), make_digest("goal-2", "Other.")])
+        store.bulk_load([make_digest("goal-1", "New.")])
+        
+        assert len(store.digests) == 2
+        assert store.digests["goal-1"].summary == "New."
+        assert store.archive == {}
+    
+    def test_get_digest(self, make_digest):
+        """Test retrieving digest from store."""
+        store = DigestStore()
+        store.add(make_digest("goal-1", "Test."))
         
-        retrieved = store.get("goal-1")
-        assert retrieved is not None
-        assert retrieved.summary == "Test."
+        assert store.get("goal-1").summary == "Test."
     
     def test_get_missing_digest(self):
         """Test retrieving non-existent digest."""
         store = DigestStore()
         
-        retrieved = store.get("missing")
-        assert retrieved is None
+        assert store.get("missing") is None
     
     def test_get_history(self):
         """Test retrieving digest history."""
@@ -293,23 +278,11 @@ class TestDigestStore:
         history = store.get_history("missing")
         assert len(history) == 0
     
-    def test_get_multiple(self):
+    def test_get_multiple(self, make_digest):
         """Test retrieving multiple digests."""
         store = DigestStore()
         
-        for i in range(5):
-            metadata = DigestMetadata(
-                original_tokens=500,
-                digest_tokens=100,
-                compression_ratio=0.2,
-                fidelity_estimate=0.95,
-            )
-            digest = Digest(
-                goal_id=f"goal-{i}",
-                summary=f"Digest {i}.",
-                metadata=metadata,
-            )
-            store.add(digest)
+        store.bulk_load(make_digest(f"goal-{i}", f"Digest {i}.") for i in range(5))
         
         # Get subset
         retrieved = store.get_multiple(["goal-1", "goal-3", "goal-5", "missing"])
@@ -323,19 +296,19 @@ class TestDigestStore:
         store = DigestStore()
         
         # Add digests with different token counts
-        for i, tokens in enumerate([100, 150, 200]):
-            metadata = DigestMetadata(
-                original_tokens=500,
-                digest_tokens=tokens,
-                compression_ratio=0.2,
-                fidelity_estimate=0.95,
-            )
-            digest = Digest(
+        store.bulk_load(
+            Digest(
                 goal_id=f"goal-{i}",
                 summary=f"Digest {i}.",
-                metadata=metadata,
+                metadata=DigestMetadata(
+                    original_tokens=500,
+                    digest_tokens=tokens,
+                    compression_ratio=0.2,
+                    fidelity_estimate=0.95,
+                ),
             )
-            store.add(digest)
+            for i, tokens in enumerate([100, 150, 200])
+        )
         
         total = store.aggregate_tokens(["goal-0", "goal-1", "goal-2"])
         assert total == 450  # 100 + 150 + 200
@@ -348,9 +321,7 @@ class TestDigestStore:
         store = DigestStore()
         
         stats = store.get_quality_stats()
-        assert stats["avg_compression"] == 0.0
-        assert stats["avg_fidelity"] == 0.0
-        assert stats["total_digests"] == 0
+        assert stats == {"avg_compression": 0.0, "avg_fidelity": 0.0, "total_digests": 0}
     
     def test_get_quality_stats(self):
         """Test quality statistics calculation."""
@@ -360,25 +331,29 @@ class TestDigestStore:
         compressions = [0.1, 0.2, 0.3]
         fidelities = [0.95, 0.90, 0.85]
         
-        for i, (comp, fid) in enumerate(zip(compressions, fidelities)):
-            metadata = DigestMetadata(
-                original_tokens=1000,
-                digest_tokens=int(1000 * comp),
-                compression_ratio=comp,
-                fidelity_estimate=fid,
-            )
-            digest = Digest(
+        store.bulk_load(
+            Digest(
                 goal_id=f"goal-{i}",
                 summary=f"Digest {i}.",
-                metadata=metadata,
+                metadata=DigestMetadata(
+                    original_tokens=1000,
+                    digest_tokens=int(1000 * comp),
+                    compression_ratio=comp,
+                    fidelity_estimate=fid,
+                ),
             )
-            store.add(digest)
+            for i, (comp, fid) in enumerate(zip(compressions, fidelities))
+        )
         
         stats = store.get_quality_stats()
         
-        assert stats["total_digests"] == 3
-        assert abs(stats["avg_compression"] - 0.2) < 0.01  # (0.1 + 0.2 + 0.3) / 3
-        assert abs(stats["avg_fidelity"] - 0.90) < 0.01    # (0.95 + 0.90 + 0.85) / 3
+        # avg_compression = (0.1 + 0.2 + 0.3) / 3, avg_fidelity = (0.95 + 0.90 + 0.85) / 3
+        assert stats == pytest.approx({
+            "avg_compression": 0.2,
+            "avg_fidelity": 0.90,
+            "total_digests": 3,
+            "total_archived": 0,
+        }, abs=0.01)
     
     def test_quality_stats_with_archive(self):
         """Test quality stats include archive count."""
@@ -403,3 +378,44 @@ class TestDigestStore:
         
         assert stats["total_digests"] == 1
         assert stats["total_archived"] == 2  # First two versions archived
+    
+    def test_quality_stats_track_replacements(self):
+        """Test that stats only count the current version of each digest."""
+        def digest(goal_id, compression):
+            return Digest(
+                goal_id=goal_id,
+                summary="Digest.",
+                metadata=DigestMetadata(
+                    original_tokens=1000,
+                    digest_tokens=int(1000 * compression),
+                    compression_ratio=compression,
+                    fidelity_estimate=0.9,
+                ),
+            )
+        
+        store = DigestStore()
+        store.add(digest("goal-1", 0.5))
+        store.add(digest("goal-1", 0.1))
+        store.bulk_load([digest("goal-2", 0.4), digest("goal-2", 0.3)])
+        
+        expected = {
+            "avg_compression": 0.2,
+            "avg_fidelity": 0.9,
+            "total_digests": 2,
+            "total_archived": 1,
+        }
+        assert store.get_quality_stats() == pytest.approx(expected)
+        
+        # A store rebuilt from its fields starts from the same statistics
+        restored = DigestStore.model_validate(store.model_dump())
+        assert restored.get_quality_stats() == pytest.approx(expected)
+        
+        # Direct edits to the public dicts are reflected too
+        del restored.digests["goal-2"]
+        restored.archive.clear()
+        assert restored.get_quality_stats() == pytest.approx({
+            "avg_compression": 0.1,
+            "avg_fidelity": 0.9,
+            "total_digests": 1,
+            "total_archived": 0,
+        })
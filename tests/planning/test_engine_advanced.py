@@ -1,10 +1,14 @@
 """Tests for advanced planning engine features."""
 
+import asyncio
+
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from frctl.planning import PlanningEngine, Goal, GoalStatus, Plan
 from frctl.llm.provider import LLMProvider
+from frctl.llm.renderer import PromptRenderer
+from frctl.planning.engine import _extract_json
 
 
 @pytest.fixture
@@ -76,6 +80,10 @@ class TestDepthFirstTraversal:
     
     def test_depth_first_planning(self, engine, mock_llm):
         """Test depth-first traversal of planning tree."""
+        plan = engine.create_plan("Test goal")
+        # Child IDs are derived from the (random) root goal ID
+        child_1, child_2 = f"{plan.root_goal_id}-1", f"{plan.root_goal_id}-2"
+        
         # Setup mock responses
         mock_llm.generate.side_effect = [
             # First: not atomic, decompose
@@ -96,19 +104,16 @@ class TestDepthFirstTraversal:
                 "content": '''{"dependencies": []}''',
                 "usage": {"total_tokens": 30},
             },
-            # Fourth: subtask 1 is atomic
+            # Fourth: both subtasks assessed atomic in one batch
             {
-                "content": '''{"is_atomic": true, "reasoning": "Leaf"}''',
-                "usage": {"total_tokens": 40},
-            },
-            # Fifth: subtask 2 is atomic
-            {
-                "content": '''{"is_atomic": true, "reasoning": "Leaf"}''',
-                "usage": {"total_tokens": 40},
+                "content": f'''{{"assessments": [
+                    {{"goal_id": "{child_1}", "is_atomic": true, "reasoning": "Leaf"}},
+                    {{"goal_id": "{child_2}", "is_atomic": true, "reasoning": "Leaf"}}
+                ]}}''',
+                "usage": {"total_tokens": 80},
             },
         ]
         
-        plan = engine.create_plan("Test goal")
         engine.plan_depth_first(plan)
         
         # Should have created root + 2 children
@@ -119,10 +124,133 @@ class TestDepthFirstTraversal:
         assert root.status == GoalStatus.COMPLETE
         assert len(root.child_ids) == 2
         
-        # Children should be atomic
+        # Children should be atomic, settled by one batched call
         for child_id in root.child_ids:
             child = plan.get_goal(child_id)
             assert child.status == GoalStatus.ATOMIC
+            assert child.tokens_used == 40
+        assert mock_llm.generate.call_count == 4
+    
+    def test_batch_falls_back_for_missing_goals(self, engine, mock_llm):
+        """Test that goals missing from a batched answer are assessed alone."""
+        mock_llm.generate.side_effect = [
+            {
+                "content": '''{"assessments": [
+                    {"goal_id": "p-1", "is_atomic": false, "reasoning": "Big"}
+                ]}''',
+                "usage": {"total_tokens": 30},
+            },
+            {
+                "content": '''{"is_atomic": true, "reasoning": "Small"}''',
+                "usage": {"total_tokens": 20},
+            },
+        ]
+        
+        plan = engine.create_plan("Parent")
+        parent = plan.get_goal(plan.root_goal_id)
+        children = [
+            Goal(id="p-1", description="First", parent_id=parent.id, depth=1),
+            Goal(id="p-2", description="Second", parent_id=parent.id, depth=1),
+            Goal(id="p-3", description="Third", parent_id=parent.id, depth=engine.max_depth),
+        ]
+        for child in children:
+            engine.context_tree.create_child_context(child.id, parent.id, child.description)
+        
+        results = engine.assess_atomicity_batch(children)
+        
+        assert results == [False, True, True]
+        assert children[0].reasoning == "Big"
+        assert children[1].reasoning == "Small"
+        assert mock_llm.generate.call_count == 2
+    
+    def test_batch_and_single_prompts_agree(self, engine, mock_llm):
+        """Test that each goal gets the same context in batched and single prompts."""
+        # An empty batch answer sends every goal through the single check too
+        mock_llm.generate.return_value = {
+            "content": '{"assessments": []}',
+            "usage": {"total_tokens": 10},
+        }
+        
+        plan = engine.create_plan("Parent")
+        parent = plan.get_goal(plan.root_goal_id)
+        engine.context_tree.set_global_context("project", "frctl")
+        children = [
+            Goal(id="p-1", description="First", parent_id=parent.id, depth=1),
+            Goal(id="p-2", description="Second", parent_id=parent.id, depth=1),
+        ]
+        for child in children:
+            engine.context_tree.create_child_context(child.id, parent.id, f"Intent for {child.id}")
+        
+        renderer = engine.renderer
+        with patch.object(
+            renderer, "render_atomicity_check_batch", wraps=renderer.render_atomicity_check_batch
+        ) as batch, patch.object(
+            renderer, "render_atomicity_check", wraps=renderer.render_atomicity_check
+        ) as single:
+            engine.assess_atomicity_batch(children)
+        
+        batch_kwargs = batch.call_args.kwargs
+        single_kwargs = {call.kwargs["goal_description"]: call.kwargs for call in single.call_args_list}
+        assert [
+            (entry["description"], entry["parent_intent"], batch_kwargs["global_context"])
+            for entry in batch_kwargs["sibling_goals"]
+        ] == [
+            (description, kwargs["parent_intent"], kwargs["global_context"])
+            for description, kwargs in single_kwargs.items()
+        ] == [
+            ("First", "Intent for p-1", "project: frctl"),
+            ("Second", "Intent for p-2", "project: frctl"),
+        ]
+
+
+class TestConcurrentTraversal:
+    """Tests for concurrent expansion of sibling branches."""
+    
+    @staticmethod
+    def _respond(messages):
+        """Answer each prompt type the way a planner LLM would."""
+        prompt = messages[-1]["content"]
+        if "## Sibling Goals" in prompt:
+            content = '{"dependencies": []}'
+        elif "## Goal to Analyze" in prompt:
+            content = '{"is_atomic": %s, "reasoning": "r"}' % (
+                "false" if "Root goal" in prompt else "true"
+            )
+        else:
+            content = '''{"sub_goals": [
+                {"description": "Branch A"},
+                {"description": "Branch B"},
+                {"description": "Branch C"}
+            ], "reasoning": "Split"}'''
+        return {"content": content, "usage": {"total_tokens": 10}}
+    
+    def test_aplan_depth_first(self, engine, mock_llm):
+        """Test that sibling branches are expanded concurrently within the limit."""
+        in_flight = []
+        peak = []
+        
+        async def agenerate(messages, **kwargs):
+            in_flight.append(1)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.pop()
+            return self._respond(messages)
+        
+        mock_llm.agenerate.side_effect = agenerate
+        
+        plan = engine.create_plan("Root goal")
+        asyncio.run(engine.aplan_depth_first(plan, max_concurrency=2))
+        
+        root = plan.get_goal(plan.root_goal_id)
+        assert root.status == GoalStatus.COMPLETE
+        assert len(root.child_ids) == 3
+        for child_id in root.child_ids:
+            assert plan.get_goal(child_id).status == GoalStatus.ATOMIC
+        
+        # root atomicity + decomposition + 3 child checks + dependencies
+        assert mock_llm.agenerate.call_count == 6
+        assert max(peak) == 2
+        mock_llm.generate.assert_not_called()
 
 
 class TestPauseResume:
@@ -227,3 +355,43 @@ class TestPlanningStatus:
         assert status["is_complete"]
         assert not status["can_continue"]
         assert status["next_goal"] is None
+
+
+class TestSystemPrompt:
+    """Tests for the shared system prompt prefix."""
+    
+    def test_system_prompt_rendered_once(self, mock_llm):
+        """Test that every LLM call reuses one rendered system prompt."""
+        renderer = Mock(wraps=PromptRenderer())
+        engine = PlanningEngine(llm_provider=mock_llm, auto_save=False, prompt_renderer=renderer)
+        mock_llm.generate.return_value = {
+            "content": '{"is_atomic": true, "reasoning": "Simple"}',
+            "usage": {"total_tokens": 10},
+        }
+        
+        plan = engine.create_plan("Test")
+        root = plan.get_goal(plan.root_goal_id)
+        engine.assess_atomicity(root)
+        engine.assess_atomicity(root)
+        
+        system_prompts = [
+            call.args[0][0]["content"] for call in mock_llm.generate.call_args_list
+        ]
+        assert len(system_prompts) == 2
+        assert system_prompts[0] is system_prompts[1]
+        assert renderer.render_system_prompt.call_count == 1
+
+
+class TestExtractJson:
+    """Tests for pulling JSON out of LLM responses."""
+    
+    @pytest.mark.parametrize("content, expected", [
+        ('```json\n{"a": 1}\n```', '{"a": 1}'),
+        ('Sure:\n```\n{"a": 1}\n```\nDone', '{"a": 1}'),
+        ('Result: {"a": {"b": 2}} ok', '{"a": {"b": 2}}'),
+        ("no json here", "no json here"),
+        ("} before {", "} before {"),
+    ])
+    def test_extract_json(self, content, expected):
+        """Test fenced, bare and missing JSON objects."""
+        assert _extract_json(content) == expected
@@ -61,7 +61,21 @@ class TestGoal:
         # Don't add duplicates
         goal.add_dependency("dep-1")
         assert goal.dependencies == ["dep-1", "dep-2"]
-
+    
+    def test_ids_are_interned(self):
+        """Test that goal IDs decoded separately share one string object."""
+        parent = Goal.model_validate_json(
+            '{"id": "goal-1", "description": "Parent", "child_ids": ["goal-2"],'
+            ' "graph_node_id": "pkg:app/api@local"}'
+        )
+        child = Goal.model_validate_json(
+            '{"id": "goal-2", "description": "Child", "parent_id": "goal-1",'
+            ' "graph_node_id": "pkg:app/api@local"}'
+        )
+        
+        assert child.parent_id is parent.id
+        assert parent.child_ids[0] is child.id
+        assert child.graph_node_id is parent.graph_node_id
 
 class TestPlan:
     """Test Plan class."""
@@ -92,6 +106,19 @@ class TestPlan:
         assert len(plan.goals) == 3
         assert plan.max_depth == 1
     
+    def test_add_goals_bulk(self):
+        """Test adding several goals in one call."""
+        plan = Plan(id="plan-1", root_goal_id="root")
+        
+        root = Goal(id="root", description="Root", depth=0, tokens_used=10)
+        child = Goal(id="child", description="Child", depth=1, parent_id="root", tokens_used=5)
+        
+        plan.add_goals([root, child])
+        
+        assert set(plan.goals) == {"root", "child"}
+        assert plan.max_depth == 1
+        assert plan.total_tokens == 15
+    
     def test_get_children(self):
         """Test getting children of a goal."""
         plan = Plan(id="plan-1", root_goal_id="root")
@@ -173,3 +200,18 @@ class TestPlan:
         assert stats["max_depth"] == 2
         assert stats["total_tokens"] == 225
         assert stats["is_complete"] == True
+    
+    def test_statistics_incomplete(self):
+        """Test that statistics report open goals as incomplete."""
+        plan = Plan(id="plan-1", root_goal_id="root")
+        plan.add_goals([
+            Goal(id="root", description="Root", status=GoalStatus.DECOMPOSING),
+            Goal(id="atomic-1", description="Atomic 1", depth=1, status=GoalStatus.ATOMIC),
+            Goal(id="pending-1", description="Pending 1", depth=1),
+        ])
+        
+        stats = plan.get_statistics()
+        
+        assert stats["atomic_goals"] == 1
+        assert stats["is_complete"] is False
+        assert stats["is_complete"] == plan.is_complete()
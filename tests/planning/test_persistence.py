@@ -57,6 +57,24 @@ def sample_plan():
     return plan
 
 
+def _binary_tree_plan(n_goals):
+    """Build a plan whose goal i is a child of goal (i - 1) // 2."""
+    plan = Plan(id=f"tree-{n_goals}", root_goal_id="g0")
+    goals = [Goal(id="g0", description="Goal 0", depth=0)]
+    for i in range(1, n_goals):
+        parent = goals[(i - 1) // 2]
+        goals.append(Goal(
+            id=f"g{i}",
+            description=f"Goal {i}",
+            parent_id=parent.id,
+            depth=parent.depth + 1,
+            tokens_used=i,
+        ))
+        parent.add_child(f"g{i}")
+    plan.add_goals(goals)
+    return plan
+
+
 class TestPlanStore:
     """Test PlanStore basic functionality."""
     
@@ -66,6 +84,15 @@ class TestPlanStore:
         assert temp_store.archive_dir.exists()
         assert temp_store.index_file.exists()
     
+    def test_default_base_path_uses_frctl_home(self, tmp_path, monkeypatch):
+        """Test that FRCTL_HOME sets the default plans directory."""
+        monkeypatch.setenv("FRCTL_HOME", str(tmp_path / "home"))
+        
+        store = PlanStore()
+        
+        assert store.base_path == tmp_path / "home" / "plans"
+        assert store.plans_dir.exists()
+    
     def test_save_plan(self, temp_store, sample_plan):
         """Test saving a plan."""
         plan_path = temp_store.save(sample_plan)
@@ -81,6 +108,14 @@ class TestPlanStore:
         assert data['root_goal_id'] == "goal-1"
         assert len(data['goals']) == 3
     
+    def test_save_replaces_file_atomically(self, temp_store, sample_plan):
+        """Test that saving leaves no temporary files behind."""
+        temp_store.save(sample_plan)
+        temp_store.save(sample_plan, create_backup=False)
+        
+        assert list(temp_store.base_path.rglob("*.tmp")) == []
+        assert temp_store.load(sample_plan.id).id == sample_plan.id
+    
     def test_load_plan(self, temp_store, sample_plan):
         """Test loading a plan."""
         temp_store.save(sample_plan)
@@ -193,6 +228,33 @@ class TestPlanIndex:
         plans = temp_store.list_plans()
         assert plans[0]['id'] == "new-plan"  # Most recent first
         assert plans[1]['id'] == "old-plan"
+    
+    def test_list_plans_limit(self, temp_store):
+        """Test that limit keeps only the most recently updated plans."""
+        for i in range(3):
+            plan = Plan(id=f"plan-{i}", root_goal_id=f"g{i}")
+            plan.add_goal(Goal(id=f"g{i}", description=f"Plan {i}", depth=0))
+            temp_store.save(plan)
+        
+        newest = [p['id'] for p in temp_store.list_plans()][:2]
+        
+        assert [p['id'] for p in temp_store.list_plans(limit=2)] == newest
+        assert temp_store.list_plans(status="complete", limit=1) == []
+    
+    def test_batch_defers_index_write(self, temp_store):
+        """Test that saves inside batch() write the index once on exit."""
+        with temp_store.batch():
+            for i in range(3):
+                plan = Plan(id=f"plan-{i}", root_goal_id=f"g{i}")
+                plan.add_goal(Goal(id=f"g{i}", description=f"Plan {i}", depth=0))
+                temp_store.save(plan)
+            temp_store.delete("plan-0", archive=False)
+            
+            assert json.loads(temp_store.index_file.read_text()) == {}
+            assert len(temp_store.list_plans()) == 2
+        
+        index = json.loads(temp_store.index_file.read_text())
+        assert sorted(index) == ["plan-1", "plan-2"]
 
 
 class TestPlanExists:
@@ -300,6 +362,17 @@ class TestPlanExport:
         assert result is True
         assert output_path.exists()
     
+    def test_export_leaves_same_stem_files_alone(self, temp_store, sample_plan, tmp_path):
+        """Test that the temporary file doesn't collide with same-stem files."""
+        temp_store.save(sample_plan)
+        neighbour = tmp_path / "plan.tmp"
+        neighbour.write_text("keep me")
+        
+        assert temp_store.export("test-plan-123", tmp_path / "plan.json") is True
+        
+        assert neighbour.read_text() == "keep me"
+        assert sorted(p.name for p in tmp_path.iterdir() if p.is_file()) == ["plan.json", "plan.tmp"]
+    
     def test_export_nonexistent_plan(self, temp_store, tmp_path):
         """Test exporting a plan that doesn't exist."""
         output_path = tmp_path / "plan.json"
@@ -330,6 +403,19 @@ class TestPlanBackup:
         # Backup should have original status
         assert backup_data['status'] == "in_progress"
     
+    def test_repeated_backups_keep_latest_version(self, temp_store, sample_plan):
+        """Test that the newest backup holds the version replaced last."""
+        temp_store.save(sample_plan, create_backup=False)
+        sample_plan.status = "complete"
+        temp_store.save(sample_plan)
+        sample_plan.status = "failed"
+        temp_store.save(sample_plan)
+        
+        backup_files = sorted(temp_store.plans_dir.glob(".test-plan-123.backup_*.json"))
+        
+        assert json.loads(backup_files[-1].read_text())['status'] == "complete"
+        assert temp_store.load(sample_plan.id).status == "failed"
+    
     def test_save_without_backup(self, temp_store, sample_plan):
         """Test saving without creating backup."""
         temp_store.save(sample_plan, create_backup=False)
@@ -406,3 +492,14 @@ class TestRoundtripSerialization:
         
         loaded_child2 = loaded.get_goal("child2")
         assert "child1" in loaded_child2.dependencies
+    
+    @pytest.mark.parametrize("n_goals", [3, 10, 100], ids=["small", "medium", "large"])
+    def test_tree_roundtrip(self, temp_store, n_goals):
+        """Test that binary goal trees of several sizes survive a save/load cycle."""
+        plan = _binary_tree_plan(n_goals)
+        
+        temp_store.save(plan)
+        loaded = temp_store.load(plan.id)
+        
+        assert loaded.model_dump() == plan.model_dump()
+        assert loaded.get_children("g0") == plan.get_children("g0")
@@ -2,6 +2,7 @@
 import os
 import pytest
 from pathlib import Path
+from frctl import config as config_module
 from frctl.config import (
     FrctlConfig,
     LLMConfig,
@@ -87,6 +88,12 @@ class TestLLMConfig:
         config = LLMConfig(num_retries=-1)
         with pytest.raises(ConfigurationError, match="num_retries"):
             config.validate()
+    
+    def test_unknown_attribute_rejected(self):
+        """Test that misspelled settings fail instead of being silently stored."""
+        config = LLMConfig()
+        with pytest.raises(AttributeError):
+            config.temprature = 0.5
 
 
 class TestPlanningConfig:
@@ -184,6 +191,20 @@ class TestFrctlConfig:
         assert "temperature = 0.8" in content
         assert "max_depth = 15" in content
     
+    def test_save_roundtrip(self, tmp_path, monkeypatch):
+        """Test that a saved config parses back to the same values."""
+        monkeypatch.setattr(Path, "home", lambda: tmp_path / "home")
+        config = FrctlConfig(
+            llm=LLMConfig(model='say "hi"', fallback_models=["gpt-3.5-turbo"], verbose=False),
+            planning=PlanningConfig(auto_decompose=True),
+        )
+        config.save(tmp_path / ".frctl" / "config.toml")
+        
+        loaded = FrctlConfig.load(tmp_path)
+        
+        assert loaded.llm.to_dict() == config.llm.to_dict()
+        assert loaded.planning.to_dict() == config.planning.to_dict()
+    
     def test_merge_config(self):
         """Test configuration merging."""
         base = {
@@ -318,6 +339,36 @@ max_tokens = 3000
         assert config.llm.max_tokens == 3000  # project value
         assert config.llm.num_retries == 3  # default value
 
+    
+    def test_toml_parse_cached_until_file_changes(self, tmp_path, monkeypatch):
+        """Test that config files are re-parsed only after they change."""
+        project_dir = tmp_path / "project"
+        config_file = project_dir / ".frctl" / "config.toml"
+        config_file.parent.mkdir(parents=True)
+        config_file.write_text('[llm]\nmodel = "first"\n')
+        monkeypatch.setattr(Path, "home", lambda: tmp_path / "home")
+        
+        assert FrctlConfig.load(project_dir).llm.model == "first"
+        parsed = config_module._TOML_CACHE[str(config_file)][2]
+        assert FrctlConfig.load(project_dir).llm.model == "first"
+        assert config_module._TOML_CACHE[str(config_file)][2] is parsed
+        
+        config_file.write_text('[llm]\nmodel = "second-model"\n')
+        
+        assert FrctlConfig.load(project_dir).llm.model == "second-model"
+        assert config_module._TOML_CACHE[str(config_file)][2] is not parsed
+    
+    def test_mutating_loaded_config_does_not_leak(self, tmp_path, monkeypatch):
+        """Test that changes to a loaded config don't reach the next load."""
+        config_file = tmp_path / ".frctl" / "config.toml"
+        config_file.parent.mkdir()
+        config_file.write_text('[llm]\nfallback_models = ["a"]\n')
+        monkeypatch.setattr(Path, "home", lambda: tmp_path / "home")
+        
+        FrctlConfig.load(tmp_path).llm.fallback_models.append("b")
+        
+        assert FrctlConfig.load(tmp_path).llm.fallback_models == ["a"]
+
 
 class TestGetConfig:
     """Test get_config helper function."""